@@ -1,17 +1,35 @@
 # External Library imports
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import Response
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from dotenv import load_dotenv
 import os
 
 # Internal library imports
 from src.routers import employees_router, login_router
+from src.core import NEXT_CURSOR_HEADER, APPROXIMATE_TOTAL_HEADER, current_employee_cache
+from src.message_broker_management import async_publisher, close_employee_message_queue, employee_message_queue
+from src.metrics_management import HttpMetricsMiddleware, get_metrics_response, register_statistics
+from src.tracing_management import HttpTracingMiddleware, shutdown_tracing
 
 
 load_dotenv()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Lifespan function to connect the RabbitMQ publisher and start the publish queue, and on shutdown to publish the queued messages, close the publisher and export the buffered spans."""
+    await async_publisher.connect()
+    employee_message_queue.start()
+    yield
+    await close_employee_message_queue()
+    await async_publisher.close()
+    shutdown_tracing()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title="Admin Microservice API",
     description="API for managing employee records in the KEA Cars system. Only accessible to admin users. Supports creation, retrieval, update, deletion, and undeletion of employee accounts."
 )
@@ -21,10 +39,20 @@ CORS_SETTINGS = {
     "allow_credentials": True,
     "allow_methods": ["*"],
     "allow_headers": ["*"],
+    "expose_headers": [NEXT_CURSOR_HEADER, APPROXIMATE_TOTAL_HEADER],
 }
 
 
 app.add_middleware(CORSMiddleware, **CORS_SETTINGS)
+app.add_middleware(HttpMetricsMiddleware)
+app.add_middleware(HttpTracingMiddleware)
+
+register_statistics("current_employee_cache", current_employee_cache.statistics, counters=("hits", "misses"))
+register_statistics(
+    "employee_message_queue",
+    employee_message_queue.statistics,
+    counters=("queued", "coalesced", "published", "failures")
+)
 
 app.include_router(employees_router, tags=["Employees"])
 app.include_router(login_router, tags=["Login"])
@@ -35,6 +63,11 @@ async def favicon():
     return Response(status_code=204)
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return get_metrics_response()
+
+
 if __name__ == "__main__":
     import uvicorn
 
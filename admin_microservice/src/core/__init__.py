@@ -5,4 +5,15 @@ from .security import (
     is_password_pwned,
     is_password_to_short
 )
-from .tokens import TokenPayload, Token
\ No newline at end of file
+from .tokens import TokenPayload, Token
+from .current_employee_cache import CurrentEmployeeCache, current_employee_cache
+
+from .pagination import (
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    APPROXIMATE_TOTAL_HEADER,
+    decode_page_cursor,
+    get_page_size,
+    build_page,
+    set_pagination_headers
+)
\ No newline at end of file
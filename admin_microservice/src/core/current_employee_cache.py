@@ -0,0 +1,183 @@
+# External Library imports
+import os
+import time
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from dotenv import load_dotenv
+from sqlalchemy import event
+from typing import Any, Callable, Dict, Optional
+
+# Internal Library imports
+from src.database_management import Session
+from src.entities import EmployeeEntity
+from src.resources import RoleEnum
+
+load_dotenv()
+
+try:
+    CURRENT_EMPLOYEE_CACHE_TTL_SECONDS = float(os.getenv("CURRENT_EMPLOYEE_CACHE_TTL_SECONDS", 30))
+    CURRENT_EMPLOYEE_CACHE_MAX_ENTRIES = int(os.getenv("CURRENT_EMPLOYEE_CACHE_MAX_ENTRIES", 1024))
+except ValueError:
+    raise ValueError("CURRENT_EMPLOYEE_CACHE_TTL_SECONDS must be a number and "
+                     "CURRENT_EMPLOYEE_CACHE_MAX_ENTRIES must be an integer.")
+
+
+@dataclass(frozen=True)
+class CachedEmployee:
+    """
+    The columns of an employee needed to authorize a request, detached from any session.
+    """
+    id: str
+    email: str
+    first_name: str
+    last_name: str
+    role: RoleEnum
+    is_deleted: bool
+    expires_at: float
+
+    @classmethod
+    def from_entity(cls, employee: EmployeeEntity, expires_at: float) -> "CachedEmployee":
+        return cls(
+            id=employee.id,
+            email=employee.email,
+            first_name=employee.first_name,
+            last_name=employee.last_name,
+            role=employee.role,
+            is_deleted=employee.is_deleted,
+            expires_at=expires_at
+        )
+
+    def as_entity(self) -> EmployeeEntity:
+        """
+        Builds a new transient EmployeeEntity of the cached columns.
+
+        The entity is not attached to any session, so it must only be read from,
+        never added to a session or assigned to a relationship.
+
+        Returns:
+            EmployeeEntity: The transient employee entity.
+        """
+        return EmployeeEntity(
+            id=self.id,
+            email=self.email,
+            first_name=self.first_name,
+            last_name=self.last_name,
+            role=self.role,
+            is_deleted=self.is_deleted
+        )
+
+
+class CurrentEmployeeCache:
+    """
+    A bounded, per-process cache of the employees that authenticated requests are made by.
+
+    Every authenticated request resolves its employee before running any business query,
+    so caching the employee for a short time to live removes one MySQL round trip from every endpoint.
+    Entries are invalidated as soon as a change to the employee is committed, and the time to live
+    only bounds how long a change made by another process can be served.
+
+    The cache is used from the worker threads of the routers, so every access is guarded by a lock.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedEmployee]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on every invalidation, so a load that raced with an update does not cache the old row.
+        self._generation: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get_or_load(
+        self,
+        employee_id: str,
+        load: Callable[[], Optional[EmployeeEntity]]
+    ) -> Optional[EmployeeEntity]:
+        """
+        Returns the cached employee with the given ID, loading it with the callback on a miss.
+
+        Args:
+            employee_id (str): The ID of the employee.
+            load (Callable[[], Optional[EmployeeEntity]]): Loads the employee from the database.
+
+        Returns:
+            Optional[EmployeeEntity]: A transient copy of the cached employee,
+                the loaded employee on a miss, or None if the employee does not exist.
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached_employee = self._entries.get(employee_id)
+            if cached_employee is not None:
+                if now < cached_employee.expires_at:
+                    self._entries.move_to_end(employee_id)
+                    self.hits += 1
+                    return cached_employee.as_entity()
+                del self._entries[employee_id]
+            self.misses += 1
+            generation = self._generation
+
+        employee = load()
+        if employee is None:
+            return None
+
+        cached_employee = CachedEmployee.from_entity(employee, time.monotonic() + self.ttl_seconds)
+        with self._lock:
+            if generation == self._generation:
+                self._entries[employee_id] = cached_employee
+                self._entries.move_to_end(employee_id)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return employee
+
+    def invalidate(self, employee_id: str) -> None:
+        """
+        Removes the employee with the given ID from the cache.
+
+        Args:
+            employee_id (str): The ID of the changed employee.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(employee_id, None)
+
+    def invalidate_on_commit(self, session: Session, employee_id: str) -> None:
+        """
+        Removes the employee with the given ID from the cache once the session is committed.
+
+        Invalidating before the commit would let a concurrent request cache the row as it was.
+
+        Args:
+            session (Session): The database session the employee is changed in.
+            employee_id (str): The ID of the changed employee.
+        """
+        event.listen(session, "after_commit", lambda _: self.invalidate(employee_id), once=True)
+
+    def clear(self) -> None:
+        """
+        Removes every employee from the cache.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Returns a snapshot of the cache statistics.
+
+        Returns:
+            Dict[str, Any]: The number of cached employees, the hits and misses and the hit ratio.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+current_employee_cache = CurrentEmployeeCache(CURRENT_EMPLOYEE_CACHE_TTL_SECONDS, CURRENT_EMPLOYEE_CACHE_MAX_ENTRIES)
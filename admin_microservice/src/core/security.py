@@ -12,6 +12,7 @@ from src.database_management import Session
 from src.entities import EmployeeEntity
 from src.resources import RoleEnum
 from src.core.tokens import TokenPayload
+from src.core.current_employee_cache import current_employee_cache
 from src.logger_tool import log_and_raise_error, logger
 from src.exceptions import (
     IncorrectIdError, 
@@ -34,6 +35,9 @@ def get_current_employee(
     """
     Retrieves the current employee from the database using the provided token payload and checks if it is a valid employee.
 
+    The employee is served from the per-process current employee cache when possible, in which case
+    the returned entity is a transient copy that is not attached to the session.
+
     Args:
         token_payload (TokenPayload): The payload containing the token information, such as the ID for the current employee.
         session (Session): The database session to access employee data.
@@ -71,7 +75,10 @@ def get_current_employee(
         raise TypeError(f"valid_roles must be of type RoleEnum, List[RoleEnum], or None, "
                         f"not {type(valid_roles).__name__}.")
     
-    current_employee = EmployeeRepository(session).get_by_id(token_payload.employee_id)
+    current_employee = current_employee_cache.get_or_load(
+        token_payload.employee_id,
+        load=lambda: EmployeeRepository(session).get_by_id(token_payload.employee_id)
+    )
     
     if current_employee is None:
         raise IncorrectIdError(token_payload.employee_id)
@@ -8,6 +8,8 @@ from sqlalchemy.orm import Session, sessionmaker
 
 # Internal Library imports
 from src.logger_tool import logger
+from src.metrics_management import instrument_engine
+from src.tracing_management import trace_engine
 
 load_dotenv()
 
@@ -24,6 +26,8 @@ def get_engine() -> Engine:
     logger.info(f"Establishing MySQLDB connection to the database: '{DB_NAME}' on host:port '{DB_HOST}:{DB_PORT}' with the user: '{DB_USER}'...")
     connection_string = f'mysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
     engine = create_engine(connection_string, pool_pre_ping=True)
+    instrument_engine(engine)
+    trace_engine(engine)
     return engine
 
 
@@ -32,7 +36,7 @@ def get_mysqldb() -> Generator[Session, None, None]:
     engine = get_engine()
     session = session_local(bind=engine)
     try:
-        logger.info("Creating a new session")
+        logger.debug("Creating a new session")
         yield session
         session.commit()
     except Exception as e:
@@ -40,5 +44,5 @@ def get_mysqldb() -> Generator[Session, None, None]:
         logger.error(f"Error occurred: {e} rolling back the session")
         raise
     finally:
-        logger.info("Closing the session")
+        logger.debug("Closing the session")
         session.close()
\ No newline at end of file
@@ -13,5 +13,6 @@ from .database_errors import (
     AlreadyTakenFieldValueError, 
     UnableToFindIdError, 
     AlreadyDeletedError, 
-    AlreadyUndeletedError
+    AlreadyUndeletedError,
+    InvalidPageCursorError
 )
\ No newline at end of file
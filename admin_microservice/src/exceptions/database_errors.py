@@ -40,3 +40,12 @@ class AlreadyUndeletedError(DatabaseError):
 
     def __str__(self):
         return f"{self.message}"
+
+
+class InvalidPageCursorError(DatabaseError):
+    def __init__(self, cursor: str):
+        self.message = f'The page cursor: {cursor} is not a valid cursor returned by a previous page.'
+        super().__init__(self.message)  # Call the base class constructor
+
+    def __str__(self):
+        return f"{self.message}"
@@ -1,6 +1,7 @@
 # External Library imports
-from typing import Callable
+from typing import Any, Callable
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 
 
 # Internal library imports
@@ -17,14 +18,17 @@ from src.exceptions.database_errors import (
     AlreadyTakenFieldValueError, 
     UnableToFindIdError, 
     AlreadyDeletedError, 
-    AlreadyUndeletedError
+    AlreadyUndeletedError,
+    InvalidPageCursorError
 )
 
 
 
-def handle_http_exception(error_message: str, callback: Callable):
+async def handle_http_exception(error_message: str, callback: Callable[[], Any]) -> Any:
     try:
-        return callback()
+        # Service functions query MySQL and publish to RabbitMQ with blocking calls,
+        # so they run on the thread pool to keep the event loop free.
+        return await run_in_threadpool(callback)
 
     except UnableToFindIdError as e:
         log_error(error_message, e)
@@ -96,6 +100,13 @@ def handle_http_exception(error_message: str, callback: Callable):
             detail=str(f"{error_message}: {e}")
         )
 
+    except InvalidPageCursorError as e:
+        log_error(error_message, e)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(f"{error_message}: {e}")
+        )
+
     except Exception as e:
         log_error(error_message, e)
         # Raise a generic internal server error for the client
@@ -1 +1 @@
-from .logger import logger, log_and_raise_error
\ No newline at end of file
+from .logger import logger, payload_for_log, log_and_raise_error
@@ -1,5 +1,5 @@
 # External Library imports
-from typing import Optional
+
 # Internal Library imports
 from .publishers import (
     EmployeeCreatedPublisher,
@@ -7,44 +7,30 @@ from .publishers import (
     EmployeeDeletedPublisher,
     EmployeeUndeletedPublisher
 )
-from .base_publisher import BaseModel, Union, BaseEntity
-
-
-def publish_employee_created_message(message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
-    employee_created_publisher: Optional[EmployeeCreatedPublisher] = None
-    try:
-        employee_created_publisher = EmployeeCreatedPublisher()
-        employee_created_publisher.publish(message)
-    finally:
-        if employee_created_publisher:
-            employee_created_publisher.close_connection()
-
-def publish_employee_updated_message(message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
-    employee_updated_publisher: Optional[EmployeeUpdatedPublisher] = None
-    try:
-        employee_updated_publisher = EmployeeUpdatedPublisher()
-        employee_updated_publisher.publish(message)
-    finally:
-        if employee_updated_publisher:
-            employee_updated_publisher.close_connection()
-
-def publish_employee_deleted_message(message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
-    employee_deleted_publisher: Optional[EmployeeDeletedPublisher] = None
-    try:
-        employee_deleted_publisher = EmployeeDeletedPublisher()
-        employee_deleted_publisher.publish(message)
-    finally:
-        if employee_deleted_publisher:
-            employee_deleted_publisher.close_connection()
+from .base_publisher import BaseModel, Union, BaseEntity, Session
+from .async_publisher import AsyncPublisher, async_publisher
+from .coalescing_publish_queue import CoalescingPublishQueue, employee_message_queue, close_employee_message_queue
+
+
+# The publishers hold no connection of their own, their messages are queued once the session is committed
+# and published with the async publisher by the background task of the coalescing publish queue.
+employee_created_publisher = EmployeeCreatedPublisher()
+employee_updated_publisher = EmployeeUpdatedPublisher()
+employee_deleted_publisher = EmployeeDeletedPublisher()
+employee_undeleted_publisher = EmployeeUndeletedPublisher()
+
+
+def publish_employee_created_message(session: Session, employee_id: str, message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
+    employee_created_publisher.publish_after_commit(session, employee_id, message)
+
+def publish_employee_updated_message(session: Session, employee_id: str, message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
+    employee_updated_publisher.publish_after_commit(session, employee_id, message)
+
+def publish_employee_deleted_message(session: Session, employee_id: str, message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
+    employee_deleted_publisher.publish_after_commit(session, employee_id, message)
     
-def publish_employee_undeleted_message(message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
-    employee_undeleted_publisher: Optional[EmployeeUndeletedPublisher] = None
-    try:
-        employee_undeleted_publisher = EmployeeUndeletedPublisher()
-        employee_undeleted_publisher.publish(message)
-    finally:
-        if employee_undeleted_publisher:
-            employee_undeleted_publisher.close_connection()
+def publish_employee_undeleted_message(session: Session, employee_id: str, message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
+    employee_undeleted_publisher.publish_after_commit(session, employee_id, message)
 
 
 
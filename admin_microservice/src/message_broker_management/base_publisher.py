@@ -1,53 +1,60 @@
 # External Library imports
 import json
 from pydantic import BaseModel
-from typing import Union, Optional
+from sqlalchemy import event
+from typing import Union, Optional, Literal
 
 # Internal library imports
 from src.logger_tool import logger
 from src.entities import BaseEntity
-from src.message_broker_management.rabbitmq_management import RabbitMQManagement
+from src.database_management import Session
+from src.message_broker_management.coalescing_publish_queue import employee_message_queue
+from src.tracing_management import inject_trace_headers
 
 class BasePublisher():
     def __init__(self,
                  exchange_name: str = "admin_exchange",
-                 exchange_type: str = "fanout",
+                 exchange_type: Literal['direct', 'fanout', 'topic', 'headers'] = "fanout",
                  routing_key: Optional[str] = None
                  ):
-        self.rabbitmq_management = RabbitMQManagement()
-        self.rabbitmq_management.declare_exchange(exchange_name, exchange_type, durable=True)
+        self.exchange_name = exchange_name
+        self.exchange_type = exchange_type
+        self.routing_key = ''
         if routing_key is not None and isinstance(routing_key, str):
-            self.rabbitmq_management.routing_key = routing_key
+            self.routing_key = routing_key
         
     def get_exchange_name(self) -> str:
-        exchange_name = self.rabbitmq_management.exchange_name
-        if exchange_name is None:
-            logger.error("Exchange name is not set.")
-            raise ValueError("The exchange has not been declared yet.")
-        return exchange_name
+        return self.exchange_name
     
     def get_routing_key(self) -> str:
-        return self.rabbitmq_management.routing_key
+        return self.routing_key
     
-    def publish(self, message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
+    def publish_after_commit(self, session: Session, key: str, message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
+        """
+        Queues the message once the session is committed, to be published by the background task
+        of the coalescing publish queue. The message is serialised now, as the committed entities are expired,
+        and the trace context of the request is kept with it. Nothing is published if the session is rolled back.
+        """
+        message = self.to_bytes(message)
+        trace_headers = inject_trace_headers()
+        event.listen(
+            session,
+            "after_commit",
+            lambda _: employee_message_queue.put(key, self.exchange_name, self.exchange_type, self.routing_key, message, trace_headers),
+            once=True
+        )
+    
+    @staticmethod
+    def to_bytes(message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> bytes:
         if isinstance(message, str):
-            message = message.encode()
+            return message.encode()
         elif isinstance(message, (dict, list)):
-            message = json.dumps(message).encode()
+            return json.dumps(message).encode()
         elif isinstance(message, BaseModel):
-            message = message.model_dump_json().encode()
+            return message.model_dump_json().encode()
         elif isinstance(message, BaseEntity):
-            message = message.to_bytes()
+            return message.to_bytes()
         elif not isinstance(message, bytes):
             logger.error(f"Invalid message type: {type(message).__name__}. Expected str, bytes, dict, list, Pydantic BaseModel, or a MySQLAlchemy BaseEntity.")
             raise TypeError("Message must be a string, bytes, a JSON-serializable object, a Pydantic BaseModel instance or a MySQLAlchemy BaseEntity instance.")
-        
-        logger.info(f"Publishing message: {message}...")
-        self.rabbitmq_management.publish_message(message)
-        logger.info(f"Message successfully published to exchange: {self.get_exchange_name()} with routing key: {self.get_routing_key()}.")
-    
-    
-    def close_connection(self) -> None:
-        logger.info(f"Closing connection to the exchange: {self.get_exchange_name()}")
-        self.rabbitmq_management.connection.close()
-        logger.info("Connection closed successfully.")
+        return message
@@ -0,0 +1,253 @@
+# External Library imports
+import os
+import asyncio
+import threading
+from itertools import groupby
+from contextlib import ExitStack
+from collections import OrderedDict
+from dotenv import load_dotenv
+from typing import Any, Dict, FrozenSet, List, Literal, Mapping, Optional
+
+# Internal library imports
+from src.logger_tool import logger
+from src.message_broker_management.async_publisher import async_publisher
+from src.tracing_management import publish_span
+
+
+load_dotenv()
+
+try:
+    PUBLISH_QUEUE_LINGER_SECONDS: float = float(os.getenv('RABBITMQ_PUBLISH_QUEUE_LINGER_SECONDS', 0.05))
+    PUBLISH_QUEUE_RETRY_SECONDS: float = float(os.getenv('RABBITMQ_PUBLISH_QUEUE_RETRY_SECONDS', 5))
+    PUBLISH_QUEUE_MAX_PENDING: int = int(os.getenv('RABBITMQ_PUBLISH_QUEUE_MAX_PENDING', 10000))
+    PUBLISH_QUEUE_SHUTDOWN_TIMEOUT: float = float(os.getenv('RABBITMQ_PUBLISH_QUEUE_SHUTDOWN_TIMEOUT', 10))
+except ValueError:
+    raise ValueError('RABBITMQ_PUBLISH_QUEUE_LINGER_SECONDS, RABBITMQ_PUBLISH_QUEUE_RETRY_SECONDS and '
+                     'RABBITMQ_PUBLISH_QUEUE_SHUTDOWN_TIMEOUT must be numbers and '
+                     'RABBITMQ_PUBLISH_QUEUE_MAX_PENDING must be an integer')
+
+# A pending employee.created or employee.updated message already describes the whole employee,
+# so a later employee.updated message of the same employee only has to replace its body.
+EMPLOYEE_MESSAGE_SUPERSEDES: Mapping[str, FrozenSet[str]] = {
+    "employee.updated": frozenset({"employee.created", "employee.updated"}),
+}
+
+
+class PendingMessage():
+    __slots__ = ("exchange_name", "exchange_type", "routing_key", "body", "trace_headers")
+
+    def __init__(self,
+                 exchange_name: str,
+                 exchange_type: Literal['direct', 'fanout', 'topic', 'headers'],
+                 routing_key: str,
+                 body: bytes,
+                 trace_headers: Optional[Dict[str, Any]]
+                 ) -> None:
+        self.exchange_name = exchange_name
+        self.exchange_type = exchange_type
+        self.routing_key = routing_key
+        self.body = body
+        self.trace_headers = trace_headers
+
+
+class CoalescingPublishQueue():
+    """
+    An in-process queue of messages published by a background task of the event loop instead of in the request.
+
+    Messages are queued per key, such as the ID of the employee they describe, and the messages
+    of one key are published in the order they were queued. A message whose routing key supersedes
+    the last pending message of its key replaces the body of that message instead of being queued,
+    so successive updates of the same employee are published as one message. The task lingers
+    briefly after the first message of a burst, so the updates of a bulk edit can be coalesced.
+
+    The pending messages are taken as one batch and published with the async publisher, which sends
+    them back to back and awaits their publisher confirms together. While the broker blocks the connection
+    through flow control the confirms stop arriving, so the batch waits, and at most `max_pending` keys
+    are pending at once, after which queuing blocks the worker thread of the request until the task has caught up.
+
+    If publishing fails the batch is kept and retried, so the messages confirmed before the failure are
+    published again. The consumers skip changes that are not newer than the employee they have.
+    """
+
+    def __init__(self,
+                 supersedes: Mapping[str, FrozenSet[str]],
+                 linger_seconds: float,
+                 retry_seconds: float,
+                 max_pending: int
+                 ) -> None:
+        self.supersedes = supersedes
+        self.linger_seconds = linger_seconds
+        self.retry_seconds = retry_seconds
+        self.max_pending = max_pending
+        self.queued: int = 0
+        self.coalesced: int = 0
+        self.published: int = 0
+        self.failures: int = 0
+        self._pending: "OrderedDict[str, List[PendingMessage]]" = OrderedDict()
+        # Messages are queued by the worker threads of the requests and taken by the task on the event loop.
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+
+    def start(self) -> None:
+        """Start publishing in a background task. Must be called on the event loop of the application."""
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+            with self._condition:
+                self._stopped = False
+                if self._pending:
+                    self._wake.set()
+            self._task = asyncio.create_task(self._run(), name="coalescing-publish-queue")
+            logger.info("Coalescing publish queue started.")
+
+    def put(self,
+            key: str,
+            exchange_name: str,
+            exchange_type: Literal['direct', 'fanout', 'topic', 'headers'],
+            routing_key: str,
+            body: bytes,
+            trace_headers: Optional[Dict[str, Any]] = None
+            ) -> None:
+        """
+        Queue a message to be published by the background task, can be called from any thread.
+
+        :param str key: The key the message is ordered and coalesced by.
+        :param str exchange_name: The name of the exchange.
+        :param str exchange_type: The type of the exchange.
+        :param str routing_key: The routing key of the message.
+        :param bytes body: The message body.
+        :param dict trace_headers: The trace context the message was queued in, its publish is traced as part of that trace.
+        """
+        with self._condition:
+            messages = self._pending.get(key)
+            if messages:
+                last_message = messages[-1]
+                if (last_message.exchange_name == exchange_name
+                        and last_message.routing_key in self.supersedes.get(routing_key, ())):
+                    # The message is published as part of the trace of the latest change.
+                    last_message.body = body
+                    last_message.trace_headers = trace_headers
+                    self.coalesced += 1
+                    return
+            else:
+                # Waiting on the event loop would stop the task that empties the queue, so only worker threads wait.
+                while (len(self._pending) >= self.max_pending and not self._stopped
+                       and self._task is not None and not self._is_on_event_loop()):
+                    self._condition.wait()
+                messages = self._pending.setdefault(key, [])
+            messages.append(PendingMessage(exchange_name, exchange_type, routing_key, body, trace_headers))
+            self.queued += 1
+        self._notify()
+
+    async def close(self, timeout: float) -> None:
+        """Publish the pending messages, waiting at most `timeout` seconds, and stop the background task."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        task, self._task = self._task, None
+        if task is not None:
+            self._wake.set()
+            try:
+                await asyncio.wait_for(task, timeout)
+            except asyncio.TimeoutError:
+                pass
+        self._loop = None
+        with self._condition:
+            pending = sum(len(messages) for messages in self._pending.values())
+        if pending:
+            logger.error(f'Dropping {pending} unpublished messages after waiting {timeout} seconds on shutdown.')
+        logger.info('Closed the coalescing publish queue.')
+
+    def statistics(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "is_running": self._task is not None,
+                "pending": sum(len(messages) for messages in self._pending.values()),
+                "queued": self.queued,
+                "coalesced": self.coalesced,
+                "published": self.published,
+                "failures": self.failures,
+            }
+
+    def _is_on_event_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _notify(self) -> None:
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._wake.set)
+
+    async def _run(self) -> None:
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            with self._condition:
+                if not self._pending:
+                    if self._stopped:
+                        return
+                    continue
+                stopped = self._stopped
+            if not stopped:
+                # Give the rest of a burst the chance to be coalesced before it is taken.
+                await asyncio.sleep(self.linger_seconds)
+            with self._condition:
+                batch, self._pending = self._pending, OrderedDict()
+                self._condition.notify_all()
+
+            try:
+                await self._publish(batch)
+                continue
+            except asyncio.CancelledError:
+                self._put_back(batch)
+                raise
+            except Exception as e:
+                self._put_back(batch)
+                with self._condition:
+                    self.failures += 1
+                logger.error(f'Failed to publish {sum(len(messages) for messages in batch.values())} messages, '
+                             f'retrying in {self.retry_seconds} seconds: {e}')
+            await asyncio.sleep(self.retry_seconds)
+            self._wake.set()
+
+    def _put_back(self, batch: "OrderedDict[str, List[PendingMessage]]") -> None:
+        with self._condition:
+            # Put the unpublished messages back in front, so every key keeps its order.
+            for key, messages in self._pending.items():
+                batch.setdefault(key, []).extend(messages)
+            self._pending = batch
+
+    async def _publish(self, batch: "OrderedDict[str, List[PendingMessage]]") -> None:
+        messages = [message for key_messages in batch.values() for message in key_messages]
+        # The messages are published in the order of the batch, one publish per run of the same exchange.
+        for (exchange_name, exchange_type), exchange_messages in groupby(messages, lambda message: (message.exchange_name, message.exchange_type)):
+            exchange_messages = list(exchange_messages)
+            with ExitStack() as publish_spans:
+                await async_publisher.publish_batch(exchange_name, exchange_type, [
+                    (
+                        message.routing_key,
+                        message.body,
+                        publish_spans.enter_context(publish_span(message.exchange_name, message.routing_key, message.trace_headers or {}))
+                    )
+                    for message in exchange_messages
+                ])
+            with self._condition:
+                self.published += len(exchange_messages)
+            logger.info(f'{len(exchange_messages)} messages successfully published to exchange: {exchange_name}.')
+
+
+employee_message_queue = CoalescingPublishQueue(
+    EMPLOYEE_MESSAGE_SUPERSEDES,
+    PUBLISH_QUEUE_LINGER_SECONDS,
+    PUBLISH_QUEUE_RETRY_SECONDS,
+    PUBLISH_QUEUE_MAX_PENDING
+)
+
+
+async def close_employee_message_queue() -> None:
+    await employee_message_queue.close(PUBLISH_QUEUE_SHUTDOWN_TIMEOUT)
@@ -0,0 +1,33 @@
+# External Library imports
+from prometheus_client import Counter, Histogram
+
+
+PUBLISH_DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PUBLISH_DURATION = Histogram(
+    "rabbitmq_publish_duration_seconds",
+    "The time from publishing a message until the broker confirmed it.",
+    ["exchange"],
+    buckets=PUBLISH_DURATION_BUCKETS
+)
+PUBLISH_FAILURES = Counter(
+    "rabbitmq_publish_failures",
+    "The messages that could not be published or were rejected by the broker.",
+    ["exchange"]
+)
+
+
+def record_published_message(exchange_name: str, duration_seconds: float, succeeded: bool) -> None:
+    """
+    Observes how long publishing a message took, and counts it if it failed.
+
+    :param exchange_name: The exchange the message was published to.
+    :type exchange_name: str
+    :param duration_seconds: The time from publishing the message until it was confirmed or failed.
+    :type duration_seconds: float
+    :param succeeded: Whether the broker confirmed the message.
+    :type succeeded: bool
+    """
+    PUBLISH_DURATION.labels(exchange_name).observe(duration_seconds)
+    if not succeeded:
+        PUBLISH_FAILURES.labels(exchange_name).inc()
@@ -4,4 +4,5 @@ from .employee_resource import (
     EmployeeUpdateResource, 
     EmployeeReturnResource
 )
-from .login_resource import EmployeeLoginResource
\ No newline at end of file
+from .login_resource import EmployeeLoginResource
+from .page_resource import PageResource
\ No newline at end of file
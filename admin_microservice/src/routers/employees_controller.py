@@ -1,12 +1,12 @@
 # External Library imports
 from uuid import UUID
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Path, Query, Body
+from fastapi import APIRouter, Depends, Path, Query, Body, Response
 
 # Internal library imports
 from src.exceptions import handle_http_exception
 from src.logger_tool import logger
-from src.core import get_current_employee_token, TokenPayload
+from src.core import get_current_employee_token, TokenPayload, MAX_PAGE_SIZE, set_pagination_headers
 from src.services import employees_service as service
 from src.database_management import Session, get_mysqldb
 from src.resources import (
@@ -37,7 +37,10 @@ def get_db():
         Retrieves a list of employees from the MySQL Admin database based on the provided query parameters.
 
         - If no query parameters are provided, the endpoint returns all active employees.
-        - The `limit` query parameter can be used to restrict the number of employees returned.
+        - The employees are returned in pages ordered by creation time, of at most `page_size` employees.
+          When there are more employees, the response has an `X-Next-Cursor` header to give as `after`
+          to retrieve the next page.
+        - The deprecated `limit` query parameter can still be used instead of `page_size`.
         - The `deleted` query parameter allows filtering employees based on their deletion status:
             - `None` (default): Returns only active employees.
             - `True`: Returns only deleted employees.
@@ -49,9 +52,19 @@ def get_db():
     dependencies=[Depends(get_current_employee_token)]
 )
 async def get_employees(
+        response: Response,
         limit: Optional[int] = Query(
             default=None, ge=1,
-            description="""Set a limit for the amount of employees that is returned."""
+            description="""Deprecated, use 'page_size' instead. Set a limit for the amount of employees that is returned.""",
+            deprecated=True
+        ),
+        after: Optional[str] = Query(
+            default=None,
+            description="""The cursor from the 'X-Next-Cursor' header of the previous page, to retrieve the page after it."""
+        ),
+        page_size: Optional[int] = Query(
+            default=None, ge=1, le=MAX_PAGE_SIZE,
+            description=f"""The amount of employees on each page, at most {MAX_PAGE_SIZE} which is also the default."""
         ),
         deleted: Optional[bool] = Query(
             default=None,
@@ -63,15 +76,18 @@ async def get_employees(
         session: Session = Depends(get_db),
         token_payload: TokenPayload = Depends(get_current_employee_token)
 ):
-    return handle_http_exception(
+    page = await handle_http_exception(
         error_message="Failed to get employees from the MySQL Admin database",
         callback=lambda: service.get_all(
             session,
             token_payload,
             employee_limit=limit,
+            after=after,
+            page_size=page_size,
             is_deleted_filter=deleted
         )
     )
+    return set_pagination_headers(response, page)
 
 
 @router.get(
@@ -101,8 +117,8 @@ async def get_employee(
         session: Session = Depends(get_db),
         token_payload: TokenPayload = Depends(get_current_employee_token)
 ):
-    logger.info(f"Token Id: {token_payload.employee_id}")
-    return handle_http_exception(
+    logger.debug("Token Id: %s", token_payload.employee_id)
+    return await handle_http_exception(
         error_message="Failed to get employee from the MySQL Admin database",
         callback=lambda: service.get_by_id(
             session,
@@ -139,7 +155,7 @@ async def create_employee(
         session: Session = Depends(get_db),
         token_payload: TokenPayload = Depends(get_current_employee_token)
 ):
-    return handle_http_exception(
+    return await handle_http_exception(
         error_message="Failed to create employee within the MySQL Admin database",
         callback=lambda: service.create(
             session,
@@ -184,7 +200,7 @@ async def update_employee(
         session: Session = Depends(get_db),
         token_payload: TokenPayload = Depends(get_current_employee_token)
 ):
-    return handle_http_exception(
+    return await handle_http_exception(
         error_message="Failed to update employee within the MySQL Admin database",
         callback=lambda: service.update(
             session,
@@ -225,7 +241,7 @@ async def delete_employee(
         session: Session = Depends(get_db),
         token_payload: TokenPayload = Depends(get_current_employee_token)
 ):
-    return handle_http_exception(
+    return await handle_http_exception(
         error_message="Failed to delete employee within the MySQL Admin database",
         callback=lambda: service.delete(
             session,
@@ -263,7 +279,7 @@ async def undelete_employee(
         session: Session = Depends(get_db),
         token_payload: TokenPayload = Depends(get_current_employee_token)
 ):
-    return handle_http_exception(
+    return await handle_http_exception(
         error_message="Failed to undelete employee within the MySQL Admin database",
         callback=lambda: service.undelete(
             session,
@@ -1,16 +1,21 @@
 # External Library imports
-from typing import List, Optional
+from typing import Optional
 from pydantic import EmailStr
 
 # Internal library imports
 from src.database_management import Session
+from src.entities import EmployeeEntity
 from src.repositories import EmployeeRepository
 from src.core import (
     TokenPayload, 
     get_current_employee, 
+    current_employee_cache,
     is_password_pwned, 
     is_password_to_short,
-    get_password_hash
+    get_password_hash,
+    decode_page_cursor,
+    get_page_size,
+    build_page
 )
 from src.exceptions import (
     AlreadyTakenFieldValueError,
@@ -21,6 +26,7 @@ from src.exceptions import (
     IncorrectRoleError
 )
 from src.resources import (
+    PageResource,
     EmployeeCreateResource, 
     EmployeeUpdateResource, 
     EmployeeReturnResource, 
@@ -38,8 +44,10 @@ def get_all(
     session: Session,
     token: TokenPayload,
     employee_limit: Optional[int] = None,
-    is_deleted_filter: Optional[bool] = None
-) -> List[EmployeeReturnResource]:
+    is_deleted_filter: Optional[bool] = None,
+    after: Optional[str] = None,
+    page_size: Optional[int] = None
+) -> PageResource[EmployeeReturnResource]:
     
     repository = EmployeeRepository(session)
     
@@ -51,13 +59,32 @@ def get_all(
     if not isinstance(is_deleted_filter, bool) and is_deleted_filter is not None:
         raise TypeError(f"is_deleted_filter must be of type bool or None, "
                         f"not {type(is_deleted_filter).__name__}.")
+    if not (isinstance(after, str) or after is None):
+        raise TypeError(f"after must be of type str or None, "
+                        f"not {type(after).__name__}.")
+    if isinstance(page_size, bool) or not (isinstance(page_size, int) or page_size is None):
+        raise TypeError(f"page_size must be of type int or None, "
+                        f"not {type(page_size).__name__}.")
         
     get_current_employee(token, session, current_user_action="get_all employees", valid_roles=RoleEnum.admin)
 
     
-    employees = repository.get_all(limit=employee_limit, deletion_filter=is_deleted_filter)
-    
-    return [employee.as_resource() for employee in employees]
+    after_cursor = decode_page_cursor(after)
+    employees_page_size = get_page_size(page_size, employee_limit)
+    employees = repository.get_all(
+        limit=employees_page_size + 1,
+        deletion_filter=is_deleted_filter,
+        after=after_cursor
+    )
+    
+    is_unfiltered_first_page = after_cursor is None and is_deleted_filter is False
+    return build_page(
+        employees,
+        employees_page_size,
+        as_resource=lambda employee: employee.as_resource(),
+        sort_key=lambda employee: (employee.created_at, employee.id),
+        approximate_total=repository.get_approximate_count(EmployeeEntity) if is_unfiltered_first_page else None
+    )
 
 
 def get_by_id(
@@ -127,7 +154,7 @@ def create(
     
     employee_as_resource = created_employee.as_resource()
     
-    publish_employee_created_message(created_employee)
+    publish_employee_created_message(session, created_employee.id, created_employee)
     
     return employee_as_resource
 
@@ -192,7 +219,8 @@ def update(
     
     employee_as_resource = updated_employee.as_resource()
     
-    publish_employee_updated_message(updated_employee)
+    current_employee_cache.invalidate_on_commit(session, updated_employee.id)
+    publish_employee_updated_message(session, updated_employee.id, updated_employee)
     
     return employee_as_resource
 
@@ -267,7 +295,8 @@ def new_update(
     
     employee_as_resource = updated_employee.as_resource()
     
-    publish_employee_updated_message(updated_employee)
+    current_employee_cache.invalidate_on_commit(session, updated_employee.id)
+    publish_employee_updated_message(session, updated_employee.id, updated_employee)
     
     return employee_as_resource
 
@@ -303,7 +332,8 @@ def delete(
     
     employee_as_resource = deleted_employee.as_resource()
     
-    publish_employee_deleted_message(deleted_employee)
+    current_employee_cache.invalidate_on_commit(session, deleted_employee.id)
+    publish_employee_deleted_message(session, deleted_employee.id, deleted_employee)
     
     return employee_as_resource
 
@@ -335,6 +365,7 @@ def undelete(
     undeleted_employee = repository.undelete(employee_to_undelete)
     employee_as_resource = undeleted_employee.as_resource()
     
-    publish_employee_undeleted_message(undeleted_employee)
+    current_employee_cache.invalidate_on_commit(session, undeleted_employee.id)
+    publish_employee_undeleted_message(session, undeleted_employee.id, undeleted_employee)
     
     return employee_as_resource
\ No newline at end of file
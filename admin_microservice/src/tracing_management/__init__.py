@@ -0,0 +1,5 @@
+from .tracer import tracer, shutdown_tracing
+from .propagation import inject_trace_headers, extract_trace_context
+from .broker_tracing import publish_span
+from .database_tracing import trace_engine
+from .http_tracing import HttpTracingMiddleware
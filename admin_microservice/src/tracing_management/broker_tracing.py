@@ -0,0 +1,32 @@
+# External Library imports
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Mapping, Optional
+from opentelemetry.trace import SpanKind
+
+# Internal library imports
+from src.tracing_management.tracer import tracer
+from src.tracing_management.propagation import inject_trace_headers, extract_trace_context
+
+
+@contextmanager
+def publish_span(exchange_name: str, routing_key: str, parent_headers: Optional[Mapping[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Traces the publish of a message and yields the headers to publish it with, which carry the trace context of the publish.
+
+    :param str exchange_name: The exchange the message is published to.
+    :param str routing_key: The routing key of the message.
+    :param parent_headers: The trace context the message was queued in, if it is published outside of that context.
+    """
+    context = extract_trace_context(parent_headers) if parent_headers is not None else None
+    with tracer.start_as_current_span(
+        f"publish {exchange_name}",
+        context=context,
+        kind=SpanKind.PRODUCER,
+        attributes={
+            "messaging.system": "rabbitmq",
+            "messaging.operation.type": "send",
+            "messaging.destination.name": exchange_name,
+            "messaging.rabbitmq.destination.routing_key": routing_key,
+        }
+    ):
+        yield inject_trace_headers()
@@ -0,0 +1,63 @@
+# External Library imports
+from typing import Any
+from sqlalchemy import Engine, event
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+# Internal library imports
+from src.tracing_management.tracer import tracer
+from src.metrics_management.database_metrics import get_operation
+
+
+# The spans of the statements that are running on a connection, kept in the info of the connection.
+_SPANS_KEY = "tracing_statement_spans"
+# Statements are long for bulk inserts, only their start is needed to recognise them.
+MAX_STATEMENT_LENGTH = 1000
+
+
+def _before_cursor_execute(connection: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    # Only statements of a traced request or message get a span, background polls would each start a trace of their own.
+    if not trace.get_current_span().is_recording():
+        connection.info.setdefault(_SPANS_KEY, []).append(None)
+        return
+    operation = get_operation(statement)
+    database_name = connection.engine.url.database or ""
+    span = tracer.start_span(
+        f"{operation} {database_name}".rstrip(),
+        kind=SpanKind.CLIENT,
+        attributes={
+            "db.system.name": "mysql",
+            "db.namespace": database_name,
+            "db.operation.name": operation,
+            "db.query.text": statement[:MAX_STATEMENT_LENGTH],
+        }
+    )
+    connection.info.setdefault(_SPANS_KEY, []).append(span)
+
+
+def _after_cursor_execute(connection: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    span = connection.info[_SPANS_KEY].pop()
+    if span is not None:
+        span.end()
+
+
+def _handle_error(exception_context: Any) -> None:
+    spans = exception_context.connection.info.get(_SPANS_KEY) if exception_context.connection is not None else None
+    if not spans:
+        return
+    span = spans.pop()
+    if span is not None:
+        span.record_exception(exception_context.original_exception)
+        span.set_status(Status(StatusCode.ERROR, type(exception_context.original_exception).__name__))
+        span.end()
+
+
+def trace_engine(engine: Engine) -> None:
+    """
+    Traces every statement the engine executes within a traced request or message as a span of its own.
+
+    :param Engine engine: The engine to trace.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,11 @@
+# Internal Library imports
+from src.message_broker_management.dead_letter_cli import main
+
+
+# Inspect and re-drive the dead-letter queue of the consumer, for example:
+#   python dlq.py stats
+#   python dlq.py list --limit 10
+#   python dlq.py redrive
+#   python dlq.py purge --yes
+if __name__ == "__main__":
+    main(default_queue_name="auth_microservice_queue")
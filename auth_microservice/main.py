@@ -10,6 +10,9 @@ from dotenv import load_dotenv
 
 # Internal Library imports
 from src.message_broker_management import get_admin_exchange_consumer, start_consumer, stop_consumer
+from src.database_management import open_mongodb_client, close_mongodb_clients, get_pool_statistics
+from src.metrics_management import HttpMetricsMiddleware, get_metrics_response, register_statistics
+from src.tracing_management import HttpTracingMiddleware, shutdown_tracing
 from src.logger_tool import logger
 from src.routers import login_router
 
@@ -19,7 +22,7 @@ load_dotenv()
 async def lifespan_of_consumer(app: FastAPI):
     """Lifespan function to handle startup and shutdown events."""
     # Startup logic
-    
+    open_mongodb_client()  # Open the shared MongoDB client used by the routers
     try:
         consumer = get_admin_exchange_consumer()
         await consumer.connect()  # Connect to RabbitMQ
@@ -42,6 +45,8 @@ async def lifespan_of_consumer(app: FastAPI):
     # Shutdown logic
     if consumer:
         await stop_consumer(consumer)
+    close_mongodb_clients()
+    shutdown_tracing()
     
 
 app = FastAPI(
@@ -57,6 +62,10 @@ CORS_SETTINGS = {
 }
 
 app.add_middleware(CORSMiddleware, **CORS_SETTINGS)
+app.add_middleware(HttpMetricsMiddleware)
+app.add_middleware(HttpTracingMiddleware)
+
+register_statistics("mongodb_pool", get_pool_statistics, counters=("total_checkouts", "failed_checkouts"), label="user")
 
 # Include routers
 app.include_router(
@@ -69,6 +78,11 @@ app.include_router(
 async def favicon():
     return Response(status_code=204)
 
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return get_metrics_response()
+
 if __name__ == "__main__":
     import uvicorn
     
@@ -1,10 +1,21 @@
 import os
+import threading
 from dotenv import load_dotenv
 from contextlib import contextmanager
 from pymongo import MongoClient
 from pymongo.database import Database
-from typing import Generator
+from pymongo.monitoring import (
+    ConnectionPoolListener,
+    ConnectionCreatedEvent,
+    ConnectionClosedEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckedInEvent,
+    ConnectionCheckOutFailedEvent
+)
+from typing import Generator, Dict, Any
 from src.logger_tool import logger
+from src.metrics_management import command_metrics
+from src.tracing_management import command_tracing
 
 # Load environment variables from a .env file
 load_dotenv()
@@ -21,30 +32,143 @@ MONGO_DB_ROOT_USERNAME = os.getenv("MONGO_DB_ROOT_USERNAME")
 MONGO_DB_ROOT_PASSWORD = os.getenv("MONGO_DB_ROOT_PASSWORD")
 MONGO_DB_APPLICATION_USERNAME = os.getenv("MONGO_DB_APPLICATION_USERNAME")
 MONGO_DB_APPLICATION_PASSWORD = os.getenv("MONGO_DB_APPLICATION_PASSWORD")
+try:
+    MONGO_DB_MAX_POOL_SIZE = int(os.getenv("MONGO_DB_MAX_POOL_SIZE", 100))
+    MONGO_DB_MIN_POOL_SIZE = int(os.getenv("MONGO_DB_MIN_POOL_SIZE", 0))
+    MONGO_DB_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGO_DB_WAIT_QUEUE_TIMEOUT_MS", 10000))
+except ValueError:
+    raise ValueError("MONGO_DB_MAX_POOL_SIZE, MONGO_DB_MIN_POOL_SIZE and MONGO_DB_WAIT_QUEUE_TIMEOUT_MS must be integers.")
+
+
+class ConnectionPoolStatistics(ConnectionPoolListener):
+    """Keeps running totals of the connection pool events of a MongoClient, such as how long checkouts wait."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.open_connections: int = 0
+        self.checked_out_connections: int = 0
+        self.total_checkouts: int = 0
+        self.failed_checkouts: int = 0
+        self.total_wait_seconds: float = 0.0
+        self.max_wait_seconds: float = 0.0
+
+    def connection_created(self, event: ConnectionCreatedEvent) -> None:
+        with self._lock:
+            self.open_connections += 1
+
+    def connection_closed(self, event: ConnectionClosedEvent) -> None:
+        with self._lock:
+            self.open_connections -= 1
+
+    def connection_checked_out(self, event: ConnectionCheckedOutEvent) -> None:
+        waited_seconds = getattr(event, "duration", 0.0) or 0.0
+        with self._lock:
+            self.checked_out_connections += 1
+            self.total_checkouts += 1
+            self.total_wait_seconds += waited_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, waited_seconds)
+
+    def connection_checked_in(self, event: ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self.checked_out_connections -= 1
+
+    def connection_check_out_failed(self, event: ConnectionCheckOutFailedEvent) -> None:
+        with self._lock:
+            self.failed_checkouts += 1
+
+    # The remaining pool events are not needed for the statistics.
+    def pool_created(self, event) -> None:
+        pass
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        pass
+
+    def pool_closed(self, event) -> None:
+        pass
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_check_out_started(self, event) -> None:
+        pass
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            average_wait_seconds = self.total_wait_seconds / self.total_checkouts if self.total_checkouts else 0.0
+            return {
+                "max_pool_size": MONGO_DB_MAX_POOL_SIZE,
+                "min_pool_size": MONGO_DB_MIN_POOL_SIZE,
+                "open_connections": self.open_connections,
+                "checked_out_connections": self.checked_out_connections,
+                "total_checkouts": self.total_checkouts,
+                "failed_checkouts": self.failed_checkouts,
+                "average_wait_seconds": round(average_wait_seconds, 6),
+                "max_wait_seconds": round(self.max_wait_seconds, 6),
+            }
+
+
+# One client (and with it one connection pool) per process and per database user.
+_clients: Dict[bool, MongoClient] = {}
+_pool_statistics: Dict[bool, ConnectionPoolStatistics] = {}
+_clients_lock = threading.Lock()
+
+
+def open_mongodb_client(as_administrator: bool = False) -> MongoClient:
+    client = _clients.get(as_administrator)
+    if client is not None:
+        return client
+    with _clients_lock:
+        client = _clients.get(as_administrator)
+        if client is not None:
+            return client
+        logger.info(f"Opening shared MongoDB client with the user: '{MONGO_DB_ROOT_USERNAME if as_administrator else MONGO_DB_APPLICATION_USERNAME}' "
+                    f"with maxPoolSize={MONGO_DB_MAX_POOL_SIZE} and minPoolSize={MONGO_DB_MIN_POOL_SIZE}...")
+        pool_statistics = ConnectionPoolStatistics()
+        client = MongoClient(
+            host=MONGO_DB_HOST,
+            port=MONGO_DB_PORT,
+            username=MONGO_DB_ROOT_USERNAME if as_administrator else MONGO_DB_APPLICATION_USERNAME,
+            password=MONGO_DB_ROOT_PASSWORD if as_administrator else MONGO_DB_APPLICATION_PASSWORD,
+            authSource='admin' if as_administrator else MONGO_DB_NAME,
+            connectTimeoutMS=8000,  # 8 seconds timeout for connection establishment
+            serverSelectionTimeoutMS=8000,  # 8 seconds timeout for server selection
+            maxPoolSize=MONGO_DB_MAX_POOL_SIZE,
+            minPoolSize=MONGO_DB_MIN_POOL_SIZE,
+            waitQueueTimeoutMS=MONGO_DB_WAIT_QUEUE_TIMEOUT_MS,
+            event_listeners=[pool_statistics, command_metrics, command_tracing]
+        )
+        _pool_statistics[as_administrator] = pool_statistics
+        _clients[as_administrator] = client
+        return client
+
+
+def close_mongodb_clients() -> None:
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+        logger.info("Shared MongoDB clients closed.")
+
+
+def get_database(as_administrator: bool = False) -> Database:
+    return open_mongodb_client(as_administrator).get_database(MONGO_DB_NAME)
+
+
+def get_pool_statistics() -> Dict[str, Dict[str, Any]]:
+    return {
+        "administrator" if as_administrator else "application": pool_statistics.as_dict()
+        for as_administrator, pool_statistics in list(_pool_statistics.items())
+    }
 
 
 @contextmanager
 def get_mongodb(as_administrator: bool = False) -> Generator[Database, None, None]:
-    logger.info(f"Establishing MongoDB connection with the user: '{MONGO_DB_ROOT_USERNAME if as_administrator else MONGO_DB_APPLICATION_USERNAME}'...")
-    client = MongoClient(
-        host=MONGO_DB_HOST, 
-        port=MONGO_DB_PORT,
-        username=MONGO_DB_ROOT_USERNAME if as_administrator else MONGO_DB_APPLICATION_USERNAME,
-        password=MONGO_DB_ROOT_PASSWORD if as_administrator else MONGO_DB_APPLICATION_PASSWORD,
-        authSource='admin' if as_administrator else MONGO_DB_NAME,
-        connectTimeoutMS=8000,  # 8 seconds timeout for connection establishment
-        serverSelectionTimeoutMS=8000  # 8 seconds timeout for server selection
-    )
+    # The client is shared by the whole process, so it is not closed when the context exits.
     try:
-        # Attempt to connect to the database
-        db = client.get_database(MONGO_DB_NAME)
-        logger.info(f"Successfully connected to MongoDB at {MONGO_DB_HOST}:{MONGO_DB_PORT}")
-        yield db
+        yield get_database(as_administrator)
     except Exception as e:
-        logger.error(f"Failed to connect to MongoDB: {e}")
+        logger.error(f"Failed to use MongoDB: {e}")
         raise
-    finally:
-        if not as_administrator:
-            client.close()
-            logger.info("MongoDB connection closed.")
-        
\ No newline at end of file
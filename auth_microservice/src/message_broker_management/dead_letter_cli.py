@@ -0,0 +1,140 @@
+# External Library imports
+import sys
+import asyncio
+import argparse
+from typing import List, Optional, Sequence
+from aio_pika import DeliveryMode, Message, connect
+from aio_pika.abc import AbstractChannel, AbstractConnection, AbstractIncomingMessage
+
+# Internal Library imports
+from src.message_broker_management.base_consumer import RABBITMQ_HOST, RABBITMQ_PORT, RABBITMQ_USERNAME, RABBITMQ_PASSWORD
+from src.message_broker_management.retry_topology import (
+    RETRY_POLICY,
+    RETRY_COUNT_HEADER,
+    LAST_ERROR_HEADER,
+    FAILED_AT_HEADER,
+    RetryTopology
+)
+
+# Bodies are cut when listed, so a large message does not flood the terminal.
+MAX_LISTED_BODY_LENGTH = 500
+
+
+async def print_statistics(connection: AbstractConnection, topology: RetryTopology) -> None:
+    queue_names = [topology.queue_name]
+    queue_names += [topology.get_delay_queue_name(delay_ms) for delay_ms in topology.policy.get_delays_ms()]
+    queue_names.append(topology.dead_letter_queue_name)
+    for queue_name in queue_names:
+        # A failed passive declare closes its channel, so every queue is looked up on a channel of its own.
+        async with connection.channel() as channel:
+            try:
+                queue = await channel.declare_queue(queue_name, passive=True)
+            except Exception:
+                print(f"{queue_name}: not declared")
+                continue
+            print(f"{queue_name}: {queue.declaration_result.message_count} messages, "
+                  f"{queue.declaration_result.consumer_count} consumers")
+
+
+async def list_dead_letters(channel: AbstractChannel, topology: RetryTopology, limit: int) -> None:
+    dead_letter_queue = await channel.declare_queue(topology.dead_letter_queue_name, passive=True)
+    print(f"{topology.dead_letter_queue_name}: {dead_letter_queue.declaration_result.message_count} messages")
+    # The messages are fetched unacknowledged and returned to the queue once all of them have been listed,
+    # fetching them one by one and returning each of them would fetch the same message again.
+    fetched: List[AbstractIncomingMessage] = []
+    try:
+        while len(fetched) < limit:
+            message = await dead_letter_queue.get(no_ack=False, fail=False)
+            if message is None:
+                break
+            fetched.append(message)
+            headers = message.headers or {}
+            body = message.body.decode("utf-8", errors="replace")
+            if len(body) > MAX_LISTED_BODY_LENGTH:
+                body = f"{body[:MAX_LISTED_BODY_LENGTH]}..."
+            print(f"--- {len(fetched)}: routing key: {RetryTopology.get_routing_key(message)}, "
+                  f"attempts: {headers.get(RETRY_COUNT_HEADER)}, failed at: {headers.get(FAILED_AT_HEADER)}")
+            print(f"    last error: {headers.get(LAST_ERROR_HEADER)}")
+            print(f"    body: {body}")
+    finally:
+        for message in fetched:
+            await message.nack(requeue=True)
+
+
+async def redrive_dead_letters(channel: AbstractChannel, topology: RetryTopology, limit: Optional[int]) -> None:
+    dead_letter_queue = await channel.declare_queue(topology.dead_letter_queue_name, passive=True)
+    redriven = 0
+    while limit is None or redriven < limit:
+        message = await dead_letter_queue.get(no_ack=False, fail=False)
+        if message is None:
+            break
+        headers = dict(message.headers or {})
+        # A re-driven message gets all its attempts again, the last error is kept for reference.
+        headers[RETRY_COUNT_HEADER] = 0
+        try:
+            await channel.default_exchange.publish(
+                Message(
+                    message.body,
+                    headers=headers,
+                    content_type=message.content_type,
+                    content_encoding=message.content_encoding,
+                    correlation_id=message.correlation_id,
+                    message_id=message.message_id,
+                    timestamp=message.timestamp,
+                    delivery_mode=DeliveryMode.PERSISTENT
+                ),
+                routing_key=topology.queue_name
+            )
+        except Exception:
+            await message.nack(requeue=True)
+            raise
+        await message.ack()
+        redriven += 1
+    print(f"Re-drove {redriven} messages from {topology.dead_letter_queue_name} to {topology.queue_name}.")
+
+
+async def purge_dead_letters(channel: AbstractChannel, topology: RetryTopology) -> None:
+    dead_letter_queue = await channel.declare_queue(topology.dead_letter_queue_name, passive=True)
+    result = await dead_letter_queue.purge()
+    print(f"Purged {result.message_count} messages from {topology.dead_letter_queue_name}.")
+
+
+async def run(arguments: argparse.Namespace) -> None:
+    topology = RetryTopology(arguments.queue, RETRY_POLICY)
+    connection = await connect(
+        host=RABBITMQ_HOST,
+        port=RABBITMQ_PORT,
+        login=RABBITMQ_USERNAME,
+        password=RABBITMQ_PASSWORD,
+    )
+    async with connection:
+        if arguments.command == "stats":
+            await print_statistics(connection, topology)
+            return
+        channel = await connection.channel(publisher_confirms=True)
+        if arguments.command == "list":
+            await list_dead_letters(channel, topology, arguments.limit)
+        elif arguments.command == "redrive":
+            await redrive_dead_letters(channel, topology, arguments.limit)
+        elif arguments.command == "purge":
+            await purge_dead_letters(channel, topology)
+
+
+def main(default_queue_name: str, argv: Optional[Sequence[str]] = None) -> None:
+    """Inspect, re-drive and purge the dead-letter queue of a consumer queue."""
+    parser = argparse.ArgumentParser(description="Inspect and re-drive the dead-letter queue of a consumer.")
+    parser.add_argument("--queue", default=default_queue_name, help=f"The consumer queue (default: {default_queue_name}).")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats", help="Show the number of messages in the queue, its delay queues and its dead-letter queue.")
+    list_parser = commands.add_parser("list", help="Show the dead-lettered messages without removing them.")
+    list_parser.add_argument("--limit", type=int, default=20, help="The maximum number of messages to show (default: 20).")
+    redrive_parser = commands.add_parser("redrive", help="Move the dead-lettered messages back to the queue with fresh attempts.")
+    redrive_parser.add_argument("--limit", type=int, default=None, help="The maximum number of messages to re-drive (default: all).")
+    purge_parser = commands.add_parser("purge", help="Delete all the dead-lettered messages.")
+    purge_parser.add_argument("--yes", action="store_true", help="Confirm deleting the messages.")
+    arguments = parser.parse_args(argv)
+
+    if arguments.command == "purge" and not arguments.yes:
+        print("Refusing to purge the dead-letter queue without --yes.", file=sys.stderr)
+        sys.exit(2)
+    asyncio.run(run(arguments))
@@ -0,0 +1,11 @@
+from .statistics_collector import StatisticsCollector, register_statistics
+from .http_metrics import HttpMetricsMiddleware, get_metrics_response
+from .broker_metrics import (
+    record_consumed_message,
+    record_settled_message,
+    ACKED,
+    RETRIED,
+    DEAD_LETTERED,
+    REQUEUED
+)
+from .database_metrics import command_metrics
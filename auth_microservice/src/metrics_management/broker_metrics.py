@@ -0,0 +1,49 @@
+# External Library imports
+from prometheus_client import Counter, Histogram
+
+
+# How a consumed message was settled.
+ACKED = "acked"
+RETRIED = "retried"
+DEAD_LETTERED = "dead_lettered"
+REQUEUED = "requeued"
+
+MESSAGE_DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+MESSAGES_CONSUMED = Counter(
+    "rabbitmq_messages_consumed",
+    "The messages delivered to the consumer.",
+    ["queue", "routing_key"]
+)
+MESSAGES_SETTLED = Counter(
+    "rabbitmq_messages_settled",
+    "The consumed messages by how they were settled: acked, retried, dead_lettered or requeued.",
+    ["queue", "routing_key", "outcome"]
+)
+MESSAGE_HANDLER_DURATION = Histogram(
+    "rabbitmq_message_handler_duration_seconds",
+    "The time from the delivery of a message until it was settled.",
+    ["queue", "routing_key"],
+    buckets=MESSAGE_DURATION_BUCKETS
+)
+
+
+def record_consumed_message(queue_name: str, routing_key: str) -> None:
+    MESSAGES_CONSUMED.labels(queue_name, routing_key).inc()
+
+
+def record_settled_message(queue_name: str, routing_key: str, outcome: str, duration_seconds: float) -> None:
+    """
+    Counts a settled message and observes how long it took to handle.
+
+    :param queue_name: The queue the message was consumed from.
+    :type queue_name: str
+    :param routing_key: The routing key the message was originally published with.
+    :type routing_key: str
+    :param outcome: How the message was settled, one of ACKED, RETRIED, DEAD_LETTERED or REQUEUED.
+    :type outcome: str
+    :param duration_seconds: The time from the delivery of the message until it was settled.
+    :type duration_seconds: float
+    """
+    MESSAGES_SETTLED.labels(queue_name, routing_key, outcome).inc()
+    MESSAGE_HANDLER_DURATION.labels(queue_name, routing_key).observe(duration_seconds)
@@ -0,0 +1,39 @@
+# External Library imports
+from prometheus_client import Counter, Histogram
+from pymongo.monitoring import CommandListener, CommandStartedEvent, CommandSucceededEvent, CommandFailedEvent
+
+
+DATABASE_DURATION_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+MONGODB_COMMAND_DURATION = Histogram(
+    "mongodb_command_duration_seconds",
+    "The round trip time of the MongoDB commands, such as find, update or insert.",
+    ["command"],
+    buckets=DATABASE_DURATION_BUCKETS
+)
+MONGODB_COMMAND_FAILURES = Counter(
+    "mongodb_command_failures",
+    "The MongoDB commands that failed.",
+    ["command"]
+)
+
+
+class CommandMetricsListener(CommandListener):
+    """
+    Observes the duration of every command of the MongoClient it is given to in `event_listeners`.
+
+    The driver measures the duration itself and hands it to the listener once the command has completed.
+    """
+
+    def started(self, event: CommandStartedEvent) -> None:
+        pass
+
+    def succeeded(self, event: CommandSucceededEvent) -> None:
+        MONGODB_COMMAND_DURATION.labels(event.command_name).observe(event.duration_micros / 1_000_000)
+
+    def failed(self, event: CommandFailedEvent) -> None:
+        MONGODB_COMMAND_DURATION.labels(event.command_name).observe(event.duration_micros / 1_000_000)
+        MONGODB_COMMAND_FAILURES.labels(event.command_name).inc()
+
+
+command_metrics = CommandMetricsListener()
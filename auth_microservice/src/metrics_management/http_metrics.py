@@ -0,0 +1,82 @@
+# External Library imports
+import time
+from fastapi import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram, generate_latest
+
+
+# The route of requests that did not match any route, so unknown paths do not each get a series of their own.
+UNMATCHED_ROUTE = "unmatched"
+
+HTTP_REQUESTS = Counter(
+    "http_requests",
+    "The handled HTTP requests.",
+    ["method", "route", "status_code"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "The time from receiving an HTTP request until its response was sent.",
+    ["method", "route"]
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "The HTTP requests that are being handled.",
+    ["method"]
+)
+
+
+def get_route(scope: Scope) -> str:
+    """The path template of the route that handled the request, such as '/employees/{employee_id}'."""
+    route = scope.get("route")
+    route_path = getattr(route, "path", None)
+    if isinstance(route_path, str):
+        return route_path
+    # Routes of Starlette itself, such as the API docs, have fixed paths.
+    if "endpoint" in scope:
+        return scope.get("path", UNMATCHED_ROUTE)
+    return UNMATCHED_ROUTE
+
+
+class HttpMetricsMiddleware():
+    """
+    Counts the HTTP requests and observes their latency per route and status code.
+
+    A plain ASGI middleware, so the response is streamed through untouched instead of being
+    buffered as by `BaseHTTPMiddleware`. The route is only known once the router has
+    matched the request, so it is read from the scope after the request was handled.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        # A request that raised before a response was started is answered with a 500 by the server.
+        status_code = 500
+
+        async def send_with_status_code(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status_code)
+        finally:
+            duration_seconds = time.perf_counter() - started_at
+            in_progress.dec()
+            route = get_route(scope)
+            HTTP_REQUEST_DURATION.labels(method, route).observe(duration_seconds)
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+
+
+def get_metrics_response() -> Response:
+    """Renders every metric of the process in the Prometheus text format."""
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
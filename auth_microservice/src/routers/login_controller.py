@@ -2,7 +2,7 @@
 from fastapi import APIRouter, Depends, Form
 
 # Internal library imports
-from src.database_management import Database, get_mongodb
+from src.database_management import Database, get_database
 from src.exceptions.error_handler import handle_http_exception
 from src.services import login_service as service
 from src.core import Token
@@ -12,9 +12,8 @@ from src.resources import EmployeeLoginResource
 router: APIRouter = APIRouter()
 
 
-def get_db():
-    with get_mongodb() as database:
-        yield database
+def get_db() -> Database:
+    return get_database()
 
 
 @router.post(
@@ -0,0 +1,58 @@
+# External Library imports
+from contextlib import contextmanager
+from typing import Any, Iterator, Mapping, Optional
+from opentelemetry import trace
+from opentelemetry.trace import Span, SpanKind, Status, StatusCode
+
+# Internal library imports
+from src.tracing_management.tracer import tracer
+from src.tracing_management.propagation import extract_trace_context
+
+
+def start_consume_span(headers: Optional[Mapping[str, Any]], exchange_name: str, queue_name: str, routing_key: str) -> Span:
+    """
+    Starts the span of processing a consumed message, as a child of the publish span whose trace context
+    the headers of the message carry. The span is not made current and must be ended by the caller.
+
+    :param headers: The headers of the message.
+    :param str exchange_name: The exchange the message was published to.
+    :param str queue_name: The queue the message was consumed from.
+    :param str routing_key: The routing key the message was published with.
+    """
+    return tracer.start_span(
+        f"process {queue_name}",
+        context=extract_trace_context(headers),
+        kind=SpanKind.CONSUMER,
+        attributes={
+            "messaging.system": "rabbitmq",
+            "messaging.operation.type": "process",
+            "messaging.destination.name": exchange_name,
+            "messaging.destination.subscription.name": queue_name,
+            "messaging.rabbitmq.destination.routing_key": routing_key,
+        }
+    )
+
+
+@contextmanager
+def consume_span(headers: Optional[Mapping[str, Any]], exchange_name: str, queue_name: str, routing_key: str) -> Iterator[Span]:
+    """
+    Traces the processing of a consumed message with a span that is current until the message is settled,
+    so the database calls of the message belong to its trace.
+    """
+    span = start_consume_span(headers, exchange_name, queue_name, routing_key)
+    with trace.use_span(span, end_on_exit=True):
+        yield span
+
+
+def set_consume_outcome(span: Span, outcome: str, error: Optional[BaseException] = None) -> None:
+    """
+    Records on the span of a consumed message how the message was settled.
+
+    :param Span span: The span of the message.
+    :param str outcome: How the message was settled, such as acked, retried or dead_lettered.
+    :param error: The error the message failed with, if it failed.
+    """
+    span.set_attribute("messaging.rabbitmq.outcome", outcome)
+    if error is not None:
+        span.record_exception(error)
+        span.set_status(Status(StatusCode.ERROR, type(error).__name__))
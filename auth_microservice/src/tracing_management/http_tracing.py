@@ -0,0 +1,57 @@
+# External Library imports
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+# Internal library imports
+from src.tracing_management.tracer import tracer
+from src.tracing_management.propagation import extract_trace_context
+from src.metrics_management.http_metrics import get_route
+
+
+# Scrapes and probes would otherwise make up most of the traces.
+UNTRACED_PATHS = frozenset({"/metrics", "/favicon.ico"})
+
+
+class HttpTracingMiddleware():
+    """
+    Traces every HTTP request as a server span, continuing the trace of the caller if it sent a `traceparent` header.
+
+    The span is the current span while the request is handled, also on the worker threads of
+    the endpoints, so the database calls and published messages of the request belong to its trace.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in UNTRACED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        headers = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]}
+        # A request that raised before a response was started is answered with a 500 by the server.
+        status_code = 500
+
+        async def send_with_status_code(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        with tracer.start_as_current_span(
+            method,
+            context=extract_trace_context(headers),
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": method, "url.path": scope["path"]}
+        ) as span:
+            try:
+                await self.app(scope, receive, send_with_status_code)
+            finally:
+                # The route is only known once the router has matched the request.
+                route = get_route(scope)
+                span.update_name(f"{method} {route}")
+                span.set_attribute("http.route", route)
+                span.set_attribute("http.response.status_code", status_code)
+                if status_code >= 500:
+                    span.set_status(Status(StatusCode.ERROR))
@@ -0,0 +1,64 @@
+# External Library imports
+import os
+from typing import Optional
+from dotenv import load_dotenv
+from opentelemetry import trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+# Internal library imports
+from src.logger_tool import logger
+from src.tracing_management.exporters import OtlpJsonFileSpanExporter, OtlpJsonHttpSpanExporter
+
+
+load_dotenv()
+
+SERVICE_NAME = "auth_microservice"
+
+# "file" for OTLP JSON lines in a local file, "otlp" for an OTLP/HTTP collector, or "none" to only propagate the trace context.
+TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "none").lower()
+TRACING_FILE_PATH = os.getenv("TRACING_FILE_PATH", f"../var/trace/{SERVICE_NAME}.jsonl")
+TRACING_OTLP_ENDPOINT = os.getenv("TRACING_OTLP_ENDPOINT", "http://localhost:4318/v1/traces")
+try:
+    TRACING_SAMPLE_RATIO = float(os.getenv("TRACING_SAMPLE_RATIO", 1.0))
+    TRACING_OTLP_TIMEOUT = float(os.getenv("TRACING_OTLP_TIMEOUT", 10))
+except ValueError:
+    raise ValueError("TRACING_SAMPLE_RATIO and TRACING_OTLP_TIMEOUT must be numbers.")
+
+TRACING_EXPORTERS = ("none", "file", "otlp")
+if TRACING_EXPORTER not in TRACING_EXPORTERS:
+    raise ValueError(f"TRACING_EXPORTER must be one of {', '.join(TRACING_EXPORTERS)}, not: {TRACING_EXPORTER}")
+
+
+def _get_exporter() -> Optional[SpanExporter]:
+    if TRACING_EXPORTER == "file":
+        return OtlpJsonFileSpanExporter(TRACING_FILE_PATH)
+    if TRACING_EXPORTER == "otlp":
+        return OtlpJsonHttpSpanExporter(TRACING_OTLP_ENDPOINT, TRACING_OTLP_TIMEOUT)
+    return None
+
+
+def _configure_tracer_provider() -> TracerProvider:
+    # A trace started by another service keeps its sampling decision, only new traces are sampled by the ratio.
+    tracer_provider = TracerProvider(
+        resource=Resource.create({"service.name": SERVICE_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(TRACING_SAMPLE_RATIO))
+    )
+    exporter = _get_exporter()
+    if exporter is not None:
+        # The spans are exported in batches by a background thread, never in the request.
+        tracer_provider.add_span_processor(BatchSpanProcessor(exporter))
+        logger.info(f"Exporting spans with the {TRACING_EXPORTER} exporter at a sample ratio of {TRACING_SAMPLE_RATIO}.")
+    trace.set_tracer_provider(tracer_provider)
+    return tracer_provider
+
+
+tracer_provider = _configure_tracer_provider()
+tracer = trace.get_tracer(SERVICE_NAME)
+
+
+def shutdown_tracing() -> None:
+    """Export the spans that are still buffered and stop the exporter."""
+    tracer_provider.shutdown()
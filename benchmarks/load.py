@@ -0,0 +1,189 @@
+"""
+Drives a weighted mix of scenarios against an application and measures the latency of every request.
+
+A scenario is one user action, such as browsing the models of a brand or buying a car, and can make
+several requests, each of which is timed by its own name. A fixed amount of workers run scenarios back
+to back, each picking the next one at random by the weights of the mix, so the concurrency is closed:
+a slow service gets fewer requests instead of an ever growing queue of them. The requests of the warm-up
+are not measured, so the caches, pools and lazily created engines of the service are warm.
+"""
+# External Library imports
+import time
+import random
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+from statistics import quantiles
+from typing import Any, Awaitable, Callable, Collection, Dict, List, Optional
+import httpx
+
+
+@dataclass
+class Scenario():
+    name: str
+    weight: float
+    run: Callable[["LoadClient"], Awaitable[None]]
+
+
+@dataclass
+class RequestStatistics():
+    latencies_ms: List[float] = field(default_factory=list)
+    failures: int = 0
+    statuses: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+
+class Recorder():
+    """The latencies and failures of the requests, by the name they were timed as, once measuring has started."""
+
+    def __init__(self) -> None:
+        self.measuring = False
+        self.requests: Dict[str, RequestStatistics] = defaultdict(RequestStatistics)
+        self.scenario_errors: Dict[str, int] = defaultdict(int)
+
+    def record(self, name: str, latency_seconds: float, status: str, succeeded: bool) -> None:
+        if not self.measuring:
+            return
+        statistics = self.requests[name]
+        statistics.latencies_ms.append(latency_seconds * 1000)
+        statistics.statuses[status] += 1
+        if not succeeded:
+            statistics.failures += 1
+
+
+class LoadClient():
+    """An HTTP client of the application that times every request, and the state the scenarios share, such as the created cars."""
+
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder, rng: random.Random, state: Dict[str, Any]) -> None:
+        self.client = client
+        self.recorder = recorder
+        self.random = rng
+        self.state = state
+
+    async def request(self, name: str, method: str, url: str, expected: Collection[int] = (200,), **kwargs: Any) -> httpx.Response:
+        """
+        Send a request and time it as the given name.
+
+        :param str name: The name the request is reported as, such as 'POST /cars'.
+        :param str method: The HTTP method.
+        :param str url: The path and query of the request.
+        :param expected: The status codes that count as a success.
+        """
+        started_at = time.perf_counter()
+        response = await self.client.request(method, url, **kwargs)
+        self.recorder.record(name, time.perf_counter() - started_at, str(response.status_code), response.status_code in expected)
+        return response
+
+    async def timed(self, name: str, operation: Awaitable[str], expected: Collection[str] = ("acked",)) -> str:
+        """Time an operation that is not an HTTP request, such as consuming a message, by the outcome it returns."""
+        started_at = time.perf_counter()
+        outcome = await operation
+        self.recorder.record(name, time.perf_counter() - started_at, outcome, outcome in expected)
+        return outcome
+
+
+async def _work(load_client: LoadClient, scenarios: List[Scenario], stop_at: float) -> None:
+    weights = [scenario.weight for scenario in scenarios]
+    while time.perf_counter() < stop_at:
+        scenario = load_client.random.choices(scenarios, weights)[0]
+        try:
+            await scenario.run(load_client)
+        except Exception as e:
+            if load_client.recorder.measuring:
+                load_client.recorder.scenario_errors[f"{scenario.name}: {type(e).__name__}: {e}"[:200]] += 1
+        # A request served from a cache never suspends over the in-process transport, unlike over a socket,
+        # so yield to let the other workers and the start of the measurement run.
+        await asyncio.sleep(0)
+
+
+async def run_load(client: httpx.AsyncClient,
+                   scenarios: List[Scenario],
+                   concurrency: int,
+                   duration_seconds: float,
+                   warmup_seconds: float,
+                   seed: Optional[int] = None
+                   ) -> Dict[str, Any]:
+    """
+    Run the scenarios with the given amount of concurrent workers and return the report of the measured requests.
+
+    :param httpx.AsyncClient client: The client of the application.
+    :param scenarios: The scenarios of the mix.
+    :param int concurrency: The amount of workers.
+    :param float duration_seconds: How long the requests are measured for, after the warm-up.
+    :param float warmup_seconds: How long the scenarios run before the requests are measured.
+    :param int seed: The seed of the random choices of the workers, for repeatable mixes.
+    """
+    recorder = Recorder()
+    state: Dict[str, Any] = {}
+    started_at = time.perf_counter()
+    measure_from = started_at + warmup_seconds
+    stop_at = measure_from + duration_seconds
+    workers = [
+        asyncio.create_task(_work(LoadClient(client, recorder, random.Random(None if seed is None else seed + index), state), scenarios, stop_at))
+        for index in range(concurrency)
+    ]
+    await asyncio.sleep(max(0.0, measure_from - time.perf_counter()))
+    recorder.measuring = True
+    measured_from = time.perf_counter()
+    await asyncio.gather(*workers)
+    # The last scenarios finish after the stop, and their requests are measured, so the window includes them.
+    return build_report(recorder, time.perf_counter() - measured_from, concurrency)
+
+
+def summarize(latencies_ms: List[float]) -> Dict[str, float]:
+    if not latencies_ms:
+        return {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    if len(latencies_ms) < 2:
+        return {"p50_ms": latencies_ms[0], "p95_ms": latencies_ms[0], "p99_ms": latencies_ms[0], "max_ms": latencies_ms[0]}
+    percentiles = quantiles(latencies_ms, n=100, method="inclusive")
+    return {"p50_ms": percentiles[49], "p95_ms": percentiles[94], "p99_ms": percentiles[98], "max_ms": max(latencies_ms)}
+
+
+def build_report(recorder: Recorder, elapsed_seconds: float, concurrency: int) -> Dict[str, Any]:
+    requests: Dict[str, Dict[str, Any]] = {}
+    all_latencies_ms: List[float] = []
+    failures = 0
+    for name, statistics in sorted(recorder.requests.items()):
+        requests[name] = {
+            "count": len(statistics.latencies_ms),
+            "failures": statistics.failures,
+            "rps": len(statistics.latencies_ms) / elapsed_seconds,
+            "statuses": dict(statistics.statuses),
+            **summarize(statistics.latencies_ms),
+        }
+        all_latencies_ms.extend(statistics.latencies_ms)
+        failures += statistics.failures
+    return {
+        "elapsed_seconds": elapsed_seconds,
+        "concurrency": concurrency,
+        "requests": requests,
+        "total": {
+            "count": len(all_latencies_ms),
+            "failures": failures,
+            "rps": len(all_latencies_ms) / elapsed_seconds,
+            **summarize(all_latencies_ms),
+        },
+        "scenario_errors": dict(recorder.scenario_errors),
+    }
+
+
+def format_report(service_name: str, report: Dict[str, Any]) -> str:
+    """The report as a table of the requests, followed by the failed statuses and the errors of the scenarios."""
+    lines = [
+        f"{service_name}: {report['total']['count']} requests in {report['elapsed_seconds']:.1f} s "
+        f"with {report['concurrency']} concurrent workers",
+        f"  {'request':<36} {'count':>7} {'fail':>5} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}",
+    ]
+    rows = list(report["requests"].items()) + [("total", report["total"])]
+    for name, statistics in rows:
+        lines.append(
+            f"  {name:<36} {statistics['count']:>7} {statistics['failures']:>5} {statistics['rps']:>8.1f} "
+            f"{statistics['p50_ms']:>9.2f} {statistics['p95_ms']:>9.2f} {statistics['p99_ms']:>9.2f} {statistics['max_ms']:>9.2f}"
+        )
+    for name, statistics in report["requests"].items():
+        if statistics["failures"]:
+            lines.append(f"  {name} statuses: {statistics['statuses']}")
+    for error, count in report["scenario_errors"].items():
+        lines.append(f"  error x{count}: {error}")
+    for name, value in report.get("service_statistics", {}).items():
+        lines.append(f"  {name}: {value}")
+    return "\n".join(lines)
@@ -0,0 +1,83 @@
+"""
+Benchmarks the microservices one after the other against local stand-ins of MySQL, MongoDB and RabbitMQ,
+and prints the latencies and throughput of every request of their workloads.
+
+Each service is benchmarked by `run_service.py` in a process of its own, as every service has a package named `src`.
+
+Usage:
+    python benchmarks/run.py
+    python benchmarks/run.py customer employee --duration 60 --concurrency 32 --report-file report.json
+"""
+# External Library imports
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Internal library imports
+from load import format_report
+from run_service import SERVICES, add_load_arguments
+
+
+BENCHMARKS_DIRECTORY = Path(__file__).resolve().parent
+
+
+def parse_arguments(arguments: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("services", nargs="*", metavar="service",
+                        help=f"The services to benchmark, of: {', '.join(SERVICES)}. Defaults to all of them.")
+    add_load_arguments(parser)
+    parser.add_argument("--report-file", default=None, help="Write the reports of the services as JSON to this file.")
+    parsed_arguments = parser.parse_args(arguments)
+    unknown_services = [service for service in parsed_arguments.services if service not in SERVICES]
+    if unknown_services:
+        parser.error(f"unknown services: {', '.join(unknown_services)}, choose from: {', '.join(SERVICES)}")
+    parsed_arguments.services = parsed_arguments.services or list(SERVICES)
+    return parsed_arguments
+
+
+def load_arguments(arguments: argparse.Namespace) -> List[str]:
+    forwarded = ["--duration", str(arguments.duration), "--warmup", str(arguments.warmup), "--concurrency", str(arguments.concurrency)]
+    for name in ("seed", "sql_url", "mongo_url"):
+        value = getattr(arguments, name)
+        if value is not None:
+            forwarded += [f"--{name.replace('_', '-')}", str(value)]
+    return forwarded
+
+
+def benchmark_service(service: str, arguments: argparse.Namespace) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="kea-cars-benchmark-") as directory:
+        report_file = os.path.join(directory, f"{service}.json")
+        # The output of the service, such as its logs, is passed on to the standard error, the report is read from the file.
+        completed = subprocess.run(
+            [sys.executable, str(BENCHMARKS_DIRECTORY / "run_service.py"), service, *load_arguments(arguments), "--report-file", report_file],
+            stdout=sys.stderr,
+        )
+        if completed.returncode != 0 or not os.path.exists(report_file):
+            return {"error": f"The benchmark exited with the code {completed.returncode}."}
+        with open(report_file, encoding="utf-8") as file:
+            return json.load(file)
+
+
+def main(arguments: List[str]) -> int:
+    arguments = parse_arguments(arguments)
+    reports: Dict[str, Dict[str, Any]] = {}
+    for service in arguments.services:
+        print(f"Benchmarking the {service} microservice for {arguments.warmup + arguments.duration:g} seconds...", file=sys.stderr, flush=True)
+        reports[service] = benchmark_service(service, arguments)
+
+    for service, report in reports.items():
+        print(f"{service}: {report['error']}" if "error" in report else format_report(service, report))
+        print()
+    if arguments.report_file is not None:
+        with open(arguments.report_file, "w", encoding="utf-8") as file:
+            json.dump(reports, file, indent=2, default=str)
+    return 1 if any("error" in report for report in reports.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
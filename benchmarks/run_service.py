@@ -0,0 +1,103 @@
+"""
+Benchmarks one microservice in this process against local stand-ins of MySQL, MongoDB and RabbitMQ.
+
+The FastAPI application of the service is imported from its directory and started with its own lifespan,
+so its pools, consumers, publishers, caches and middlewares all run, and the requests are sent to it
+in-process through the ASGI transport of httpx, without a network or a server in between.
+
+Every service has a package named `src`, so only one service can be imported per process,
+`run.py` benchmarks several services by running this script once per service.
+
+Usage:
+    python benchmarks/run_service.py employee --duration 30 --concurrency 16
+"""
+# External Library imports
+import os
+import sys
+import json
+import asyncio
+import argparse
+import importlib
+from types import ModuleType
+from typing import Any, Dict, List
+import httpx
+
+# Internal library imports
+from load import Scenario, run_load, format_report
+from standins import StandIns, InMemoryBroker, MongoStandIn, SqlStandIn, install_broker
+from workloads.common import REPOSITORY_ROOT
+
+
+SERVICES = ("admin", "auth", "customer", "employee")
+# Read by the services when they are imported, the variables of the environment take precedence.
+ENVIRONMENT = {
+    "SECRET_KEY": "kea-cars-benchmark-secret-key-for-hs256",
+    "LOG_LEVEL": "ERROR",
+    "TRACING_EXPORTER": "none",
+    "RABBITMQ_HOST": "in-memory-broker",
+    "MYSQL_DB_NAME": "kea_cars_benchmark",
+    "MONGO_DB_NAME": "kea_cars_benchmark",
+}
+
+
+def parse_arguments(arguments: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("service", choices=SERVICES)
+    add_load_arguments(parser)
+    parser.add_argument("--report-file", default=None, help="Write the report as JSON to this file, besides printing it.")
+    return parser.parse_args(arguments)
+
+
+def add_load_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--duration", type=float, default=20, help="Seconds the requests are measured for. Defaults to 20.")
+    parser.add_argument("--warmup", type=float, default=3, help="Seconds the scenarios run before they are measured. Defaults to 3.")
+    parser.add_argument("--concurrency", type=int, default=16, help="The amount of concurrent workers. Defaults to 16.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the random mix, for repeatable runs.")
+    parser.add_argument("--sql-url", default=None,
+                        help="SQLAlchemy URL of a throwaway MySQL database to use instead of SQLite. Its tables are dropped.")
+    parser.add_argument("--mongo-url", default=None,
+                        help="URL of a throwaway MongoDB server to use instead of mongomock. The seeded collections are emptied.")
+
+
+async def benchmark(app: Any, workload: ModuleType, scenarios: List[Scenario], arguments: argparse.Namespace) -> Dict[str, Any]:
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as client:
+            report = await run_load(client, scenarios, arguments.concurrency, arguments.duration, arguments.warmup, arguments.seed)
+        # Collected before the lifespan ends, as the service closes its pools and caches when it shuts down.
+        report["service_statistics"] = workload.statistics() if hasattr(workload, "statistics") else {}
+        return report
+
+
+def main(arguments: List[str]) -> None:
+    arguments = parse_arguments(arguments)
+    workload = importlib.import_module(f"workloads.{arguments.service}")
+    for name, value in {**ENVIRONMENT, **getattr(workload, "ENVIRONMENT", {})}.items():
+        os.environ.setdefault(name, value)
+
+    # The services are run from their own directory, which is where their `src` package and `.env` file are.
+    service_directory = REPOSITORY_ROOT / workload.SERVICE_DIRECTORY
+    os.chdir(service_directory)
+    sys.path.insert(0, str(service_directory))
+    app = importlib.import_module("main").app
+
+    stand_ins = StandIns(
+        broker=InMemoryBroker(),
+        sql=SqlStandIn(arguments.sql_url),
+        mongo=MongoStandIn(arguments.mongo_url)
+    )
+    try:
+        install_broker(stand_ins.broker)
+        scenarios = workload.prepare(stand_ins, vars(arguments))
+        report = asyncio.run(benchmark(app, workload, scenarios, arguments))
+        report["service_statistics"]["broker"] = stand_ins.broker.statistics()
+    finally:
+        stand_ins.sql.close()
+
+    if arguments.report_file is not None:
+        with open(arguments.report_file, "w", encoding="utf-8") as file:
+            json.dump(report, file, default=str)
+    print(format_report(arguments.service, report))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
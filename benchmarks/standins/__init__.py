@@ -0,0 +1,15 @@
+# External Library imports
+from dataclasses import dataclass
+
+# Internal library imports
+from .broker import InMemoryBroker, install as install_broker
+from .mongo import MongoStandIn, seed as seed_mongodb
+from .sql import SqlStandIn
+
+
+@dataclass
+class StandIns():
+    """The stand-ins of the backing services of the microservice that is benchmarked."""
+    broker: InMemoryBroker
+    sql: SqlStandIn
+    mongo: MongoStandIn
@@ -0,0 +1,371 @@
+"""
+An in-memory stand-in for RabbitMQ, so the services can publish and consume messages without a broker.
+
+The broker routes messages the way RabbitMQ does for the parts of AMQP the services use: fanout,
+direct and topic exchanges, the default exchange, and queues with a message TTL that dead-letter
+expired messages, which is how failed messages are retried. It is driven through `connect_robust`,
+which stands in for the one of aio-pika used by the async publisher and the consumers.
+
+`install` replaces it in the modules of the service that is benchmarked, so the publishers,
+the consumers, their worker pools and their metrics and tracing all run as they do against RabbitMQ.
+"""
+# External Library imports
+import sys
+import asyncio
+import threading
+from collections import deque, defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+from aio_pika.abc import (
+    AbstractRobustConnection,
+    AbstractRobustChannel,
+    AbstractRobustExchange,
+    AbstractRobustQueue,
+    AbstractIncomingMessage
+)
+
+
+DEFAULT_EXCHANGE = ""
+
+
+@dataclass
+class StoredMessage():
+    body: bytes
+    headers: Dict[str, Any]
+    exchange: str
+    routing_key: str
+    properties: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class QueueState():
+    name: str
+    arguments: Dict[str, Any]
+    messages: Deque[StoredMessage] = field(default_factory=deque)
+    consumers: List[Tuple[asyncio.AbstractEventLoop, Callable[[AbstractIncomingMessage], Awaitable[Any]]]] = field(default_factory=list)
+    next_consumer: int = 0
+
+
+def topic_matches(pattern: str, routing_key: str) -> bool:
+    """Whether the routing key matches the binding key of a topic exchange, where * is one word and # is zero or more words."""
+    def matches(pattern_words: List[str], words: List[str]) -> bool:
+        if not pattern_words:
+            return not words
+        if pattern_words[0] == "#":
+            return any(matches(pattern_words[1:], words[index:]) for index in range(len(words) + 1))
+        if not words:
+            return False
+        return (pattern_words[0] in ("*", words[0])) and matches(pattern_words[1:], words[1:])
+    return matches(pattern.split("."), routing_key.split("."))
+
+
+class InMemoryBroker():
+    """
+    The exchanges, queues and bindings of the stand-in broker, shared by every connection of the process.
+
+    Messages routed to a queue with a consumer are delivered to the consumers in turn on the event loop
+    they consume on, messages routed to a queue without one are kept in it, and messages that match no
+    queue are dropped, as RabbitMQ does. Every publish is counted by its exchange and routing key.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self.exchanges: Dict[str, str] = {DEFAULT_EXCHANGE: "direct"}
+        self.queues: Dict[str, QueueState] = {}
+        self.bindings: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        self.published: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.settled: Dict[str, int] = defaultdict(int)
+        # Callbacks waiting for a message to be settled, by the message it was published as.
+        self._settle_callbacks: Dict[int, Callable[[str], None]] = {}
+
+    def declare_exchange(self, exchange_name: str, exchange_type: str) -> None:
+        with self._lock:
+            self.exchanges.setdefault(exchange_name, exchange_type)
+
+    def declare_queue(self, queue_name: str, arguments: Optional[Dict[str, Any]] = None) -> QueueState:
+        with self._lock:
+            queue_state = self.queues.get(queue_name)
+            if queue_state is None:
+                queue_state = self.queues[queue_name] = QueueState(queue_name, dict(arguments or {}))
+            return queue_state
+
+    def bind_queue(self, queue_name: str, exchange_name: str, routing_key: str = "") -> None:
+        with self._lock:
+            if (queue_name, routing_key) not in self.bindings[exchange_name]:
+                self.bindings[exchange_name].append((queue_name, routing_key))
+
+    def consume(self, queue_name: str, callback: Callable[[AbstractIncomingMessage], Awaitable[Any]]) -> None:
+        """Deliver the messages of the queue to the callback on the running event loop, starting with the ones kept in it."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            queue_state = self.declare_queue(queue_name)
+            queue_state.consumers.append((loop, callback))
+            kept_messages = list(queue_state.messages)
+            queue_state.messages.clear()
+        for message in kept_messages:
+            self._deliver(queue_state, message)
+
+    def cancel_consumer(self, queue_name: str, callback: Callable[[AbstractIncomingMessage], Awaitable[Any]]) -> None:
+        """Stop delivering the messages of the queue to the callback, the messages it is handling can still be settled."""
+        with self._lock:
+            queue_state = self.declare_queue(queue_name)
+            queue_state.consumers = [consumer for consumer in queue_state.consumers if consumer[1] is not callback]
+
+    def cancel_consumers(self, loop: asyncio.AbstractEventLoop) -> None:
+        with self._lock:
+            for queue_state in self.queues.values():
+                queue_state.consumers = [consumer for consumer in queue_state.consumers if consumer[0] is not loop]
+
+    def publish(self,
+                exchange_name: str,
+                routing_key: str,
+                body: bytes,
+                headers: Optional[Dict[str, Any]] = None,
+                on_settled: Optional[Callable[[str], None]] = None,
+                **properties: Any
+                ) -> int:
+        """
+        Route a message to the queues bound to the exchange and return to how many queues it was routed.
+
+        :param str exchange_name: The exchange to publish to, the default exchange routes to the queue named by the routing key.
+        :param str routing_key: The routing key of the message.
+        :param bytes body: The body of the message.
+        :param dict headers: The headers of the message.
+        :param on_settled: Called with how a consumer settled the message, such as acked or rejected.
+        :raises ValueError: If the exchange has not been declared, as RabbitMQ closes the channel then.
+        """
+        with self._lock:
+            if exchange_name not in self.exchanges:
+                raise ValueError(f"NOT_FOUND - no exchange '{exchange_name}' in the in-memory broker")
+            self.published[(exchange_name, routing_key)] += 1
+            queue_names = self._route(exchange_name, routing_key)
+            for queue_name in queue_names:
+                message = StoredMessage(body, dict(headers or {}), exchange_name, routing_key, dict(properties))
+                if on_settled is not None:
+                    self._settle_callbacks[id(message)] = on_settled
+                self._enqueue(self.queues[queue_name], message)
+            return len(queue_names)
+
+    def publish_and_wait(self, exchange_name: str, routing_key: str, body: bytes, headers: Optional[Dict[str, Any]] = None) -> "asyncio.Future[str]":
+        """Publish a message and return a future of how the first queue it was routed to settled it."""
+        loop = asyncio.get_running_loop()
+        settled: "asyncio.Future[str]" = loop.create_future()
+
+        def on_settled(outcome: str) -> None:
+            loop.call_soon_threadsafe(lambda: settled.done() or settled.set_result(outcome))
+
+        if self.publish(exchange_name, routing_key, body, headers, on_settled=on_settled) == 0:
+            settled.set_result("unroutable")
+        return settled
+
+    def statistics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "published": {f"{exchange} {routing_key}".strip(): count for (exchange, routing_key), count in sorted(self.published.items())},
+                "settled": dict(self.settled),
+                "queued": {name: len(queue_state.messages) for name, queue_state in self.queues.items() if queue_state.messages},
+            }
+
+    def settle(self, message: StoredMessage, outcome: str, requeue_to: Optional[str] = None) -> None:
+        with self._lock:
+            self.settled[outcome] += 1
+            if requeue_to is not None:
+                self._enqueue(self.queues[requeue_to], message)
+                return
+            on_settled = self._settle_callbacks.pop(id(message), None)
+        if on_settled is not None:
+            on_settled(outcome)
+
+    def _route(self, exchange_name: str, routing_key: str) -> List[str]:
+        if exchange_name == DEFAULT_EXCHANGE:
+            return [routing_key] if routing_key in self.queues else []
+        exchange_type = self.exchanges[exchange_name]
+        queue_names: List[str] = []
+        for queue_name, binding_key in self.bindings[exchange_name]:
+            if exchange_type == "fanout" \
+                    or (exchange_type == "direct" and binding_key == routing_key) \
+                    or (exchange_type == "topic" and topic_matches(binding_key, routing_key)):
+                if queue_name not in queue_names:
+                    queue_names.append(queue_name)
+        return queue_names
+
+    def _enqueue(self, queue_state: QueueState, message: StoredMessage) -> None:
+        time_to_live_ms = queue_state.arguments.get("x-message-ttl")
+        if time_to_live_ms is not None and not queue_state.consumers:
+            # A delay queue of the retry topology: the message is dead-lettered once it expires.
+            threading.Timer(time_to_live_ms / 1000, self._dead_letter, args=(queue_state, message)).start()
+            return
+        if not queue_state.consumers:
+            queue_state.messages.append(message)
+            return
+        self._deliver(queue_state, message)
+
+    def _dead_letter(self, queue_state: QueueState, message: StoredMessage) -> None:
+        exchange_name = queue_state.arguments.get("x-dead-letter-exchange", DEFAULT_EXCHANGE)
+        routing_key = queue_state.arguments.get("x-dead-letter-routing-key", message.routing_key)
+        with self._lock:
+            on_settled = self._settle_callbacks.pop(id(message), None)
+        self.publish(exchange_name, routing_key, message.body, message.headers, on_settled=on_settled, **message.properties)
+
+    def _deliver(self, queue_state: QueueState, message: StoredMessage) -> None:
+        with self._lock:
+            loop, callback = queue_state.consumers[queue_state.next_consumer % len(queue_state.consumers)]
+            queue_state.next_consumer += 1
+        incoming_message = InMemoryIncomingMessage(self, queue_state.name, message)
+        loop.call_soon_threadsafe(lambda: loop.create_task(callback(incoming_message)))
+
+
+class InMemoryIncomingMessage():
+    """A delivered message, settled with ack, nack or reject as an aio-pika incoming message is."""
+
+    def __init__(self, broker: InMemoryBroker, queue_name: str, message: StoredMessage) -> None:
+        self._broker = broker
+        self._queue_name = queue_name
+        self._message = message
+        self.body = message.body
+        self.headers = message.headers
+        self.exchange = message.exchange
+        self.routing_key = message.routing_key
+        self.content_type = message.properties.get("content_type")
+        self.content_encoding = message.properties.get("content_encoding")
+        self.correlation_id = message.properties.get("correlation_id")
+        self.message_id = message.properties.get("message_id")
+        self.timestamp = message.properties.get("timestamp")
+        self.redelivered = False
+        self.processed = False
+
+    async def ack(self, multiple: bool = False) -> None:
+        self._settle("acked")
+
+    async def nack(self, multiple: bool = False, requeue: bool = True) -> None:
+        self._settle("nacked", requeue)
+
+    async def reject(self, requeue: bool = False) -> None:
+        self._settle("rejected", requeue)
+
+    @asynccontextmanager
+    async def process(self, requeue: bool = False, reject_on_redelivered: bool = False, ignore_processed: bool = False):
+        try:
+            yield self
+        except BaseException:
+            if not self.processed:
+                await self.reject(requeue=requeue)
+            raise
+        else:
+            if not self.processed:
+                await self.ack()
+
+    def _settle(self, outcome: str, requeue: bool = False) -> None:
+        if self.processed:
+            raise RuntimeError("The message has already been settled.")
+        self.processed = True
+        self._broker.settle(self._message, outcome, requeue_to=self._queue_name if requeue else None)
+
+
+AbstractIncomingMessage.register(InMemoryIncomingMessage)
+
+
+class InMemoryExchange():
+    def __init__(self, broker: InMemoryBroker, name: str) -> None:
+        self._broker = broker
+        self.name = name
+
+    async def publish(self, message: Any, routing_key: str, *, mandatory: bool = True, immediate: bool = False, timeout: Any = None) -> None:
+        self._broker.publish(
+            self.name,
+            routing_key,
+            message.body,
+            message.headers,
+            content_type=message.content_type,
+            content_encoding=message.content_encoding,
+            correlation_id=message.correlation_id,
+            message_id=message.message_id,
+            timestamp=message.timestamp
+        )
+
+
+class InMemoryQueue(AbstractRobustQueue):
+    def __init__(self, broker: InMemoryBroker, name: str) -> None:
+        self._broker = broker
+        self.name = name
+        self._consumers: Dict[str, Callable[[AbstractIncomingMessage], Awaitable[Any]]] = {}
+
+    async def bind(self, exchange: Any, routing_key: Optional[str] = None, **kwargs: Any) -> None:
+        exchange_name = exchange if isinstance(exchange, str) else exchange.name
+        self._broker.bind_queue(self.name, exchange_name, routing_key or "")
+
+    async def consume(self, callback: Callable[[AbstractIncomingMessage], Awaitable[Any]], no_ack: bool = False, **kwargs: Any) -> str:
+        consumer_tag = f"consumer-{self.name}-{len(self._consumers) + 1}"
+        self._consumers[consumer_tag] = callback
+        self._broker.consume(self.name, callback)
+        return consumer_tag
+
+    async def cancel(self, consumer_tag: str, timeout: Any = None, nowait: bool = False) -> None:
+        callback = self._consumers.pop(consumer_tag, None)
+        if callback is not None:
+            self._broker.cancel_consumer(self.name, callback)
+
+
+class InMemoryChannel():
+    def __init__(self, broker: InMemoryBroker) -> None:
+        self._broker = broker
+        self.is_closed = False
+        self.default_exchange = InMemoryExchange(broker, DEFAULT_EXCHANGE)
+
+    async def set_qos(self, prefetch_count: int = 0, **kwargs: Any) -> None:
+        pass
+
+    async def declare_exchange(self, name: str, type: Any = "direct", durable: bool = False, **kwargs: Any) -> InMemoryExchange:
+        self._broker.declare_exchange(name, getattr(type, "value", type))
+        return InMemoryExchange(self._broker, name)
+
+    async def declare_queue(self, name: str = "", durable: bool = False, arguments: Optional[Dict[str, Any]] = None, **kwargs: Any) -> InMemoryQueue:
+        self._broker.declare_queue(name, arguments)
+        return InMemoryQueue(self._broker, name)
+
+    async def close(self) -> None:
+        self.is_closed = True
+
+
+class InMemoryConnection():
+    def __init__(self, broker: InMemoryBroker) -> None:
+        self._broker = broker
+        self.is_closed = False
+
+    async def channel(self, publisher_confirms: bool = True, **kwargs: Any) -> InMemoryChannel:
+        return InMemoryChannel(self._broker)
+
+    async def close(self) -> None:
+        if not self.is_closed:
+            self.is_closed = True
+            self._broker.cancel_consumers(asyncio.get_running_loop())
+
+
+# The consumers check that they are connected with isinstance checks against the aio-pika interfaces,
+# the interface of a queue is not an abstract base class, so the queue subclasses it instead.
+AbstractRobustConnection.register(InMemoryConnection)
+AbstractRobustChannel.register(InMemoryChannel)
+AbstractRobustExchange.register(InMemoryExchange)
+
+
+def install(broker: InMemoryBroker, module_prefix: str = "src.") -> List[str]:
+    """
+    Replace `connect_robust` of aio-pika in every imported module of the service,
+    so it connects to the in-memory broker. Must be called after the application has been imported and before it starts.
+
+    :param InMemoryBroker broker: The broker to connect to.
+    :param str module_prefix: The prefix of the modules of the service.
+    :return: The names of the modules that were changed.
+    """
+    async def connect_robust(*args: Any, **kwargs: Any) -> InMemoryConnection:
+        return InMemoryConnection(broker)
+
+    changed_modules: List[str] = []
+    for module_name, module in list(sys.modules.items()):
+        if module is None or not module_name.startswith(module_prefix):
+            continue
+        if hasattr(module, "connect_robust"):
+            module.connect_robust = connect_robust
+            changed_modules.append(module_name)
+    return changed_modules
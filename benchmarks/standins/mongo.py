@@ -0,0 +1,214 @@
+"""
+Stand-ins for the MongoDB clients of the auth, customer and synch microservices.
+
+Without a MongoDB URL the clients are mongomock clients, which keep the databases in memory and share
+them within the process. With a URL, such as the one of a throwaway local `mongod`, they are real clients
+of that server, with the event listeners the service gives them, so the command metrics and spans are kept.
+
+The services check that they are given a pymongo `Database`, so `MongomockClient` hands out mongomock
+databases wrapped in a subclass of it. mongomock has no asynchronous client, so `AsyncMongomockClient` wraps
+it in the part of the `AsyncMongoClient` interface the customer microservice uses. Its commands run on the event loop, and change streams are not supported,
+so the benchmark disables the change stream watcher of the response cache when it uses mongomock.
+"""
+# External Library imports
+import mongomock
+from mongomock.store import ServerStore
+from typing import Any, Dict, List, Optional
+from pymongo import MongoClient
+from pymongo.database import Database
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.asynchronous.mongo_client import AsyncMongoClient
+
+
+class MongoStandIn():
+    """
+    Creates the clients the service opens, all of them sharing one in-memory server,
+    or connected to the given URL instead of the host and credentials the service passes.
+
+    Its `sync_client` and `async_client` stand in for the `MongoClient` and `AsyncMongoClient` classes.
+
+    :param str url: The URL of a MongoDB server to use instead of mongomock.
+    """
+
+    def __init__(self, url: Optional[str] = None) -> None:
+        self.url = url
+        self.store = ServerStore()
+
+    def sync_client(self, *args: Any, **kwargs: Any) -> Any:
+        if self.url is not None:
+            return MongoClient(self.url, event_listeners=kwargs.get("event_listeners"), maxPoolSize=kwargs.get("maxPoolSize", 100))
+        return MongomockClient(mongomock.MongoClient(_store=self.store))
+
+    def async_client(self, *args: Any, **kwargs: Any) -> Any:
+        if self.url is not None:
+            return AsyncMongoClient(self.url, event_listeners=kwargs.get("event_listeners"), maxPoolSize=kwargs.get("maxPoolSize", 100))
+        return AsyncMongomockClient(mongomock.MongoClient(_store=self.store))
+
+    def get_database(self, name: str) -> Database:
+        """A synchronous handle of the database, to seed it before the service starts."""
+        client = MongoClient(self.url) if self.url is not None else mongomock.MongoClient(_store=self.store)
+        return client.get_database(name)
+
+
+class MongomockDatabase(Database):
+    """
+    A mongomock database that passes the isinstance checks of the services. The `Database` it subclasses
+    is not initialised, the methods the services use are delegated to the mongomock database instead.
+    """
+
+    def __init__(self, database: mongomock.Database) -> None:
+        self._database = database
+        self._name = database.name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def get_collection(self, name: str, **kwargs: Any) -> mongomock.Collection:
+        return self._database.get_collection(name)
+
+    def __getitem__(self, name: str) -> mongomock.Collection:
+        return self.get_collection(name)
+
+    def __getattr__(self, name: str) -> mongomock.Collection:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.get_collection(name)
+
+    def list_collection_names(self, *args: Any, **kwargs: Any) -> List[str]:
+        return self._database.list_collection_names()
+
+    def drop_collection(self, name_or_collection: Any, *args: Any, **kwargs: Any) -> None:
+        self._database.drop_collection(name_or_collection)
+
+    def command(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        return self._database.command(*args, **kwargs)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, MongomockDatabase) and other._database == self._database
+
+    def __hash__(self) -> int:
+        return hash(self._name)
+
+    def __repr__(self) -> str:
+        return f"MongomockDatabase({self._name!r})"
+
+
+class MongomockClient():
+    def __init__(self, client: mongomock.MongoClient) -> None:
+        self.delegate = client
+
+    def get_database(self, name: Optional[str] = None, **kwargs: Any) -> MongomockDatabase:
+        return MongomockDatabase(self.delegate.get_database(name))
+
+    def __getitem__(self, name: str) -> MongomockDatabase:
+        return self.get_database(name)
+
+    def close(self) -> None:
+        self.delegate.close()
+
+
+class AsyncMongomockCursor():
+    def __init__(self, cursor: mongomock.collection.Cursor) -> None:
+        self._cursor = cursor
+
+    def limit(self, limit: int) -> "AsyncMongomockCursor":
+        self._cursor = self._cursor.limit(limit)
+        return self
+
+    def sort(self, *args: Any, **kwargs: Any) -> "AsyncMongomockCursor":
+        self._cursor = self._cursor.sort(*args, **kwargs)
+        return self
+
+    def skip(self, skip: int) -> "AsyncMongomockCursor":
+        self._cursor = self._cursor.skip(skip)
+        return self
+
+    def __aiter__(self) -> "AsyncMongomockCursor":
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        try:
+            return next(self._cursor)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def to_list(self, length: Optional[int] = None) -> List[Dict[str, Any]]:
+        return list(self._cursor)[:length] if length is not None else list(self._cursor)
+
+
+class AsyncMongomockCollection():
+    def __init__(self, collection: mongomock.Collection) -> None:
+        self._collection = collection
+        self.name = collection.name
+
+    def find(self, *args: Any, **kwargs: Any) -> AsyncMongomockCursor:
+        return AsyncMongomockCursor(self._collection.find(*args, **kwargs))
+
+    def __getattr__(self, name: str) -> Any:
+        # Every other method of a collection, such as find_one or insert_one, is a coroutine of the asynchronous client.
+        method = getattr(self._collection, name)
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return method(*args, **kwargs)
+        return call
+
+
+class AsyncMongomockDatabase(AsyncDatabase):
+    """The asynchronous counterpart of `MongomockDatabase`, whose collections are wrapped in coroutines."""
+
+    def __init__(self, database: mongomock.Database) -> None:
+        self._database = database
+        self._name = database.name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def __getattr__(self, name: str) -> AsyncMongomockCollection:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.get_collection(name)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, AsyncMongomockDatabase) and other._database == self._database
+
+    def __hash__(self) -> int:
+        return hash(self._name)
+
+    def __repr__(self) -> str:
+        return f"AsyncMongomockDatabase({self._name!r})"
+
+    def get_collection(self, name: str, **kwargs: Any) -> AsyncMongomockCollection:
+        return AsyncMongomockCollection(self._database.get_collection(name))
+
+    def __getitem__(self, name: str) -> AsyncMongomockCollection:
+        return self.get_collection(name)
+
+    async def watch(self, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError("mongomock does not support change streams.")
+
+
+class AsyncMongomockClient():
+    def __init__(self, client: mongomock.MongoClient) -> None:
+        self.delegate = client
+
+    def get_database(self, name: Optional[str] = None, **kwargs: Any) -> AsyncMongomockDatabase:
+        return AsyncMongomockDatabase(self.delegate.get_database(name))
+
+    async def close(self) -> None:
+        self.delegate.close()
+
+
+def seed(database: Database, documents: Dict[str, List[Dict[str, Any]]]) -> None:
+    """
+    Replace the documents of the collections of a database, such as the one of a stand-in client.
+
+    :param Database database: The database to seed, a mongomock or pymongo database.
+    :param documents: The documents to insert by the name of their collection.
+    """
+    for collection_name, collection_documents in documents.items():
+        collection = database.get_collection(collection_name)
+        collection.delete_many({})
+        if collection_documents:
+            collection.insert_many([dict(document) for document in collection_documents])
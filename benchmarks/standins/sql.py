@@ -0,0 +1,78 @@
+"""
+A stand-in for the MySQL databases of the admin and employee microservices.
+
+The services build their engines from the MySQL settings of the environment. `SqlStandIn.create_engine`
+replaces `create_engine` in their connection module and swaps that URL for the one of the stand-in,
+keeping the pool class and sizes, so the pools, their statistics and the metrics and tracing of the
+engines are the ones of the service.
+
+Without a URL the stand-in is a SQLite database in a temporary file, in WAL mode with a busy timeout,
+so the pooled connections of the worker threads can read while one of them writes. With a URL, such as the
+one of a throwaway MySQL database, the engines connect to it instead. The tables are created from the
+entities of the service, and are dropped first, so never point the stand-in at a database that matters.
+"""
+# External Library imports
+import os
+import uuid
+import sqlite3
+import tempfile
+from typing import Any, Optional
+from sqlalchemy import Engine, MetaData, event, create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+
+SQLITE_BUSY_TIMEOUT_MS = 30000
+
+# The repositories filter by UUIDs, which the MySQL driver sends as their text, and so does SQLite with this.
+sqlite3.register_adapter(uuid.UUID, str)
+
+
+class SqlStandIn():
+    """
+    :param str url: The SQLAlchemy URL of the database to use instead of a temporary SQLite database.
+    """
+
+    def __init__(self, url: Optional[str] = None) -> None:
+        if url is None:
+            self._directory = tempfile.TemporaryDirectory(prefix="kea-cars-benchmark-")
+            url = f"sqlite:///{os.path.join(self._directory.name, 'benchmark.db')}"
+        self.url = url
+
+    @property
+    def is_sqlite(self) -> bool:
+        return self.url.startswith("sqlite")
+
+    def create_engine(self, url: Any = None, **kwargs: Any) -> Engine:
+        """Stands in for `create_engine` of SQLAlchemy, ignoring the URL the service built."""
+        if self.is_sqlite:
+            # pool_recycle and the MySQL specific settings do no harm, the SQLite connections are local files.
+            kwargs.setdefault("connect_args", {"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000})
+        engine = create_engine(self.url, **kwargs)
+        if self.is_sqlite:
+            event.listen(engine, "connect", _configure_sqlite_connection)
+        return engine
+
+    def create_schema(self, metadata: MetaData) -> sessionmaker:
+        """
+        Drop and create the tables of the entities, and return a session factory to seed them with.
+
+        :param MetaData metadata: The metadata of the entities of the service.
+        """
+        engine = self.create_engine()
+        metadata.drop_all(engine)
+        metadata.create_all(engine)
+        return sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+
+    def close(self) -> None:
+        directory = getattr(self, "_directory", None)
+        if directory is not None:
+            directory.cleanup()
+
+
+def _configure_sqlite_connection(dbapi_connection: Any, connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
@@ -0,0 +1,102 @@
+"""
+Regression tests of the amount of SQL statements an endpoint runs, against the stand-ins of the benchmarks.
+
+GET /cars once ran a query per car to tell if it was purchased, so its statements grew with the page.
+The statements of one request are counted with few and with many cars, and must be the same.
+
+Like `run_service.py`, the employee microservice is imported from its directory into this process,
+so run these tests in a process of their own:
+
+    python -m pytest benchmarks
+"""
+# External Library imports
+import os
+import sys
+import random
+import asyncio
+import importlib
+from typing import Any, Dict, Iterator, List
+import httpx
+import pytest
+from sqlalchemy import Engine, event, select
+
+# Internal library imports
+from load import LoadClient, Recorder
+from run_service import ENVIRONMENT
+from standins import StandIns, InMemoryBroker, MongoStandIn, SqlStandIn, install_broker
+from workloads import employee as employee_workload
+from workloads.common import REPOSITORY_ROOT, bearer, create_access_token
+
+
+CARS = 5
+# Every car of the bigger seeding is on the first page, which holds up to MAX_PAGE_SIZE of them.
+CARS_FACTOR = 10
+
+
+@pytest.fixture(scope="module")
+def employee_service() -> Iterator[Dict[str, Any]]:
+    for name, value in ENVIRONMENT.items():
+        os.environ.setdefault(name, value)
+    working_directory = os.getcwd()
+    service_directory = REPOSITORY_ROOT / employee_workload.SERVICE_DIRECTORY
+    os.chdir(service_directory)
+    sys.path.insert(0, str(service_directory))
+    stand_ins = StandIns(broker=InMemoryBroker(), sql=SqlStandIn(), mongo=MongoStandIn())
+    try:
+        app = importlib.import_module("main").app
+        install_broker(stand_ins.broker)
+        scenarios = {scenario.name: scenario for scenario in employee_workload.prepare(stand_ins, {})}
+
+        from src.entities import EmployeeEntity
+        from src.resources import RoleEnum
+
+        with stand_ins.sql.create_engine().connect() as connection:
+            administrator_id = connection.execute(
+                select(EmployeeEntity.id).where(EmployeeEntity.role == RoleEnum.admin)
+            ).scalar_one()
+        yield {
+            "app": app,
+            "scenarios": scenarios,
+            # The admins see every car, the sales people only their own.
+            "headers": bearer(create_access_token(os.environ["SECRET_KEY"], administrator_id)),
+        }
+    finally:
+        stand_ins.sql.close()
+        sys.path.remove(str(service_directory))
+        os.chdir(working_directory)
+
+
+async def count_get_cars_statements(service: Dict[str, Any], cars: int) -> int:
+    """Create cars until there are the given amount, purchase every other one, and count the statements of GET /cars."""
+    statements: List[str] = []
+
+    def count_statement(connection: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    app = service["app"]
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            load_client = LoadClient(client, Recorder(), random.Random(cars), {})
+            response = await client.get("/cars", headers=service["headers"])
+            for _ in range(cars - len(response.json())):
+                assert (await service["scenarios"]["create a car"].run(load_client)).status_code == 200
+            for _ in range(cars // 2):
+                await service["scenarios"]["purchase a car"].run(load_client)
+
+            # Warms up the cache of the current employee, so that its lookup is not counted.
+            await client.get("/cars", headers=service["headers"])
+            event.listen(Engine, "before_cursor_execute", count_statement)
+            try:
+                response = await client.get("/cars", headers=service["headers"])
+            finally:
+                event.remove(Engine, "before_cursor_execute", count_statement)
+
+    assert response.status_code == 200
+    assert len(response.json()) == cars
+    return len(statements)
+
+
+def test_get_cars_statements_do_not_grow_with_the_cars(employee_service: Dict[str, Any]) -> None:
+    few_cars_statements = asyncio.run(count_get_cars_statements(employee_service, CARS))
+    many_cars_statements = asyncio.run(count_get_cars_statements(employee_service, CARS * CARS_FACTOR))
+    assert few_cars_statements == many_cars_statements
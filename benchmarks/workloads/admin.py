@@ -0,0 +1,113 @@
+"""
+The administration of the employees in the admin microservice on MySQL, where every change is published
+to the admin exchange for the auth and employee microservices.
+"""
+# External Library imports
+import os
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List
+from sqlalchemy import Boolean
+
+# Internal library imports
+from load import LoadClient, Scenario
+from workloads.common import BENCHMARK_PASSWORD, bearer, create_access_token, employee_names, new_id
+from standins import StandIns
+
+
+SERVICE_DIRECTORY = "admin_microservice"
+EMPLOYEES = 200
+ROLES = ("manager", "sales_person", "sales_person")
+
+
+def prepare(stand_ins: StandIns, options: Dict[str, Any]) -> List[Scenario]:
+    from src.core import get_password_hash
+    from src.database_management import mysqldb_connection
+    from src.entities import BaseEntity, EmployeeEntity
+    from src.services import employees_service
+
+    mysqldb_connection.create_engine = stand_ins.sql.create_engine
+    # Stands in for the lookup in Have I Been Pwned, so that the benchmark neither needs nor loads the internet.
+    employees_service.is_password_pwned = lambda password: False
+    # The tables are created by the MySQL scripts of the service, where the flag is a boolean, the entity leaves it untyped.
+    EmployeeEntity.__table__.c.is_deleted.type = Boolean()
+    session_factory = stand_ins.sql.create_schema(BaseEntity.metadata)
+
+    hashed_password = get_password_hash(BENCHMARK_PASSWORD)
+    now = datetime.now().replace(microsecond=0)
+    administrator_id = new_id()
+    employee_ids = [new_id() for _ in range(EMPLOYEES)]
+    with session_factory() as session:
+        session.add(EmployeeEntity(
+            id=administrator_id,
+            email="benchmark.admin@keacars.dk",
+            hashed_password=hashed_password,
+            **employee_names(0),
+            role="admin",
+            is_deleted=False,
+            created_at=now,
+            updated_at=now
+        ))
+        session.add_all(
+            EmployeeEntity(
+                id=employee_id,
+                email=f"benchmark.employee{index}@keacars.dk",
+                hashed_password=hashed_password,
+                **employee_names(index + 1),
+                role=ROLES[index % len(ROLES)],
+                is_deleted=False,
+                created_at=now,
+                updated_at=now
+            )
+            for index, employee_id in enumerate(employee_ids)
+        )
+        session.commit()
+
+    # Every endpoint of the employees is only for the admins.
+    headers = bearer(create_access_token(os.environ["SECRET_KEY"], administrator_id))
+
+    async def browse_employees(load_client: LoadClient) -> None:
+        await load_client.request("GET /employees", "GET", "/employees", headers=headers)
+
+    async def view_employee(load_client: LoadClient) -> None:
+        employee_id = load_client.random.choice(employee_ids)
+        await load_client.request("GET /employees/{employee_id}", "GET", f"/employees/{employee_id}", headers=headers)
+
+    async def create_employee(load_client: LoadClient) -> None:
+        load_client.state["created_employees"] = load_client.state.get("created_employees", 0) + 1
+        await load_client.request(
+            "POST /employees", "POST", "/employees",
+            headers=headers,
+            json={
+                "email": f"benchmark.{uuid.uuid4().hex[:16]}@keacars.dk",
+                **employee_names(EMPLOYEES + load_client.state["created_employees"]),
+                "role": load_client.random.choice(ROLES),
+                "password": BENCHMARK_PASSWORD,
+            }
+        )
+
+    async def rename_employee(load_client: LoadClient) -> None:
+        employee_id = load_client.random.choice(employee_ids)
+        await load_client.request(
+            "PUT /employees", "PUT", "/employees",
+            headers=headers,
+            params={"employee_id": employee_id},
+            json=employee_names(load_client.random.randint(1, 10 ** 6))
+        )
+
+    async def change_password(load_client: LoadClient) -> None:
+        employee_id = load_client.random.choice(employee_ids)
+        await load_client.request(
+            "PUT /employees password", "PUT", "/employees",
+            headers=headers,
+            params={"employee_id": employee_id},
+            json={"password": BENCHMARK_PASSWORD}
+        )
+
+    return [
+        Scenario("browse employees", 30, browse_employees),
+        Scenario("view an employee", 35, view_employee),
+        Scenario("create an employee", 10, create_employee),
+        Scenario("rename an employee", 20, rename_employee),
+        Scenario("change the password of an employee", 5, change_password),
+    ]
@@ -0,0 +1,68 @@
+"""
+Logins of the employees to the auth microservice, which checks their bcrypt hashed password in MongoDB and issues a token,
+and the employee changes it consumes from the admin exchange to keep its employees in step with the admin microservice.
+"""
+# External Library imports
+from datetime import datetime
+from typing import Any, Dict, List
+
+# Internal library imports
+from load import LoadClient, Scenario
+from standins import StandIns, seed_mongodb
+from workloads.common import BENCHMARK_PASSWORD, employee_message, employee_names, new_id
+
+
+SERVICE_DIRECTORY = "auth_microservice"
+EMPLOYEES = 200
+ROLES = ("admin", "manager", "sales_person", "sales_person")
+
+
+def prepare(stand_ins: StandIns, options: Dict[str, Any]) -> List[Scenario]:
+    from src.core.config import pwd_context
+    from src.database_management import mongodb_connection
+
+    mongodb_connection.MongoClient = stand_ins.mongo.sync_client
+    # Hashing is what makes a login slow, so every employee has a password hash of the cost the service uses.
+    hashed_password = pwd_context.hash(BENCHMARK_PASSWORD)
+    now = datetime.now().replace(microsecond=0).isoformat()
+    employees = [
+        {
+            "_id": new_id(),
+            "email": f"benchmark.employee{index}@keacars.dk",
+            "hashed_password": hashed_password,
+            **employee_names(index),
+            "role": ROLES[index % len(ROLES)],
+            "created_at": now,
+            "updated_at": now,
+        }
+        for index in range(EMPLOYEES)
+    ]
+    seed_mongodb(stand_ins.mongo.get_database(mongodb_connection.MONGO_DB_NAME), {"employees": employees})
+
+    async def login(load_client: LoadClient) -> None:
+        employee = load_client.random.choice(employees)
+        await load_client.request("POST /login", "POST", "/login", json={"email": employee["email"], "password": BENCHMARK_PASSWORD})
+
+    async def login_with_wrong_password(load_client: LoadClient) -> None:
+        employee = load_client.random.choice(employees)
+        await load_client.request(
+            "POST /login wrong password", "POST", "/login",
+            expected=(401,),
+            json={"email": employee["email"], "password": "not-the-password"}
+        )
+
+    async def consume_employee_update(load_client: LoadClient) -> None:
+        employee = {key: value for key, value in load_client.random.choice(employees).items() if key not in ("created_at", "updated_at")}
+        employee["id"] = employee.pop("_id")
+        load_client.state["employee_version"] = load_client.state.get("employee_version", 0) + 1
+        body = employee_message(employee, load_client.state["employee_version"])
+        await load_client.timed(
+            "consume employee.updated",
+            stand_ins.broker.publish_and_wait("admin_exchange", "employee.updated", body)
+        )
+
+    return [
+        Scenario("login", 85, login),
+        Scenario("login with a wrong password", 10, login_with_wrong_password),
+        Scenario("consume an employee update", 5, consume_employee_update),
+    ]
@@ -0,0 +1,54 @@
+# External Library imports
+import json
+import uuid
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+from jwt import encode
+
+
+REPOSITORY_ROOT = Path(__file__).resolve().parents[2]
+# The catalog the customer microservice is seeded with, the employee microservice is seeded with the same brands, models and options.
+CATALOG_PATH = REPOSITORY_ROOT / "customer_microservice" / "scripts" / "mongodb_insert_data.json"
+BENCHMARK_PASSWORD = "benchmark-password-2025"
+TOKEN_LIFETIME = timedelta(hours=12)
+
+
+def load_catalog() -> Dict[str, List[Dict[str, Any]]]:
+    with open(CATALOG_PATH, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def create_access_token(secret_key: str, employee_id: str) -> str:
+    """A token of the employee as the auth microservice issues it, signed with the secret key the services share."""
+    return encode({"sub": employee_id, "exp": datetime.now(timezone.utc) + TOKEN_LIFETIME}, secret_key, algorithm="HS256")
+
+
+def bearer(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def new_id() -> str:
+    return str(uuid.uuid4())
+
+
+def employee_message(employee: Dict[str, Any], version: int) -> bytes:
+    """
+    The body of an employee message on the admin exchange, as the admin microservice publishes it.
+
+    The consumers skip changes that are not more recent than the employee they have, and the time of a change
+    is kept to the second, so the version is added to it in seconds, which makes every message a newer change.
+    """
+    now = datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None)
+    return json.dumps({
+        **employee,
+        "is_deleted": False,
+        "created_at": now.isoformat(),
+        "updated_at": (now + timedelta(seconds=version)).isoformat(),
+    }).encode()
+
+
+def employee_names(index: int) -> Dict[str, str]:
+    # The names of the services must be alphabetic, so the index is spelled with letters.
+    letters = "".join(chr(ord("a") + int(digit)) for digit in str(index))
+    return {"first_name": f"Bench{letters}".title(), "last_name": f"Mark{letters}".title()}
@@ -0,0 +1,59 @@
+"""
+Catalog browsing of the customer website: the brands, the models of a brand and the options of a model,
+served by the customer microservice from MongoDB through its response cache.
+"""
+# External Library imports
+from typing import Any, Dict, List
+
+# Internal library imports
+from load import LoadClient, Scenario
+from standins import StandIns, seed_mongodb
+from workloads.common import load_catalog
+
+
+SERVICE_DIRECTORY = "customer_microservice"
+ENVIRONMENT = {
+    # mongomock has no change streams, the cached responses expire by their time to live instead.
+    "RESPONSE_CACHE_CHANGE_STREAM_ENABLED": "false",
+}
+
+
+def prepare(stand_ins: StandIns, options: Dict[str, Any]) -> List[Scenario]:
+    from src.database_management import mongodb_connection
+
+    mongodb_connection.AsyncMongoClient = stand_ins.mongo.async_client
+    catalog = load_catalog()
+    seed_mongodb(stand_ins.mongo.get_database(mongodb_connection.MONGO_DB_NAME), catalog)
+    brand_ids = [brand["_id"] for brand in catalog["brands"]]
+    model_ids = [model["_id"] for model in catalog["models"]]
+
+    async def browse_brands(load_client: LoadClient) -> None:
+        await load_client.request("GET /brands", "GET", "/brands")
+
+    async def browse_models_of_brand(load_client: LoadClient) -> None:
+        brand_id = load_client.random.choice(brand_ids)
+        await load_client.request("GET /models?brand_id", "GET", "/models", params={"brand_id": brand_id})
+
+    async def configure_model(load_client: LoadClient) -> None:
+        # Opening a model shows it with the colors, accessories and insurances it can be bought with.
+        model_id = load_client.random.choice(model_ids)
+        await load_client.request("GET /models/{model_id}", "GET", f"/models/{model_id}")
+        await load_client.request("GET /accessories", "GET", "/accessories")
+        await load_client.request("GET /insurances", "GET", "/insurances")
+
+    async def browse_all_models(load_client: LoadClient) -> None:
+        await load_client.request("GET /models", "GET", "/models")
+        await load_client.request("GET /colors", "GET", "/colors")
+
+    return [
+        Scenario("browse brands", 25, browse_brands),
+        Scenario("browse models of a brand", 40, browse_models_of_brand),
+        Scenario("configure a model", 25, configure_model),
+        Scenario("browse all models", 10, browse_all_models),
+    ]
+
+
+def statistics() -> Dict[str, Any]:
+    from src.cache_management import response_cache
+
+    return {"response_cache": response_cache.statistics()}
@@ -0,0 +1,202 @@
+"""
+The work of the sales people in the employee microservice on MySQL: browsing the catalog and the cars,
+creating cars for customers and purchasing them, besides the employee changes it consumes from the admin exchange.
+"""
+# External Library imports
+import os
+from datetime import datetime
+from typing import Any, Dict, List
+from sqlalchemy import Boolean
+
+# Internal library imports
+from load import LoadClient, Scenario
+from workloads.common import (
+    BENCHMARK_PASSWORD,
+    bearer,
+    create_access_token,
+    employee_message,
+    employee_names,
+    load_catalog,
+    new_id
+)
+from standins import StandIns
+
+
+SERVICE_DIRECTORY = "employee_microservice"
+SALES_PEOPLE = 20
+CUSTOMERS = 100
+# Cars created by the workers that are left to be purchased, the oldest are dropped beyond this.
+MAX_UNPURCHASED_CARS = 1000
+
+
+def prepare(stand_ins: StandIns, options: Dict[str, Any]) -> List[Scenario]:
+    from src.database_management import mysqldb_connection
+    from src.resources import RoleEnum
+    from src.entities import (
+        BaseEntity,
+        AccessoryEntity,
+        BrandEntity,
+        ColorEntity,
+        CustomerEntity,
+        EmployeeEntity,
+        InsuranceEntity,
+        ModelEntity
+    )
+
+    mysqldb_connection.create_engine = stand_ins.sql.create_engine
+    # The tables are created by the MySQL scripts of the service, where the flag is a boolean, the entity leaves it untyped.
+    EmployeeEntity.__table__.c.is_deleted.type = Boolean()
+    session_factory = stand_ins.sql.create_schema(BaseEntity.metadata)
+    catalog = load_catalog()
+    now = datetime.now().replace(microsecond=0)
+
+    def timestamps(document: Dict[str, Any]) -> Dict[str, datetime]:
+        return {
+            "created_at": datetime.fromisoformat(document["created_at"]),
+            "updated_at": datetime.fromisoformat(document["updated_at"]),
+        }
+
+    employees = [
+        {
+            "id": new_id(),
+            "email": f"benchmark.employee{index}@keacars.dk",
+            # The employee microservice never checks the passwords, so the hash is not a real one.
+            "hashed_password": f"benchmark-hash-of-{BENCHMARK_PASSWORD}",
+            **employee_names(index),
+            "role": role,
+        }
+        for index, role in enumerate([RoleEnum.admin, RoleEnum.manager] + [RoleEnum.sales_person] * SALES_PEOPLE)
+    ]
+    customers = [
+        {
+            "id": new_id(),
+            "email": f"benchmark.customer{index}@keacars.dk",
+            "phone_number": f"+45 {10000000 + index}",
+            **employee_names(index),
+            "address": f"Benchmarkvej {index}, 2200 København N",
+        }
+        for index in range(CUSTOMERS)
+    ]
+    with session_factory() as session:
+        colors = {
+            color["_id"]: ColorEntity(
+                id=color["_id"],
+                name=color["name"],
+                price=color["price"],
+                red_value=color["red_value"],
+                green_value=color["green_value"],
+                blue_value=color["blue_value"],
+                **timestamps(color)
+            )
+            for color in catalog["colors"]
+        }
+        session.add_all(colors.values())
+        session.add_all(
+            BrandEntity(id=brand["_id"], name=brand["name"], logo_url=brand["logo_url"], **timestamps(brand))
+            for brand in catalog["brands"]
+        )
+        session.add_all(
+            ModelEntity(
+                id=model["_id"],
+                brands_id=model["brand"]["_id"],
+                name=model["name"],
+                price=model["price"],
+                image_url=model["image_url"],
+                colors=[colors[color["_id"]] for color in model["colors"]],
+                **timestamps(model)
+            )
+            for model in catalog["models"]
+        )
+        session.add_all(
+            AccessoryEntity(id=accessory["_id"], name=accessory["name"], price=accessory["price"], **timestamps(accessory))
+            for accessory in catalog["accessories"]
+        )
+        session.add_all(
+            InsuranceEntity(id=insurance["_id"], name=insurance["name"], price=insurance["price"], **timestamps(insurance))
+            for insurance in catalog["insurances"]
+        )
+        session.add_all(EmployeeEntity(**employee, is_deleted=False, created_at=now, updated_at=now) for employee in employees)
+        session.add_all(CustomerEntity(**customer) for customer in customers)
+        session.commit()
+
+    secret_key = os.environ["SECRET_KEY"]
+    tokens = {employee["id"]: create_access_token(secret_key, employee["id"]) for employee in employees}
+    sales_people = [employee for employee in employees if employee["role"] == RoleEnum.sales_person]
+    managers = [employee for employee in employees if employee["role"] != RoleEnum.sales_person]
+    brand_ids = [brand["_id"] for brand in catalog["brands"]]
+    models = catalog["models"]
+    accessory_ids = [accessory["_id"] for accessory in catalog["accessories"]]
+    insurance_ids = [insurance["_id"] for insurance in catalog["insurances"]]
+    customer_ids = [customer["id"] for customer in customers]
+
+    async def browse_catalog(load_client: LoadClient) -> None:
+        headers = bearer(tokens[load_client.random.choice(sales_people)["id"]])
+        brand_id = load_client.random.choice(brand_ids)
+        await load_client.request("GET /brands", "GET", "/brands", headers=headers)
+        await load_client.request("GET /models?brand_id", "GET", "/models", headers=headers, params={"brand_id": brand_id})
+        await load_client.request("GET /accessories", "GET", "/accessories", headers=headers)
+        await load_client.request("GET /insurances", "GET", "/insurances", headers=headers)
+
+    async def browse_cars(load_client: LoadClient) -> None:
+        # The sales people only see their own cars, the managers and admins see every car.
+        employee = load_client.random.choice(sales_people if load_client.random.random() < 0.7 else managers)
+        await load_client.request("GET /cars", "GET", "/cars", headers=bearer(tokens[employee["id"]]))
+
+    async def create_car(load_client: LoadClient) -> Any:
+        sales_person = load_client.random.choice(sales_people)
+        model = load_client.random.choice(models)
+        response = await load_client.request(
+            "POST /cars", "POST", "/cars",
+            headers=bearer(tokens[sales_person["id"]]),
+            json={
+                "models_id": model["_id"],
+                "colors_id": load_client.random.choice(model["colors"])["_id"],
+                "customers_id": load_client.random.choice(customer_ids),
+                "accessory_ids": load_client.random.sample(accessory_ids, load_client.random.randint(0, 5)),
+                "insurance_ids": load_client.random.sample(insurance_ids, load_client.random.randint(0, 2)),
+            }
+        )
+        if response.status_code != 200:
+            return None
+        unpurchased_cars = load_client.state.setdefault("unpurchased_cars", [])
+        unpurchased_cars.append((response.json()["id"], sales_person["id"]))
+        del unpurchased_cars[:-MAX_UNPURCHASED_CARS]
+        return response
+
+    async def purchase_car(load_client: LoadClient) -> None:
+        # A car is purchased by the sales person that created it, a car is created first when none is left.
+        unpurchased_cars = load_client.state.setdefault("unpurchased_cars", [])
+        if not unpurchased_cars:
+            await create_car(load_client)
+        if not unpurchased_cars:
+            return
+        car_id, sales_person_id = unpurchased_cars.pop(0)
+        await load_client.request(
+            "POST /purchases", "POST", "/purchases",
+            headers=bearer(tokens[sales_person_id]),
+            json={"cars_id": car_id}
+        )
+
+    async def consume_employee_update(load_client: LoadClient) -> None:
+        employee = {**load_client.random.choice(sales_people)}
+        employee["role"] = employee["role"].value
+        load_client.state["employee_version"] = load_client.state.get("employee_version", 0) + 1
+        body = employee_message(employee, load_client.state["employee_version"])
+        await load_client.timed(
+            "consume employee.updated",
+            stand_ins.broker.publish_and_wait("admin_exchange", "employee.updated", body)
+        )
+
+    return [
+        Scenario("browse the catalog", 35, browse_catalog),
+        Scenario("browse cars", 30, browse_cars),
+        Scenario("create a car", 20, create_car),
+        Scenario("purchase a car", 12, purchase_car),
+        Scenario("consume an employee update", 3, consume_employee_update),
+    ]
+
+
+def statistics() -> Dict[str, Any]:
+    from src.database_management.mysqldb_connection import get_pool_statistics
+
+    return {"pools": get_pool_statistics()}
@@ -6,6 +6,10 @@ that define the API endpoints for the microservice.
 
 Key Responsibilities:
 - Load environment variables from a `.env` file.
+- Open the shared MongoDB client on startup and close it on shutdown.
+- Expose the statistics of the MongoDB connection pool and of the catalog response cache.
+- Expose Prometheus metrics of the requests, the MongoDB commands and the response cache at `/metrics`.
+- Watch the catalog collections for changes, so the response cache never serves stale data.
 - Configure Cross-Origin Resource Sharing (CORS) settings.
 - Include routers for various resources (e.g., models, brands, colors, etc.).
 - Start the FastAPI application using Uvicorn when executed directly.
@@ -18,6 +22,7 @@ This file simply connects those routers to the FastAPI application.
 # External Library imports
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import Response
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from dotenv import load_dotenv
 import os
@@ -33,10 +38,42 @@ from src.routers import (
     insurances_router,
     accessories_router
 )
+from src.database_management import open_mongodb_client, close_mongodb_client, get_pool_statistics
+from src.cache_management import (
+    response_cache,
+    change_stream_watcher,
+    RESPONSE_CACHE_CHANGE_STREAM_ENABLED
+)
+from src.metrics_management import HttpMetricsMiddleware, get_metrics_response, register_statistics
+from src.tracing_management import HttpTracingMiddleware, shutdown_tracing
+from src.logger_tool import logger
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Lifespan function to handle startup and shutdown events.
+
+    Opens the application-scoped MongoDB client on startup, so every request shares
+    its connection pool, and closes it again when the application shuts down.
+    The change stream watcher of the response cache runs for the lifetime of the application.
+    """
+    open_mongodb_client()
+    if RESPONSE_CACHE_CHANGE_STREAM_ENABLED:
+        change_stream_watcher.start()
+    logger.info("Customer Microservice is starting up...")
+
+    # Yield control to the application
+    yield
+
+    await change_stream_watcher.stop()
+    await close_mongodb_client()
+    shutdown_tracing()
 
 
 # Initialize the FastAPI application
 app = FastAPI(
+    lifespan=lifespan,
     title="Customer Microservice API",
     description="Public API for retrieving available car models, brands, colors, accessories, and insurances in the KEA Cars system. Provides read-only access to non-critical data for customers. No authentication required."
 )
@@ -47,10 +84,24 @@ CORS_SETTINGS = {
     "allow_credentials": True,
     "allow_methods": ["*"],  # Allow all HTTP methods
     "allow_headers": ["*"],  # Allow all headers
+    "expose_headers": ["ETag"],  # Allow browsers to read the ETag of cached responses
 }
 
 # Add CORS middleware to the application
 app.add_middleware(CORSMiddleware, **CORS_SETTINGS)
+# Count the requests and observe their latency per route
+app.add_middleware(HttpMetricsMiddleware)
+# Trace the requests, continuing the trace of the caller if it sent a traceparent header
+app.add_middleware(HttpTracingMiddleware)
+
+# Expose the statistics of the connection pool, of the response cache and of its change stream watcher as metrics
+register_statistics("mongodb_pool", get_pool_statistics, counters=("total_checkouts", "failed_checkouts"))
+register_statistics(
+    "response_cache",
+    response_cache.statistics,
+    counters=("hits", "misses", "coalesced", "not_modified", "invalidations")
+)
+register_statistics("response_cache_change_stream", change_stream_watcher.statistics, counters=("changes",))
 
 # Include the Router endpoints in the main FastAPI app
 # Each router corresponds to a specific resource (e.g., models, brands, etc.)
@@ -66,6 +117,12 @@ async def favicon():
     return Response(status_code=204)
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Returns the metrics of the service in the Prometheus text format."""
+    return get_metrics_response()
+
+
 def start_application():
     """
     Start the Customer Microservice.
@@ -0,0 +1,7 @@
+from .response_cache import ResponseCache, response_cache
+from .change_stream_watcher import (
+    ChangeStreamWatcher,
+    change_stream_watcher,
+    CATALOG_COLLECTIONS,
+    RESPONSE_CACHE_CHANGE_STREAM_ENABLED
+)
@@ -0,0 +1,149 @@
+"""
+**Change Stream Watcher Module**
+
+This module keeps the catalog response cache up to date. The catalog collections are written by the
+synch_microservice, so the customer microservice watches them through a MongoDB change stream and
+invalidates only the cached responses that were read from a changed collection. As long as the
+change stream is open, cached responses can be kept for the long watched time to live.
+
+Change streams are only available on replica sets, so MongoDB must run as (at least) a single-node
+replica set. If the change stream cannot be opened, the cache falls back to the short time to live
+and the watcher keeps retrying in the background.
+
+Environment Variables:
+
+- `RESPONSE_CACHE_CHANGE_STREAM_ENABLED`: Whether the catalog collections are watched (default: `true`).
+- `RESPONSE_CACHE_CHANGE_STREAM_RETRY_SECONDS`: How long to wait before reopening a closed or failed
+  change stream (default: `5`).
+"""
+
+# External Library imports
+import os
+import asyncio
+from typing import Any, Dict, Mapping, Optional, Tuple
+from dotenv import load_dotenv
+from pymongo.errors import OperationFailure, PyMongoError
+
+# Internal library imports
+from src.cache_management.response_cache import ResponseCache, response_cache
+from src.database_management import get_database
+from src.logger_tool import logger
+
+# Load environment variables from a .env file
+load_dotenv()
+
+
+RESPONSE_CACHE_CHANGE_STREAM_ENABLED = os.getenv("RESPONSE_CACHE_CHANGE_STREAM_ENABLED", "true").lower() == "true"
+try:
+    RESPONSE_CACHE_CHANGE_STREAM_RETRY_SECONDS = float(os.getenv("RESPONSE_CACHE_CHANGE_STREAM_RETRY_SECONDS", 5))
+except ValueError:
+    raise ValueError("RESPONSE_CACHE_CHANGE_STREAM_RETRY_SECONDS must be a number.")
+
+CATALOG_COLLECTIONS: Tuple[str, ...] = ("accessories", "brands", "colors", "insurances", "models")
+
+# The error code MongoDB returns when a change stream is opened on a standalone server.
+CHANGE_STREAM_NOT_SUPPORTED_CODE = 40573
+
+
+class ChangeStreamWatcher:
+    """
+    Watches the catalog collections in a background task and invalidates the affected cached responses.
+    """
+
+    def __init__(self, cache: ResponseCache, collections: Tuple[str, ...], retry_seconds: float):
+        """
+        Initializes the `ChangeStreamWatcher` without starting it.
+
+        :param cache: The response cache to keep up to date.
+        :type cache: ResponseCache
+        :param collections: The names of the collections to watch.
+        :type collections: Tuple[str, ...]
+        :param retry_seconds: How long to wait before reopening a closed or failed change stream.
+        :type retry_seconds: float
+        """
+        self.cache = cache
+        self.collections = collections
+        self.retry_seconds = retry_seconds
+        self.changes: int = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """
+        Starts watching the collections in a background task of the running event loop.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="response-cache-change-stream")
+
+    async def stop(self) -> None:
+        """
+        Stops the background task and closes the change stream.
+        """
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self.cache.set_watched(False)
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Returns a snapshot of the watcher statistics.
+
+        :return: The watcher statistics.
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "is_running": self._task is not None,
+            "is_watching": self.cache.is_watched,
+            "changes": self.changes,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._watch()
+                logger.warning("Change stream of the catalog collections was closed, reopening it...")
+            except asyncio.CancelledError:
+                raise
+            except OperationFailure as e:
+                if e.code == CHANGE_STREAM_NOT_SUPPORTED_CODE:
+                    logger.warning("MongoDB is not running as a replica set, so the catalog collections cannot "
+                                   "be watched. Cached responses will expire after "
+                                   f"{self.cache.ttl_seconds} seconds instead.")
+                else:
+                    logger.error(f"Failed to watch the catalog collections: {e}")
+            except PyMongoError as e:
+                logger.error(f"Failed to watch the catalog collections: {e}")
+            self.cache.set_watched(False)
+            await asyncio.sleep(self.retry_seconds)
+
+    async def _watch(self) -> None:
+        pipeline = [{"$match": {"$or": [
+            {"ns.coll": {"$in": list(self.collections)}},
+            # Dropping the database removes every collection and invalidates the change stream.
+            {"operationType": {"$in": ["dropDatabase", "invalidate"]}}
+        ]}}]
+        async with await get_database().watch(pipeline) as change_stream:
+            # The cache is cleared once the change stream is open,
+            # so changes made before this point cannot be served from it.
+            self.cache.set_watched(True)
+            logger.info(f"Watching the catalog collections {', '.join(self.collections)} for changes...")
+            async for change in change_stream:
+                self._apply(change)
+
+    def _apply(self, change: Mapping[str, Any]) -> None:
+        self.changes += 1
+        collection = change.get("ns", {}).get("coll")
+        if collection is None:
+            self.cache.clear()
+        else:
+            self.cache.invalidate((collection,))
+
+
+change_stream_watcher = ChangeStreamWatcher(
+    response_cache,
+    CATALOG_COLLECTIONS,
+    RESPONSE_CACHE_CHANGE_STREAM_RETRY_SECONDS
+)
@@ -0,0 +1,310 @@
+"""
+**Response Cache Module**
+
+This module provides an in-process cache of serialised catalog responses. The catalog
+(brands, colors, accessories, insurances and models) changes rarely but is read on every
+page view, so the JSON bytes of a response are kept in memory and served again without
+going to MongoDB or building pydantic objects.
+
+Environment Variables:
+
+- `RESPONSE_CACHE_TTL_SECONDS`: How long a cached response is served before it is reloaded (default: `60`).
+- `RESPONSE_CACHE_WATCHED_TTL_SECONDS`: The time to live used while the cache is kept up to date
+  by the change stream watcher (default: `3600`).
+- `RESPONSE_CACHE_MAX_ENTRIES`: The maximum number of cached responses, the least recently used
+  response is evicted when the cache is full (default: `1024`).
+
+Key Features:
+
+- Responses are keyed by the route path and the sorted query parameters.
+- Only one request loads a missing response, concurrent requests for the same key wait for it (single-flight).
+- Every cached response has an `ETag`, so a request with a matching `If-None-Match` header gets a `304 Not Modified`.
+- Every cached response is tagged with the collections it was read from, so a change to a collection
+  only invalidates the responses that depend on it.
+"""
+
+# External Library imports
+import os
+import time
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+from dotenv import load_dotenv
+from fastapi import Request, Response, status
+from pydantic_core import to_json
+
+# Load environment variables from a .env file
+load_dotenv()
+
+
+try:
+    RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", 60))
+    RESPONSE_CACHE_WATCHED_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_WATCHED_TTL_SECONDS", 3600))
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 1024))
+except ValueError:
+    raise ValueError("RESPONSE_CACHE_TTL_SECONDS and RESPONSE_CACHE_WATCHED_TTL_SECONDS must be numbers "
+                     "and RESPONSE_CACHE_MAX_ENTRIES must be an integer.")
+
+
+class CachedResponse:
+    """
+    A serialised response body together with its `ETag`, expiry time and source collections.
+    """
+
+    __slots__ = ("body", "etag", "expires_at", "collections")
+
+    def __init__(self, body: bytes, expires_at: float, collections: Tuple[str, ...]):
+        """
+        Initializes the `CachedResponse` and computes the `ETag` of the body.
+
+        :param body: The serialised JSON body of the response.
+        :type body: bytes
+        :param expires_at: The monotonic time at which the response expires.
+        :type expires_at: float
+        :param collections: The names of the collections the response was read from.
+        :type collections: Tuple[str, ...]
+        """
+        self.body = body
+        self.etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        self.expires_at = expires_at
+        self.collections = collections
+
+    def is_expired(self, now: float) -> bool:
+        """
+        Checks whether the response has outlived its time to live.
+
+        :param now: The current monotonic time.
+        :type now: float
+        :return: True if the response is expired, False otherwise.
+        :rtype: bool
+        """
+        return now >= self.expires_at
+
+
+class ResponseCache:
+    """
+    A TTL and LRU bounded cache of serialised responses with single-flight loading.
+
+    The cache is only used from the event loop, so it needs no locking.
+
+    While the cache is watched, a change stream watcher invalidates the affected responses as soon
+    as a collection changes, so responses are kept for the longer `watched_ttl_seconds`. Otherwise
+    the cache can only rely on expiry and falls back to the short `ttl_seconds`.
+    """
+
+    def __init__(self, ttl_seconds: float, watched_ttl_seconds: float, max_entries: int):
+        """
+        Initializes an empty `ResponseCache`.
+
+        :param ttl_seconds: How long a cached response is served before it is reloaded.
+        :type ttl_seconds: float
+        :param watched_ttl_seconds: How long a cached response is served while the cache is watched.
+        :type watched_ttl_seconds: float
+        :param max_entries: The maximum number of cached responses.
+        :type max_entries: int
+        """
+        self.ttl_seconds = ttl_seconds
+        self.watched_ttl_seconds = watched_ttl_seconds
+        self.max_entries = max_entries
+        self.is_watched: bool = False
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._in_flight: Dict[str, Tuple[asyncio.Future, Tuple[str, ...]]] = {}
+        # Bumped whenever a collection is invalidated or the cache is cleared, so a load
+        # that raced with the invalidation does not put its stale result into the cache.
+        self._generations: Dict[str, int] = {}
+        self._epoch: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.not_modified: int = 0
+        self.coalesced: int = 0
+        self.invalidations: int = 0
+
+    @staticmethod
+    def build_key(request: Request) -> str:
+        """
+        Builds the cache key of a request from its path and sorted query parameters.
+
+        :param request: The incoming request.
+        :type request: Request
+        :return: The cache key.
+        :rtype: str
+        """
+        query = "&".join(f"{name}={value}" for name, value in sorted(request.query_params.multi_items()))
+        return f"{request.url.path}?{query}"
+
+    async def get_response(
+            self,
+            request: Request,
+            collections: Tuple[str, ...],
+            callback: Callable[[], Awaitable[Any]]
+    ) -> Response:
+        """
+        Returns the cached response of the request, loading it with the callback on a miss.
+
+        Exceptions raised by the callback, such as the `HTTPException` of a missing ID,
+        are not cached and are raised to every request waiting for the same key.
+
+        :param request: The incoming request.
+        :type request: Request
+        :param collections: The names of the collections the response is read from.
+        :type collections: Tuple[str, ...]
+        :param callback: A coroutine function returning the result to serialise.
+        :type callback: Callable[[], Awaitable[Any]]
+        :return: The response, or a `304 Not Modified` response if the client already has it.
+        :rtype: Response
+        """
+        key = self.build_key(request)
+        cached_response = self._get(key)
+        if cached_response is None:
+            self.misses += 1
+            cached_response = await self._load(key, collections, callback)
+        else:
+            self.hits += 1
+        return self._to_response(request, cached_response)
+
+    def invalidate(self, collections: Iterable[str]) -> int:
+        """
+        Removes the cached responses that were read from any of the given collections.
+
+        Loads of those responses that are still in flight will not be cached,
+        and later requests will not wait for them.
+
+        :param collections: The names of the changed collections.
+        :type collections: Iterable[str]
+        :return: The number of removed responses.
+        :rtype: int
+        """
+        changed = set(collections)
+        for collection in changed:
+            self._generations[collection] = self._generations.get(collection, 0) + 1
+        stale_keys = [key for key, cached_response in self._entries.items()
+                      if changed.intersection(cached_response.collections)]
+        for key in stale_keys:
+            del self._entries[key]
+        # Let the next request start a fresh load instead of waiting for a stale one.
+        for key in [key for key, (_, key_collections) in self._in_flight.items()
+                    if changed.intersection(key_collections)]:
+            del self._in_flight[key]
+        self.invalidations += len(stale_keys)
+        return len(stale_keys)
+
+    def clear(self) -> None:
+        """
+        Removes every cached response and stops caching the loads that are in flight.
+        """
+        self._epoch += 1
+        self._entries.clear()
+        self._in_flight.clear()
+
+    def set_watched(self, is_watched: bool) -> None:
+        """
+        Marks whether the cache is kept up to date by the change stream watcher.
+
+        The cache is cleared whenever this changes, because changes that happened while
+        it was not watched were missed, and cached responses would otherwise keep
+        the long watched time to live after the watcher has stopped.
+
+        :param is_watched: True if the change stream is open, False otherwise.
+        :type is_watched: bool
+        """
+        if is_watched != self.is_watched:
+            self.clear()
+        self.is_watched = is_watched
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Returns a snapshot of the cache statistics.
+
+        :return: The cache statistics.
+        :rtype: Dict[str, Any]
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.watched_ttl_seconds if self.is_watched else self.ttl_seconds,
+            "is_watched": self.is_watched,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "not_modified": self.not_modified,
+            "invalidations": self.invalidations,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def _get(self, key: str) -> Optional[CachedResponse]:
+        cached_response = self._entries.get(key)
+        if cached_response is None:
+            return None
+        if cached_response.is_expired(time.monotonic()):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return cached_response
+
+    def _put(self, key: str, cached_response: CachedResponse) -> None:
+        self._entries[key] = cached_response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _generation_of(self, collections: Tuple[str, ...]) -> Tuple[int, ...]:
+        return (self._epoch, *(self._generations.get(collection, 0) for collection in collections))
+
+    async def _load(
+            self,
+            key: str,
+            collections: Tuple[str, ...],
+            callback: Callable[[], Awaitable[Any]]
+    ) -> CachedResponse:
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            # Another request is already loading this key, so wait for its result instead.
+            self.coalesced += 1
+            return await asyncio.shield(in_flight[0])
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = (future, collections)
+        generation = self._generation_of(collections)
+        try:
+            result = await callback()
+            ttl_seconds = self.watched_ttl_seconds if self.is_watched else self.ttl_seconds
+            cached_response = CachedResponse(to_json(result), time.monotonic() + ttl_seconds, collections)
+            if self._generation_of(collections) == generation:
+                self._put(key, cached_response)
+            future.set_result(cached_response)
+            return cached_response
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved, in case no other request was waiting for it.
+            future.exception()
+            raise
+        finally:
+            if self._in_flight.get(key, (None,))[0] is future:
+                del self._in_flight[key]
+
+    def _to_response(self, request: Request, cached_response: CachedResponse) -> Response:
+        headers = {"ETag": cached_response.etag, "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), cached_response.etag):
+            self.not_modified += 1
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=cached_response.body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+
+response_cache = ResponseCache(RESPONSE_CACHE_TTL_SECONDS, RESPONSE_CACHE_WATCHED_TTL_SECONDS, RESPONSE_CACHE_MAX_ENTRIES)
@@ -1 +1,8 @@
-from .mongodb_connection import get_mongodb, Database
+from .mongodb_connection import (
+    get_mongodb,
+    get_database,
+    open_mongodb_client,
+    close_mongodb_client,
+    get_pool_statistics,
+    Database
+)
@@ -2,7 +2,10 @@
 **MongoDB Connection Module**
 
 This module provides functionality to connect to a MongoDB database using environment variables
-for configuration. It includes a context manager to ensure proper handling of the database connection.
+for configuration. A single `AsyncMongoClient` is shared by the whole process, so every request reuses
+the client's connection pool instead of paying for connection setup, authentication and server
+selection on its own. The client uses PyMongo's asynchronous API, so database round trips are awaited
+and do not block the event loop while other requests are being served.
 
 Environment Variables:
 
@@ -11,20 +14,35 @@ Environment Variables:
 - `MONGO_DB_NAME`: The name of the MongoDB database to connect to.
 - `MONGO_DB_APPLICATION_USERNAME`: The username for read-only access to the database.
 - `MONGO_DB_APPLICATION_PASSWORD`: The password for the read-only user.
+- `MONGO_DB_MAX_POOL_SIZE`: The maximum number of pooled connections (default: `100`).
+- `MONGO_DB_MIN_POOL_SIZE`: The number of connections kept open even when idle (default: `0`).
+- `MONGO_DB_WAIT_QUEUE_TIMEOUT_MS`: How long a request may wait for a free pooled connection (default: `10000`).
 
 Key Features:
 
 - Securely loads environment variables using `dotenv`.
-- Provides a reusable context manager for database connections.
+- Provides one application-scoped client, opened and closed by the application lifespan.
+- Collects connection pool statistics, such as how long requests wait for a connection.
 """
 
 import os
+import threading
 from dotenv import load_dotenv
-from contextlib import contextmanager
-from pymongo import MongoClient
-from pymongo.database import Database
-from typing import Generator
+from contextlib import asynccontextmanager
+from pymongo.asynchronous.mongo_client import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase as Database
+from pymongo.monitoring import (
+    ConnectionPoolListener,
+    ConnectionCreatedEvent,
+    ConnectionClosedEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckedInEvent,
+    ConnectionCheckOutFailedEvent
+)
+from typing import AsyncGenerator, Optional, Dict, Any
 from src.logger_tool import logger
+from src.metrics_management import command_metrics
+from src.tracing_management import command_tracing
 
 # Load environment variables from a .env file
 load_dotenv()
@@ -39,53 +57,185 @@ except ValueError:
 MONGO_DB_NAME = os.getenv("MONGO_DB_NAME")
 MONGO_DB_APPLICATION_USERNAME = os.getenv("MONGO_DB_APPLICATION_USERNAME")
 MONGO_DB_APPLICATION_PASSWORD = os.getenv("MONGO_DB_APPLICATION_PASSWORD")
+try:
+    MONGO_DB_MAX_POOL_SIZE = int(os.getenv("MONGO_DB_MAX_POOL_SIZE", 100))
+    MONGO_DB_MIN_POOL_SIZE = int(os.getenv("MONGO_DB_MIN_POOL_SIZE", 0))
+    MONGO_DB_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGO_DB_WAIT_QUEUE_TIMEOUT_MS", 10000))
+except ValueError:
+    raise ValueError("MONGO_DB_MAX_POOL_SIZE, MONGO_DB_MIN_POOL_SIZE and MONGO_DB_WAIT_QUEUE_TIMEOUT_MS must be integers.")
+
+
+class ConnectionPoolStatistics(ConnectionPoolListener):
+    """
+    Listens to the connection pool events of the `AsyncMongoClient` and keeps running totals of them.
+
+    The statistics make it possible to size `MONGO_DB_MAX_POOL_SIZE` and `MONGO_DB_MIN_POOL_SIZE`
+    from real numbers, most importantly how long requests have to wait for a free connection.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.open_connections: int = 0
+        self.checked_out_connections: int = 0
+        self.total_checkouts: int = 0
+        self.failed_checkouts: int = 0
+        self.total_wait_seconds: float = 0.0
+        self.max_wait_seconds: float = 0.0
+
+    def connection_created(self, event: ConnectionCreatedEvent) -> None:
+        with self._lock:
+            self.open_connections += 1
+
+    def connection_closed(self, event: ConnectionClosedEvent) -> None:
+        with self._lock:
+            self.open_connections -= 1
+
+    def connection_checked_out(self, event: ConnectionCheckedOutEvent) -> None:
+        waited_seconds = getattr(event, "duration", 0.0) or 0.0
+        with self._lock:
+            self.checked_out_connections += 1
+            self.total_checkouts += 1
+            self.total_wait_seconds += waited_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, waited_seconds)
+
+    def connection_checked_in(self, event: ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self.checked_out_connections -= 1
+
+    def connection_check_out_failed(self, event: ConnectionCheckOutFailedEvent) -> None:
+        with self._lock:
+            self.failed_checkouts += 1
+
+    # The remaining pool events are not needed for the statistics.
+    def pool_created(self, event) -> None:
+        pass
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        pass
+
+    def pool_closed(self, event) -> None:
+        pass
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_check_out_started(self, event) -> None:
+        pass
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Returns a snapshot of the collected connection pool statistics.
+
+        :return: The connection pool statistics.
+        :rtype: Dict[str, Any]
+        """
+        with self._lock:
+            average_wait_seconds = self.total_wait_seconds / self.total_checkouts if self.total_checkouts else 0.0
+            return {
+                "max_pool_size": MONGO_DB_MAX_POOL_SIZE,
+                "min_pool_size": MONGO_DB_MIN_POOL_SIZE,
+                "open_connections": self.open_connections,
+                "checked_out_connections": self.checked_out_connections,
+                "total_checkouts": self.total_checkouts,
+                "failed_checkouts": self.failed_checkouts,
+                "average_wait_seconds": round(average_wait_seconds, 6),
+                "max_wait_seconds": round(self.max_wait_seconds, 6),
+            }
+
+
+pool_statistics = ConnectionPoolStatistics()
+
+_client: Optional[AsyncMongoClient] = None
+_client_lock = threading.Lock()
+
+
+def open_mongodb_client() -> AsyncMongoClient:
+    """
+    Opens the application-scoped `AsyncMongoClient`, or returns it if it is already open.
+
+    The client is normally opened once by the lifespan of the FastAPI application,
+    but will be opened lazily on first use if that has not happened. Creating the client
+    does not perform any I/O, connections are established on first use.
+
+    :return: The shared `AsyncMongoClient`.
+    :rtype: pymongo.AsyncMongoClient
+    """
+    global _client
+    if _client is not None:
+        return _client
+    with _client_lock:
+        if _client is None:
+            logger.info(f"Opening shared MongoDB client to {MONGO_DB_HOST}:{MONGO_DB_PORT} "
+                        f"with maxPoolSize={MONGO_DB_MAX_POOL_SIZE} and minPoolSize={MONGO_DB_MIN_POOL_SIZE}...")
+            _client = AsyncMongoClient(
+                host=MONGO_DB_HOST,
+                port=MONGO_DB_PORT,
+                username=MONGO_DB_APPLICATION_USERNAME,
+                password=MONGO_DB_APPLICATION_PASSWORD,
+                authSource=MONGO_DB_NAME,
+                connectTimeoutMS=8000,  # 8 seconds timeout for connection establishment
+                serverSelectionTimeoutMS=8000,  # 8 seconds timeout for server selection
+                maxPoolSize=MONGO_DB_MAX_POOL_SIZE,
+                minPoolSize=MONGO_DB_MIN_POOL_SIZE,
+                waitQueueTimeoutMS=MONGO_DB_WAIT_QUEUE_TIMEOUT_MS,
+                event_listeners=[pool_statistics, command_metrics, command_tracing]
+            )
+    return _client
+
+
+async def close_mongodb_client() -> None:
+    """
+    Closes the application-scoped `AsyncMongoClient` and all of its pooled connections.
+    """
+    global _client
+    with _client_lock:
+        client, _client = _client, None
+    if client is not None:
+        await client.close()
+        logger.info("Shared MongoDB client closed.")
+
+
+def get_database() -> Database:
+    """
+    Returns the shared asynchronous MongoDB `Database` handle.
+
+    :return: A MongoDB `AsyncDatabase` object for interacting with the specified database.
+    :rtype: pymongo.asynchronous.database.AsyncDatabase
+    """
+    return open_mongodb_client().get_database(MONGO_DB_NAME)
+
+
+def get_pool_statistics() -> Dict[str, Any]:
+    """
+    Returns the statistics collected for the connection pool of the shared `AsyncMongoClient`.
+
+    :return: The connection pool statistics.
+    :rtype: Dict[str, Any]
+    """
+    return pool_statistics.as_dict()
 
 
-@contextmanager
-def get_mongodb() -> Generator[Database, None, None]:
+@asynccontextmanager
+async def get_mongodb() -> AsyncGenerator[Database, None]:
     """
-    Provides a MongoDB database connection using a context manager.
+    Provides the shared MongoDB database handle using a context manager.
 
-    A context manager ensures that the database connection is properly opened and closed,
-    even if an exception occurs during its usage. This prevents resource leaks and ensures
-    that the connection is always released back to the connection pool.
+    The underlying client is shared by the whole process and is not closed when the
+    context exits; it is closed by `close_mongodb_client` when the application shuts down.
 
     Example Usage:
-        >>> with get_mongodb() as db:
+        >>> async with get_mongodb() as db:
         >>>     collection = db.get_collection("example_collection")
-        >>>     data = collection.find_one({"key": "value"})
+        >>>     data = await collection.find_one({"key": "value"})
 
-    :return: A MongoDB `Database` object for interacting with the specified database.
-    :rtype: pymongo.database.Database
+    :return: A MongoDB `AsyncDatabase` object for interacting with the specified database.
+    :rtype: pymongo.asynchronous.database.AsyncDatabase
     """
-    #connection_string = f"mongodb://{MONGO_DB_APPLICATION_USERNAME}:{MONGO_DB_APPLICATION_PASSWORD}@{MONGO_DB_HOST}:{MONGO_DB_PORT}/{MONGO_DB_NAME}?authSource=admin"
-
-    #client = MongoClient(
-    #    connection_string,
-    #    connectTimeoutMS=8000,  # 8 seconds timeout for connection establishment
-    #    serverSelectionTimeoutMS=8000  # 8 seconds timeout for server selection
-    #)
-    
-    client = MongoClient(
-        host=MONGO_DB_HOST, 
-        port=MONGO_DB_PORT,
-        username=MONGO_DB_APPLICATION_USERNAME,
-        password=MONGO_DB_APPLICATION_PASSWORD,
-        authSource=MONGO_DB_NAME,
-        connectTimeoutMS=8000,  # 8 seconds timeout for connection establishment
-        serverSelectionTimeoutMS=8000  # 8 seconds timeout for server selection
-    )
     try:
-        # Attempt to connect to the database
-        db = client.get_database(MONGO_DB_NAME)
-        # Perform a simple operation to verify the connection
-        #client.admin.command('ping')
-        logger.info(f"Successfully connected to MongoDB at {MONGO_DB_HOST}:{MONGO_DB_PORT}")
-        yield db
+        yield get_database()
     except Exception as e:
-        logger.error(f"Failed to connect to MongoDB: {e}")
+        logger.error(f"Failed to use MongoDB: {e}")
         raise
-    finally:
-        client.close()
-        logger.info("MongoDB connection closed.")
-        
\ No newline at end of file
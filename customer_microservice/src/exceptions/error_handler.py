@@ -12,6 +12,7 @@ Key Responsibilities:
 """
 
 # External Library imports
+import asyncio
 from typing import Callable
 from fastapi import HTTPException, status
 
@@ -20,12 +21,13 @@ from src.logger_tool import logger
 from src.exceptions.database_exceptions import UnableToFindIdError
 
 
-def handle_http_exception(error_message: str, callback: Callable):
+async def handle_http_exception(error_message: str, callback: Callable):
     """
     Handles exceptions raised by a service function and converts them into HTTP exceptions.
 
     This function executes a callback function (typically a service operation) and catches
-    any exceptions raised during its execution. It logs the error and raises an appropriate
+    any exceptions raised during its execution. If the callback returns a coroutine, as the
+    asynchronous service functions do, it is awaited. It logs the error and raises an appropriate
     HTTP exception for the client.
 
     :param error_message: A descriptive error message to include in the HTTP exception.
@@ -37,7 +39,10 @@ def handle_http_exception(error_message: str, callback: Callable):
                            appropriate status code and error message.
     """
     try:
-        return callback()
+        result = callback()
+        if asyncio.iscoroutine(result):
+            return await result
+        return result
 
     except UnableToFindIdError as e:
         log_error(error_message, e)
@@ -0,0 +1,3 @@
+from .statistics_collector import StatisticsCollector, register_statistics
+from .http_metrics import HttpMetricsMiddleware, get_metrics_response
+from .database_metrics import command_metrics
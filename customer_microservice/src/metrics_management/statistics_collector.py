@@ -0,0 +1,114 @@
+# External Library imports
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+from prometheus_client import REGISTRY
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+
+# Internal Library imports
+from src.logger_tool import logger
+
+
+class StatisticsCollector(Collector):
+    """
+    Exposes the numbers of a statistics dictionary, such as those of the caches and connection pools, as metrics.
+
+    The statistics are only read when Prometheus scrapes the service, so the classes keeping them
+    stay as they are and nothing is paid between scrapes. Every number becomes a gauge named
+    `<namespace>_<statistic>`, except the running totals named in `counters`, which become counters.
+    Values that are not numbers are skipped.
+
+    With a `label`, the statistics are a dictionary of statistics dictionaries,
+    such as the pool statistics per database user, and their keys become the values of the label.
+    """
+
+    def __init__(
+            self,
+            namespace: str,
+            get_statistics: Callable[[], Dict[str, Any]],
+            counters: Iterable[str] = (),
+            label: Optional[str] = None
+    ):
+        """
+        :param namespace: The prefix of the metric names, such as 'mongodb_pool'.
+        :type namespace: str
+        :param get_statistics: Returns a snapshot of the statistics.
+        :type get_statistics: Callable[[], Dict[str, Any]]
+        :param counters: The statistics that are running totals.
+        :type counters: Iterable[str]
+        :param label: The name of the label of nested statistics, or None if they are not nested.
+        :type label: Optional[str]
+        """
+        self.namespace = namespace
+        self.get_statistics = get_statistics
+        self.counters = frozenset(counters)
+        self.label = label
+
+    def describe(self) -> Iterator[Metric]:
+        # The statistics are not read when the collector is registered, their names are only known once they exist.
+        return iter(())
+
+    def collect(self) -> Iterator[Metric]:
+        try:
+            statistics = self.get_statistics()
+        except Exception as e:
+            logger.warning(f"Failed to collect the {self.namespace} statistics: {e}")
+            return
+        labelled_statistics = statistics if self.label is not None else {None: statistics}
+        label_names = [self.label] if self.label is not None else []
+
+        families: Dict[str, Metric] = {}
+        for label_value, values in labelled_statistics.items():
+            if not isinstance(values, dict):
+                continue
+            for name, value in values.items():
+                if isinstance(value, bool):
+                    value = int(value)
+                if not isinstance(value, (int, float)):
+                    continue
+                family = families.get(name)
+                if family is None:
+                    metric_family = CounterMetricFamily if name in self.counters else GaugeMetricFamily
+                    family = metric_family(
+                        f"{self.namespace}_{name}",
+                        f"The {name.replace('_', ' ')} of the {self.namespace.replace('_', ' ')}.",
+                        labels=label_names
+                    )
+                    families[name] = family
+                family.add_metric([str(label_value)] if self.label is not None else [], value)
+        yield from families.values()
+
+
+_registered_collectors: Dict[str, StatisticsCollector] = {}
+_registered_collectors_lock = threading.Lock()
+
+
+def register_statistics(
+        namespace: str,
+        get_statistics: Callable[[], Dict[str, Any]],
+        counters: Iterable[str] = (),
+        label: Optional[str] = None
+) -> StatisticsCollector:
+    """
+    Registers a `StatisticsCollector` of the statistics with the default Prometheus registry.
+
+    A namespace is only registered once per process, also when the module registering it is imported again.
+
+    :param namespace: The prefix of the metric names.
+    :type namespace: str
+    :param get_statistics: Returns a snapshot of the statistics.
+    :type get_statistics: Callable[[], Dict[str, Any]]
+    :param counters: The statistics that are running totals.
+    :type counters: Iterable[str]
+    :param label: The name of the label of nested statistics, or None if they are not nested.
+    :type label: Optional[str]
+    :return: The registered collector.
+    :rtype: StatisticsCollector
+    """
+    with _registered_collectors_lock:
+        collector = _registered_collectors.get(namespace)
+        if collector is None:
+            collector = StatisticsCollector(namespace, get_statistics, counters, label)
+            REGISTRY.register(collector)
+            _registered_collectors[namespace] = collector
+        return collector
@@ -13,7 +13,7 @@ Key Responsibilities:
 
 # External Library imports
 from typing import Optional, List, Dict, Any
-from pymongo.cursor import Cursor
+from pymongo.asynchronous.cursor import AsyncCursor
 
 # Internal library imports
 from src.entities import AccessoryEntity
@@ -28,7 +28,7 @@ class AccessoryRepository(BaseRepository):
     including retrieving all accessories or a specific accessory by its ID.
     """
 
-    def get_all(self, limit: Optional[int] = None) -> List[AccessoryEntity]:
+    async def get_all(self, limit: Optional[int] = None) -> List[AccessoryEntity]:
         """
         Retrieves all accessories from the database, with an optional limit.
 
@@ -42,15 +42,15 @@ class AccessoryRepository(BaseRepository):
         :rtype: List[AccessoryEntity]
         """
         accessories_collection = self.get_accessories_collection()
-        accessories_query: Cursor[Dict[str, Any]] = accessories_collection.find()
+        accessories_query: AsyncCursor[Dict[str, Any]] = accessories_collection.find()
         
         if self.limit_is_valid(limit):
             accessories_query = accessories_query.limit(limit)
         
-        return [AccessoryEntity(**accessory) for accessory in accessories_query]
+        return [AccessoryEntity(**accessory) async for accessory in accessories_query]
 
 
-    def get_by_id(self, accessory_id: str) -> Optional[AccessoryEntity]:
+    async def get_by_id(self, accessory_id: str) -> Optional[AccessoryEntity]:
         """
         Retrieves a specific accessory by its ID.
 
@@ -64,7 +64,7 @@ class AccessoryRepository(BaseRepository):
         :rtype: AccessoryEntity | None
         """
         accessories_collection = self.get_accessories_collection()
-        accessory_query = accessories_collection.find_one({"_id": accessory_id})
+        accessory_query = await accessories_collection.find_one({"_id": accessory_id})
         
         if accessory_query is not None:
             return AccessoryEntity(**accessory_query)
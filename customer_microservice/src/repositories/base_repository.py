@@ -13,7 +13,7 @@ Key Responsibilities:
 
 # External Library imports
 from typing import Optional
-from pymongo.collection import Collection
+from pymongo.asynchronous.collection import AsyncCollection
 
 # Internal library imports
 from src.database_management import Database
@@ -55,47 +55,47 @@ class BaseRepository:
         """
         return limit is not None and isinstance(limit, int) and limit > 0
 
-    def get_models_collection(self) -> Collection:
+    def get_models_collection(self) -> AsyncCollection:
         """
         Retrieves the MongoDB collection for car models.
 
         :return: The MongoDB collection for car models.
-        :rtype: Collection
+        :rtype: AsyncCollection
         """
         return self.database.get_collection("models")
 
-    def get_brands_collection(self) -> Collection:
+    def get_brands_collection(self) -> AsyncCollection:
         """
         Retrieves the MongoDB collection for car brands.
 
         :return: The MongoDB collection for car brands.
-        :rtype: Collection
+        :rtype: AsyncCollection
         """
         return self.database.get_collection("brands")
 
-    def get_colors_collection(self) -> Collection:
+    def get_colors_collection(self) -> AsyncCollection:
         """
         Retrieves the MongoDB collection for colors.
 
         :return: The MongoDB collection for colors.
-        :rtype: Collection
+        :rtype: AsyncCollection
         """
         return self.database.get_collection("colors")
 
-    def get_accessories_collection(self) -> Collection:
+    def get_accessories_collection(self) -> AsyncCollection:
         """
         Retrieves the MongoDB collection for accessories.
 
         :return: The MongoDB collection for accessories.
-        :rtype: Collection
+        :rtype: AsyncCollection
         """
         return self.database.get_collection("accessories")
 
-    def get_insurances_collection(self) -> Collection:
+    def get_insurances_collection(self) -> AsyncCollection:
         """
         Retrieves the MongoDB collection for insurances.
 
         :return: The MongoDB collection for insurances.
-        :rtype: Collection
+        :rtype: AsyncCollection
         """
         return self.database.get_collection("insurances")
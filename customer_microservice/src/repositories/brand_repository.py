@@ -13,7 +13,7 @@ Key Responsibilities:
 
 # External Library imports
 from typing import Optional, List, Dict, Any
-from pymongo.cursor import Cursor
+from pymongo.asynchronous.cursor import AsyncCursor
 
 # Internal library imports
 from src.entities import BrandEntity
@@ -28,7 +28,7 @@ class BrandRepository(BaseRepository):
     including retrieving all brands or a specific car brand by its ID.
     """
 
-    def get_all(self, limit: Optional[int] = None) -> List[BrandEntity]:
+    async def get_all(self, limit: Optional[int] = None) -> List[BrandEntity]:
         """
         Retrieves all car brands from the database, with an optional limit.
 
@@ -42,14 +42,14 @@ class BrandRepository(BaseRepository):
         :rtype: List[BrandEntity]
         """
         brands_collection = self.get_brands_collection()
-        brands_query: Cursor[Dict[str, Any]] = brands_collection.find()
+        brands_query: AsyncCursor[Dict[str, Any]] = brands_collection.find()
         
         if self.limit_is_valid(limit):
             brands_query = brands_query.limit(limit)
         
-        return [BrandEntity(**brand) for brand in brands_query]
+        return [BrandEntity(**brand) async for brand in brands_query]
 
-    def get_by_id(self, brand_id: str) -> Optional[BrandEntity]:
+    async def get_by_id(self, brand_id: str) -> Optional[BrandEntity]:
         """
         Retrieves a specific car brand by its ID.
 
@@ -62,7 +62,7 @@ class BrandRepository(BaseRepository):
         :rtype: BrandEntity | None
         """
         brands_collection = self.get_brands_collection()
-        brand_query = brands_collection.find_one({"_id": brand_id})
+        brand_query = await brands_collection.find_one({"_id": brand_id})
         
         if brand_query is not None:
             return BrandEntity(**brand_query)
@@ -13,7 +13,7 @@ Key Responsibilities:
 
 # External Library imports
 from typing import Optional, List, Dict, Any
-from pymongo.cursor import Cursor
+from pymongo.asynchronous.cursor import AsyncCursor
 
 # Internal library imports
 from src.entities import ColorEntity
@@ -28,7 +28,7 @@ class ColorRepository(BaseRepository):
     including retrieving all colors or a specific color by its ID.
     """
 
-    def get_all(self, limit: Optional[int] = None) -> List[ColorEntity]:
+    async def get_all(self, limit: Optional[int] = None) -> List[ColorEntity]:
         """
         Retrieves all colors from the database, with an optional limit.
 
@@ -42,14 +42,14 @@ class ColorRepository(BaseRepository):
         :rtype: List[ColorEntity]
         """
         colors_collection = self.get_colors_collection()
-        colors_query: Cursor[Dict[str, Any]] = colors_collection.find()
+        colors_query: AsyncCursor[Dict[str, Any]] = colors_collection.find()
         
         if self.limit_is_valid(limit):
             colors_query = colors_query.limit(limit)
         
-        return [ColorEntity(**color) for color in colors_query]
+        return [ColorEntity(**color) async for color in colors_query]
 
-    def get_by_id(self, color_id: str) -> Optional[ColorEntity]:
+    async def get_by_id(self, color_id: str) -> Optional[ColorEntity]:
         """
         Retrieves a specific color by its ID.
 
@@ -62,7 +62,7 @@ class ColorRepository(BaseRepository):
         :rtype: ColorEntity | None
         """
         colors_collection = self.get_colors_collection()
-        color_query = colors_collection.find_one({"_id": color_id})
+        color_query = await colors_collection.find_one({"_id": color_id})
         
         if color_query is not None:
             return ColorEntity(**color_query)
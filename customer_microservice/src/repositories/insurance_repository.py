@@ -13,7 +13,7 @@ Key Responsibilities:
 
 # External Library imports
 from typing import Optional, List, Dict, Any
-from pymongo.cursor import Cursor
+from pymongo.asynchronous.cursor import AsyncCursor
 
 # Internal library imports
 from src.entities import InsuranceEntity
@@ -28,7 +28,7 @@ class InsuranceRepository(BaseRepository):
     including retrieving all insurances or a specific insurance by its ID.
     """
 
-    def get_all(self, limit: Optional[int] = None) -> List[InsuranceEntity]:
+    async def get_all(self, limit: Optional[int] = None) -> List[InsuranceEntity]:
         """
         Retrieves all insurances from the database, with an optional limit.
 
@@ -42,14 +42,14 @@ class InsuranceRepository(BaseRepository):
         :rtype: List[InsuranceEntity]
         """
         insurances_collection = self.get_insurances_collection()
-        insurances_query: Cursor[Dict[str, Any]] = insurances_collection.find()
+        insurances_query: AsyncCursor[Dict[str, Any]] = insurances_collection.find()
         
         if self.limit_is_valid(limit):
             insurances_query = insurances_query.limit(limit)
         
-        return [InsuranceEntity(**insurance) for insurance in insurances_query]
+        return [InsuranceEntity(**insurance) async for insurance in insurances_query]
 
-    def get_by_id(self, insurance_id: str) -> Optional[InsuranceEntity]:
+    async def get_by_id(self, insurance_id: str) -> Optional[InsuranceEntity]:
         """
         Retrieves a specific insurance by its ID.
 
@@ -63,7 +63,7 @@ class InsuranceRepository(BaseRepository):
         :rtype: InsuranceEntity | None
         """
         insurances_collection = self.get_insurances_collection()
-        insurance_query = insurances_collection.find_one({"_id": insurance_id})
+        insurance_query = await insurances_collection.find_one({"_id": insurance_id})
         
         if insurance_query is not None:
             return InsuranceEntity(**insurance_query)
@@ -13,7 +13,7 @@ Key Responsibilities:
 
 # External Library imports
 from typing import Optional, List, Dict, Any
-from pymongo.cursor import Cursor
+from pymongo.asynchronous.cursor import AsyncCursor
 
 # Internal library imports
 from src.repositories.base_repository import BaseRepository
@@ -28,10 +28,10 @@ class ModelRepository(BaseRepository):
     including retrieving all models or a specific model by its ID.
     """
 
-    def get_all(self,
-                brand_entity: Optional[BrandEntity] = None,
-                limit: Optional[int] = None
-                ) -> List[ModelEntity]:
+    async def get_all(self,
+                      brand_entity: Optional[BrandEntity] = None,
+                      limit: Optional[int] = None
+                      ) -> List[ModelEntity]:
         """
         Retrieves all car models from the database, with optional filters and limits.
 
@@ -48,7 +48,7 @@ class ModelRepository(BaseRepository):
         :rtype: List[ModelEntity]
         """
         models_collection = self.get_models_collection()
-        models_query: Cursor[Dict[str, Any]]
+        models_query: AsyncCursor[Dict[str, Any]]
         
         if brand_entity is not None and isinstance(brand_entity, BrandEntity):
             models_query = models_collection.find({"brand._id": brand_entity.id})
@@ -59,7 +59,7 @@ class ModelRepository(BaseRepository):
             models_query = models_query.limit(limit)
         
         retrieved_models: List[ModelEntity] = []
-        for model in models_query:
+        async for model in models_query:
             brand = BrandEntity(**model.get("brand"))
             colors = [ColorEntity(**color) for color in model.get("colors")]
             model.update({"brand": brand, "colors": colors})
@@ -68,7 +68,7 @@ class ModelRepository(BaseRepository):
 
         return retrieved_models
 
-    def get_by_id(self, model_id: str) -> Optional[ModelEntity]:
+    async def get_by_id(self, model_id: str) -> Optional[ModelEntity]:
         """
         Retrieves a specific car model by its ID.
 
@@ -81,7 +81,7 @@ class ModelRepository(BaseRepository):
         :rtype: ModelEntity | None
         """
         models_collection = self.get_models_collection()
-        model_query = models_collection.find_one({"_id": model_id})
+        model_query = await models_collection.find_one({"_id": model_id})
         if model_query is not None:
             return ModelEntity(**model_query)
         return None
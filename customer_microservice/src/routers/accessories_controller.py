@@ -13,21 +13,21 @@ Key Responsibilities:
 # External Library imports
 from uuid import UUID
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Request
 
 # Internal library imports
 from src.exceptions import handle_http_exception
+from src.cache_management import response_cache
 from src.resources import AccessoryReturnResource
 from src.services import accessories_service as service
-from src.database_management import Database, get_mongodb
+from src.database_management import Database, get_database
 
 
 router: APIRouter = APIRouter()
 
 
-def get_db():
-    with get_mongodb() as database:
-        yield database
+async def get_db() -> Database:
+    return get_database()
 
 
 @router.get(
@@ -46,6 +46,7 @@ def get_db():
     """
 )
 async def get_accessories(
+        request: Request,
         limit: Optional[int] = Query(
             default=None, ge=1,
             description="""Set a limit for the amount of accessories that is returned."""
@@ -55,6 +56,8 @@ async def get_accessories(
     """
     Retrieves a list of accessories from the database.
 
+    :param request: The incoming request, used as the key of the response cache.
+    :type request: Request
     :param limit: The maximum number of accessories to retrieve (optional).
     :type limit: int | None
     :param customer_database: The database connection dependency.
@@ -62,11 +65,15 @@ async def get_accessories(
     :return: A list of accessories as `AccessoryReturnResource`.
     :rtype: List[AccessoryReturnResource]
     """
-    return handle_http_exception(
-        error_message="Failed to get accessories from the Customer database",
-        callback=lambda: service.get_all(
-            database=customer_database,
-            accessory_limit=limit
+    return await response_cache.get_response(
+        request,
+        collections=("accessories",),
+        callback=lambda: handle_http_exception(
+            error_message="Failed to get accessories from the Customer database",
+            callback=lambda: service.get_all(
+                database=customer_database,
+                accessory_limit=limit
+            )
         )
     )
 
@@ -88,6 +95,7 @@ async def get_accessories(
     """
 )
 async def get_accessory(
+        request: Request,
         accessory_id: UUID = Path(
             default=...,
             description="""The UUID of the accessory to retrieve."""
@@ -97,6 +105,8 @@ async def get_accessory(
     """
     Retrieves a specific accessory by its UUID.
 
+    :param request: The incoming request, used as the key of the response cache.
+    :type request: Request
     :param accessory_id: The UUID of the accessory to retrieve.
     :type accessory_id: UUID
     :param customer_database: The database connection dependency.
@@ -104,10 +114,14 @@ async def get_accessory(
     :return: The accessory as an `AccessoryReturnResource`.
     :rtype: AccessoryReturnResource
     """
-    return handle_http_exception(
-        error_message="Failed to get accessory from the Customer database",
-        callback=lambda: service.get_by_id(
-            database=customer_database,
-            accessory_id=str(accessory_id)
+    return await response_cache.get_response(
+        request,
+        collections=("accessories",),
+        callback=lambda: handle_http_exception(
+            error_message="Failed to get accessory from the Customer database",
+            callback=lambda: service.get_by_id(
+                database=customer_database,
+                accessory_id=str(accessory_id)
+            )
         )
     )
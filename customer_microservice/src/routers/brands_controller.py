@@ -13,21 +13,21 @@ Key Responsibilities:
 # External Library imports
 from uuid import UUID
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Request
 
 # Internal library imports
 from src.resources import BrandReturnResource
 from src.exceptions import handle_http_exception
+from src.cache_management import response_cache
 from src.services import brands_service as service
-from src.database_management import Database, get_mongodb
+from src.database_management import Database, get_database
 
 
 router: APIRouter = APIRouter()
 
 
-def get_db():
-    with get_mongodb() as database:
-        yield database
+async def get_db() -> Database:
+    return get_database()
 
 
 @router.get(
@@ -46,6 +46,7 @@ def get_db():
     """
 )
 async def get_brands(
+        request: Request,
         limit: Optional[int] = Query(
             default=None, ge=1,
             description="""Set a limit for the amount of brands that is returned."""
@@ -55,6 +56,8 @@ async def get_brands(
     """
     Retrieves a list of car brands from the database.
 
+    :param request: The incoming request, used as the key of the response cache.
+    :type request: Request
     :param limit: The maximum number of brands to retrieve (optional).
     :type limit: int | None
     :param customer_database: The database connection dependency.
@@ -62,11 +65,15 @@ async def get_brands(
     :return: A list of brands as `BrandReturnResource`.
     :rtype: List[BrandReturnResource]
     """
-    return handle_http_exception(
-        error_message="Failed to get brands from the Customer database",
-        callback=lambda: service.get_all(
-            database=customer_database,
-            brands_limit=limit
+    return await response_cache.get_response(
+        request,
+        collections=("brands",),
+        callback=lambda: handle_http_exception(
+            error_message="Failed to get brands from the Customer database",
+            callback=lambda: service.get_all(
+                database=customer_database,
+                brands_limit=limit
+            )
         )
     )
 
@@ -87,6 +94,7 @@ async def get_brands(
     """
 )
 async def get_brand(
+        request: Request,
         brand_id: UUID = Path(
             default=...,
             description="""The UUID of the brand to retrieve."""
@@ -96,6 +104,8 @@ async def get_brand(
     """
     Retrieves a specific car brand by its UUID.
 
+    :param request: The incoming request, used as the key of the response cache.
+    :type request: Request
     :param brand_id: The UUID of the brand to retrieve.
     :type brand_id: UUID
     :param customer_database: The database connection dependency.
@@ -103,10 +113,14 @@ async def get_brand(
     :return: The brand as a `BrandReturnResource`.
     :rtype: BrandReturnResource
     """
-    return handle_http_exception(
-        error_message="Failed to get brand from the Customer database",
-        callback=lambda: service.get_by_id(
-            database=customer_database,
-            brand_id=str(brand_id)
+    return await response_cache.get_response(
+        request,
+        collections=("brands",),
+        callback=lambda: handle_http_exception(
+            error_message="Failed to get brand from the Customer database",
+            callback=lambda: service.get_by_id(
+                database=customer_database,
+                brand_id=str(brand_id)
+            )
         )
     )
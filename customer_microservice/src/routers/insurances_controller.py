@@ -13,21 +13,21 @@ Key Responsibilities:
 # External Library imports
 from uuid import UUID
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Request
 
 # Internal library imports
 from src.exceptions import handle_http_exception
+from src.cache_management import response_cache
 from src.resources import InsuranceReturnResource
 from src.services import insurances_service as service
-from src.database_management import Database, get_mongodb
+from src.database_management import Database, get_database
 
 
 router: APIRouter = APIRouter()
 
 
-def get_db():
-    with get_mongodb() as database:
-        yield database
+async def get_db() -> Database:
+    return get_database()
 
 
 @router.get(
@@ -46,6 +46,7 @@ def get_db():
     """
 )
 async def get_insurances(
+        request: Request,
         limit: Optional[int] = Query(
             default=None, ge=1,
             description="""Set a limit for the amount of insurances that is returned."""
@@ -55,6 +56,8 @@ async def get_insurances(
     """
     Retrieves a list of insurances from the database.
 
+    :param request: The incoming request, used as the key of the response cache.
+    :type request: Request
     :param limit: The maximum number of insurances to retrieve (optional).
     :type limit: int | None
     :param customer_database: The database connection dependency.
@@ -62,11 +65,15 @@ async def get_insurances(
     :return: A list of insurances as `InsuranceReturnResource`.
     :rtype: List[InsuranceReturnResource]
     """
-    return handle_http_exception(
-        error_message="Failed to get insurances from the Customer database",
-        callback=lambda: service.get_all(
-            database=customer_database,
-            insurances_limit=limit
+    return await response_cache.get_response(
+        request,
+        collections=("insurances",),
+        callback=lambda: handle_http_exception(
+            error_message="Failed to get insurances from the Customer database",
+            callback=lambda: service.get_all(
+                database=customer_database,
+                insurances_limit=limit
+            )
         )
     )
 
@@ -88,6 +95,7 @@ async def get_insurances(
     """
 )
 async def get_insurance(
+        request: Request,
         insurance_id: UUID = Path(
             default=...,
             description="""The UUID of the insurance to retrieve."""
@@ -97,6 +105,8 @@ async def get_insurance(
     """
     Retrieves a specific insurance by its UUID.
 
+    :param request: The incoming request, used as the key of the response cache.
+    :type request: Request
     :param insurance_id: The UUID of the insurance to retrieve.
     :type insurance_id: UUID
     :param customer_database: The database connection dependency.
@@ -104,10 +114,14 @@ async def get_insurance(
     :return: The insurance as an `InsuranceReturnResource`.
     :rtype: InsuranceReturnResource
     """
-    return handle_http_exception(
-        error_message="Failed to get insurance from the Customer database",
-        callback=lambda: service.get_by_id(
-            database=customer_database,
-            insurance_id=str(insurance_id)
+    return await response_cache.get_response(
+        request,
+        collections=("insurances",),
+        callback=lambda: handle_http_exception(
+            error_message="Failed to get insurance from the Customer database",
+            callback=lambda: service.get_by_id(
+                database=customer_database,
+                insurance_id=str(insurance_id)
+            )
         )
     )
@@ -13,21 +13,21 @@ Key Responsibilities:
 # External Library imports
 from uuid import UUID
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Request
 
 # Internal library imports
 from src.resources import ModelReturnResource
 from src.exceptions import handle_http_exception
+from src.cache_management import response_cache
 from src.services import models_service as service
-from src.database_management import Database, get_mongodb
+from src.database_management import Database, get_database
 
 
 router: APIRouter = APIRouter()
 
 
-def get_db():
-    with get_mongodb() as database:
-        yield database
+async def get_db() -> Database:
+    return get_database()
 
 
 @router.get(
@@ -47,6 +47,7 @@ def get_db():
     """
 )
 async def get_models(
+        request: Request,
         brand_id: Optional[UUID] = Query(
             default=None,
             description="""The UUID of the brand, to retrieve models belonging to that brand."""
@@ -60,6 +61,8 @@ async def get_models(
     """
     Retrieves a list of car models from the database.
 
+    :param request: The incoming request, used as the key of the response cache.
+    :type request: Request
     :param brand_id: The UUID of the brand to filter models by (optional).
     :type brand_id: UUID | None
     :param limit: The maximum number of car models to retrieve (optional).
@@ -69,12 +72,16 @@ async def get_models(
     :return: A list of models as `ModelReturnResource`.
     :rtype: List[ModelReturnResource]
     """
-    return handle_http_exception(
-        error_message="Failed to get models from the Customer database",
-        callback=lambda: service.get_all(
-            database=customer_database,
-            brand_id=None if not brand_id else str(brand_id),
-            models_limit=limit
+    return await response_cache.get_response(
+        request,
+        collections=("models", "brands"),
+        callback=lambda: handle_http_exception(
+            error_message="Failed to get models from the Customer database",
+            callback=lambda: service.get_all(
+                database=customer_database,
+                brand_id=None if not brand_id else str(brand_id),
+                models_limit=limit
+            )
         )
     )
 
@@ -96,6 +103,7 @@ async def get_models(
     """
 )
 async def get_model(
+        request: Request,
         model_id: UUID = Path(
             default=...,
             description="""The UUID of the model to retrieve."""
@@ -105,6 +113,8 @@ async def get_model(
     """
     Retrieves a specific car model by its UUID.
 
+    :param request: The incoming request, used as the key of the response cache.
+    :type request: Request
     :param model_id: The UUID of the car model to retrieve.
     :type model_id: UUID
     :param customer_database: The database connection dependency.
@@ -112,10 +122,14 @@ async def get_model(
     :return: The model as a `ModelReturnResource`.
     :rtype: ModelReturnResource
     """
-    return handle_http_exception(
-        error_message="Failed to get model from the Customer database",
-        callback=lambda: service.get_by_id(
-            database=customer_database,
-            model_id=str(model_id)
+    return await response_cache.get_response(
+        request,
+        collections=("models",),
+        callback=lambda: handle_http_exception(
+            error_message="Failed to get model from the Customer database",
+            callback=lambda: service.get_by_id(
+                database=customer_database,
+                model_id=str(model_id)
+            )
         )
     )
@@ -21,7 +21,7 @@ from src.repositories import AccessoryRepository
 from src.resources import AccessoryReturnResource
 
 
-def get_all(
+async def get_all(
         database: Database,
         accessory_limit: Optional[int] = None
 ) -> List[AccessoryReturnResource]:
@@ -45,12 +45,12 @@ def get_all(
         raise TypeError(f"accessory_limit must be of type int or None, "
                         f"not {type(accessory_limit).__name__}.")
         
-    accessories = repository.get_all(limit=accessory_limit)
+    accessories = await repository.get_all(limit=accessory_limit)
 
     return [accessory.as_resource() for accessory in accessories]
 
 
-def get_by_id(
+async def get_by_id(
         database: Database,
         accessory_id: str
 ) -> AccessoryReturnResource:
@@ -75,7 +75,7 @@ def get_by_id(
         raise TypeError(f"accessory_id must be of type str, "
                         f"not {type(accessory_id).__name__}.")
 
-    accessory = repository.get_by_id(accessory_id)
+    accessory = await repository.get_by_id(accessory_id)
     if accessory is None:
         raise UnableToFindIdError(
             entity_name="Accessory",
@@ -21,7 +21,7 @@ from src.resources import BrandReturnResource
 from src.exceptions import UnableToFindIdError
 
 
-def get_all(
+async def get_all(
         database: Database,
         brands_limit: Optional[int] = None
 ) -> List[BrandReturnResource]:
@@ -45,12 +45,12 @@ def get_all(
         raise TypeError(f"brands_limit must be of type int or None, "
                         f"not {type(brands_limit).__name__}.")
 
-    brands = repository.get_all(limit=brands_limit)
+    brands = await repository.get_all(limit=brands_limit)
     
     return [brand.as_resource() for brand in brands]
 
 
-def get_by_id(
+async def get_by_id(
         database: Database,
         brand_id: str
 ) -> BrandReturnResource:
@@ -75,7 +75,7 @@ def get_by_id(
         raise TypeError(f"brand_id must be of type str, "
                         f"not {type(brand_id).__name__}.")
 
-    brand = repository.get_by_id(brand_id)
+    brand = await repository.get_by_id(brand_id)
     if brand is None:
         raise UnableToFindIdError(
             entity_name="Brand",
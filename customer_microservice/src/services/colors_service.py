@@ -21,7 +21,7 @@ from src.resources import ColorReturnResource
 from src.exceptions import UnableToFindIdError
 
 
-def get_all(
+async def get_all(
         database: Database,
         colors_limit: Optional[int] = None
 ) -> List[ColorReturnResource]:
@@ -45,12 +45,12 @@ def get_all(
         raise TypeError(f"colors_limit must be of type int or None, "
                         f"not {type(colors_limit).__name__}.")
 
-    colors = repository.get_all(limit=colors_limit)
+    colors = await repository.get_all(limit=colors_limit)
     
     return [color.as_resource() for color in colors]
     
 
-def get_by_id(
+async def get_by_id(
         database: Database,
         color_id: str
 ) -> ColorReturnResource:
@@ -75,7 +75,7 @@ def get_by_id(
         raise TypeError(f"color_id must be of type str, "
                         f"not {type(color_id).__name__}.")
 
-    color = repository.get_by_id(color_id)
+    color = await repository.get_by_id(color_id)
     if color is None:
         raise UnableToFindIdError(
             entity_name="Color",
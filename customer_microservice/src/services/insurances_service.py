@@ -21,7 +21,7 @@ from src.repositories import InsuranceRepository
 from src.resources import InsuranceReturnResource
 
 
-def get_all(
+async def get_all(
         database: Database,
         insurances_limit: Optional[int] = None
 ) -> List[InsuranceReturnResource]:
@@ -45,12 +45,12 @@ def get_all(
         raise TypeError(f"insurances_limit must be of type int or None, "
                         f"not {type(insurances_limit).__name__}.")
 
-    insurances = repository.get_all(limit=insurances_limit)
+    insurances = await repository.get_all(limit=insurances_limit)
     
     return [insurance.as_resource() for insurance in insurances]
 
 
-def get_by_id(
+async def get_by_id(
         database: Database,
         insurance_id: str
 ) -> InsuranceReturnResource:
@@ -75,7 +75,7 @@ def get_by_id(
         raise TypeError(f"insurance_id must be of type str, "
                         f"not {type(insurance_id).__name__}.")
 
-    insurance = repository.get_by_id(insurance_id)
+    insurance = await repository.get_by_id(insurance_id)
     if insurance is None:
         raise UnableToFindIdError(
             entity_name="Insurance",
@@ -21,7 +21,7 @@ from src.exceptions import UnableToFindIdError
 from src.repositories import ModelRepository, BrandRepository
 
 
-def get_all(
+async def get_all(
         database: Database,
         brand_id: Optional[str] = None,
         models_limit: Optional[int] = None
@@ -59,19 +59,19 @@ def get_all(
 
     brand_entity = None
     if brand_id is not None:
-        brand_entity = brand_repository.get_by_id(brand_id)
+        brand_entity = await brand_repository.get_by_id(brand_id)
         if brand_entity is None:
             raise UnableToFindIdError(
                 entity_name="Brand",
                 entity_id=brand_id
             )
     
-    models = model_repository.get_all(brand_entity, limit=models_limit)
+    models = await model_repository.get_all(brand_entity, limit=models_limit)
     
     return [model.as_resource() for model in models]
 
 
-def get_by_id(
+async def get_by_id(
         database: Database,
         model_id: str
 ) -> ModelReturnResource:
@@ -96,7 +96,7 @@ def get_by_id(
         raise TypeError(f"model_id must be of type str, "
                         f"not {type(model_id).__name__}.")
 
-    model = repository.get_by_id(model_id)
+    model = await repository.get_by_id(model_id)
     
     if model is None:
         raise UnableToFindIdError("Model", model_id)
@@ -0,0 +1,4 @@
+from .tracer import tracer, shutdown_tracing
+from .propagation import inject_trace_headers, extract_trace_context
+from .database_tracing import command_tracing
+from .http_tracing import HttpTracingMiddleware
@@ -0,0 +1,48 @@
+# External Library imports
+from typing import Any, Dict, Iterable, Mapping, Optional
+from opentelemetry import propagate
+from opentelemetry.context import Context
+from opentelemetry.propagators.textmap import Getter
+
+
+class _HeadersGetter(Getter[Mapping[str, Any]]):
+    """Reads the trace context from AMQP or HTTP headers, whose values may arrive as bytes."""
+
+    def get(self, carrier: Mapping[str, Any], key: str) -> Optional[list]:
+        value = carrier.get(key)
+        if value is None:
+            return None
+        if isinstance(value, bytes):
+            value = value.decode("latin-1")
+        return [str(value)]
+
+    def keys(self, carrier: Mapping[str, Any]) -> Iterable[str]:
+        return list(carrier.keys())
+
+
+_HEADERS_GETTER = _HeadersGetter()
+
+
+def inject_trace_headers(headers: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Adds the W3C trace context of the current span, the `traceparent` and `tracestate` headers, to the headers.
+
+    :param dict headers: The headers to add the trace context to, a new dictionary if not given.
+    :return: The headers.
+    :rtype: dict
+    """
+    if headers is None:
+        headers = {}
+    propagate.inject(headers)
+    return headers
+
+
+def extract_trace_context(headers: Optional[Mapping[str, Any]]) -> Context:
+    """
+    Reads the W3C trace context of the headers of a message or request, to continue its trace.
+
+    :param headers: The headers of the message or request, None if it has none.
+    :return: The context to start the spans of the message or request in, without a parent if the headers carry no trace context.
+    :rtype: Context
+    """
+    return propagate.extract(headers or {}, getter=_HEADERS_GETTER)
@@ -8,7 +8,17 @@ import asyncio
 import os
 
 # Internal Library imports
-from src.message_broker_management import get_admin_exchange_consumer, start_consumer, stop_consumer
+from src.message_broker_management import (
+    get_admin_exchange_consumer,
+    start_consumer,
+    stop_consumer,
+    async_publisher,
+    outbox_relay
+)
+from src.database_management import get_pool_statistics, dispose_engines
+from src.core import NEXT_CURSOR_HEADER, APPROXIMATE_TOTAL_HEADER, current_employee_cache
+from src.metrics_management import HttpMetricsMiddleware, get_metrics_response, register_statistics
+from src.tracing_management import HttpTracingMiddleware, shutdown_tracing
 from src.routers import (
     accessories_router,
     insurances_router,
@@ -18,6 +28,7 @@ from src.routers import (
     colors_router,
     brands_router,
     models_router,
+    outbox_router,
     login_router,
     cars_router
 )
@@ -31,6 +42,8 @@ async def lifespan_of_consumer(app: FastAPI):
     try:
         consumer = get_admin_exchange_consumer()
         await consumer.connect()
+        await async_publisher.connect()
+        outbox_relay.start()
         app.state.consumer = consumer  # Store the consumer in the app state
         logger.info("Starting RabbitMQ consumer...")
         asyncio.create_task(start_consumer(consumer))
@@ -49,6 +62,10 @@ async def lifespan_of_consumer(app: FastAPI):
     # Shutdown logic
     if consumer:
         await stop_consumer(consumer)
+    await outbox_relay.stop()
+    await async_publisher.close()
+    dispose_engines()
+    shutdown_tracing()
 
 
 
@@ -63,12 +80,24 @@ CORS_SETTINGS = {
     "allow_origins": ["*"],
     "allow_credentials": True,
     "allow_methods": ["*"],
-    "allow_headers": ["*"]
+    "allow_headers": ["*"],
+    "expose_headers": [NEXT_CURSOR_HEADER, APPROXIMATE_TOTAL_HEADER]
 }
 
 load_dotenv()
 
 app.add_middleware(CORSMiddleware, **CORS_SETTINGS)
+app.add_middleware(HttpMetricsMiddleware)
+app.add_middleware(HttpTracingMiddleware)
+
+register_statistics(
+    "mysql_pool",
+    get_pool_statistics,
+    counters=("total_checkouts", "checkout_timeouts"),
+    label="user"
+)
+register_statistics("current_employee_cache", current_employee_cache.statistics, counters=("hits", "misses"))
+register_statistics("outbox_relay", outbox_relay.statistics, counters=("published", "batches", "failures"))
 
 
 app.include_router(accessories_router, tags=["Accessories"])
@@ -81,6 +110,7 @@ app.include_router(insurances_router, tags=["Insurances"])
 app.include_router(models_router, tags=["Models"])
 app.include_router(purchases_router, tags=["Purchases"])
 app.include_router(login_router, tags=["Login"])
+app.include_router(outbox_router, tags=["Outbox"])
 
 
 @app.get("/favicon.ico", include_in_schema=False)
@@ -88,6 +118,12 @@ async def favicon():
     return Response(status_code=204)
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    # Not async, the outbox relay statistics query the database and must not block the event loop.
+    return get_metrics_response()
+
+
 if __name__ == "__main__":
     import uvicorn
     
@@ -5,4 +5,14 @@ from .security import (
     is_invalid_mime_type,
     read_file_if_within_size_limit
 )
-from .tokens import TokenPayload, Token
\ No newline at end of file
+from .tokens import TokenPayload, Token
+from .current_employee_cache import CurrentEmployeeCache, current_employee_cache
+from .pagination import (
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    APPROXIMATE_TOTAL_HEADER,
+    decode_page_cursor,
+    get_page_size,
+    build_page,
+    set_pagination_headers
+)
@@ -0,0 +1,99 @@
+# External Library imports
+import os
+import json
+import base64
+import binascii
+from datetime import datetime
+from fastapi import Response
+from dotenv import load_dotenv
+from typing import Any, Callable, List, Optional, Tuple
+
+# Internal Library imports
+from src.resources import PageResource
+from src.exceptions import InvalidPageCursorError
+
+load_dotenv()
+
+try:
+    MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", 500))
+except ValueError:
+    raise ValueError("MAX_PAGE_SIZE must be an integer.")
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+APPROXIMATE_TOTAL_HEADER = "X-Total-Count-Estimate"
+
+
+def encode_page_cursor(created_at: datetime, entity_id: str) -> str:
+    """
+    Encodes the sort key of the last row of a page into an opaque cursor.
+
+    Args:
+        created_at (datetime): The creation time of the last row.
+        entity_id (str): The ID of the last row, used to break ties on the creation time.
+
+    Returns:
+        str: The URL safe cursor.
+    """
+    payload = json.dumps([created_at.isoformat(), entity_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_page_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, str]]:
+    """
+    Decodes a cursor made by `encode_page_cursor` back into the sort key it was made from.
+
+    Raises:
+        InvalidPageCursorError: If the cursor was not made by `encode_page_cursor`.
+    """
+    if cursor is None:
+        return None
+    try:
+        padded_cursor = cursor + "=" * (-len(cursor) % 4)
+        created_at, entity_id = json.loads(base64.urlsafe_b64decode(padded_cursor))
+        return datetime.fromisoformat(created_at), str(entity_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise InvalidPageCursorError(cursor)
+
+
+def get_page_size(page_size: Optional[int], limit: Optional[int] = None) -> int:
+    """
+    Returns the number of rows to put on a page, never more than `MAX_PAGE_SIZE`.
+    The deprecated `limit` query parameter is used when no page size is given.
+    """
+    requested_page_size = page_size if page_size is not None else limit
+    if requested_page_size is None or requested_page_size > MAX_PAGE_SIZE:
+        return MAX_PAGE_SIZE
+    return requested_page_size
+
+
+def build_page(
+    rows: List[Any],
+    page_size: int,
+    as_resource: Callable[[Any], Any],
+    sort_key: Callable[[Any], Tuple[datetime, str]],
+    approximate_total: Optional[int] = None
+) -> PageResource:
+    """
+    Builds a page from rows fetched with a limit of `page_size + 1`,
+    where the extra row only tells whether there is a next page.
+    """
+    has_next_page = len(rows) > page_size
+    rows = rows[:page_size]
+    next_cursor = encode_page_cursor(*sort_key(rows[-1])) if has_next_page else None
+    return PageResource(
+        items=[as_resource(row) for row in rows],
+        next_cursor=next_cursor,
+        approximate_total=approximate_total
+    )
+
+
+def set_pagination_headers(response: Response, page: PageResource) -> List[Any]:
+    """
+    Sets the next cursor and the approximate total of the page as response headers,
+    so the response body stays a plain list, and returns the items of the page.
+    """
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    if page.approximate_total is not None:
+        response.headers[APPROXIMATE_TOTAL_HEADER] = str(page.approximate_total)
+    return page.items
@@ -1 +1,2 @@
-from .mysqldb_connection import Session, get_mysqldb
\ No newline at end of file
+from .mysqldb_connection import Session, get_mysqldb, get_pool_statistics, dispose_engines
+from .thread_pool import run_in_thread_pool
@@ -1,13 +1,18 @@
 # External Library imports
 import os
-from typing import Generator
+import time
+import threading
 from dotenv import load_dotenv
 from contextlib import contextmanager
+from typing import Generator, Dict, Any
 from sqlalchemy import create_engine, Engine
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.orm import Session, sessionmaker
 
 # Internal Library imports
 from src.logger_tool import logger
+from src.metrics_management import instrument_engine
+from src.tracing_management import trace_engine
 
 load_dotenv()
 
@@ -19,16 +24,122 @@ DB_NAME = os.getenv('MYSQL_DB_NAME')
 DB_APPLICATION_USERNAME = os.getenv("MYSQL_DB_APPLICATION_USERNAME")
 DB_APPLICATION_PASSWORD = os.getenv("MYSQL_DB_APPLICATION_PASSWORD")
 
+try:
+    DB_POOL_SIZE = int(os.getenv("MYSQL_DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW = int(os.getenv("MYSQL_DB_MAX_OVERFLOW", 20))
+    DB_POOL_RECYCLE = int(os.getenv("MYSQL_DB_POOL_RECYCLE", 1800))
+    DB_POOL_TIMEOUT = int(os.getenv("MYSQL_DB_POOL_TIMEOUT", 30))
+except ValueError:
+    raise ValueError("MYSQL_DB_POOL_SIZE, MYSQL_DB_MAX_OVERFLOW, MYSQL_DB_POOL_RECYCLE and MYSQL_DB_POOL_TIMEOUT must be integers.")
+
 session_local = sessionmaker(autocommit=False, autoflush=False)
 
 
+class TimedQueuePool(QueuePool):
+    """
+    A QueuePool that keeps track of how long callers wait for a connection to be checked out,
+    so the pool size and overflow can be sized from real numbers.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._statistics_lock = threading.Lock()
+        self.total_checkouts: int = 0
+        self.total_wait_seconds: float = 0.0
+        self.max_wait_seconds: float = 0.0
+        self.checkout_timeouts: int = 0
+
+    def _do_get(self):
+        start_time = time.perf_counter()
+        try:
+            return super()._do_get()
+        except Exception:
+            with self._statistics_lock:
+                self.checkout_timeouts += 1
+            raise
+        finally:
+            waited_seconds = time.perf_counter() - start_time
+            with self._statistics_lock:
+                self.total_checkouts += 1
+                self.total_wait_seconds += waited_seconds
+                self.max_wait_seconds = max(self.max_wait_seconds, waited_seconds)
+
+    def recreate(self) -> "TimedQueuePool":
+        # Keep the collected statistics when the pool is recreated after an invalidation.
+        new_pool = super().recreate()
+        new_pool.total_checkouts = self.total_checkouts
+        new_pool.total_wait_seconds = self.total_wait_seconds
+        new_pool.max_wait_seconds = self.max_wait_seconds
+        new_pool.checkout_timeouts = self.checkout_timeouts
+        return new_pool
+
+    def statistics(self) -> Dict[str, Any]:
+        with self._statistics_lock:
+            average_wait_seconds = self.total_wait_seconds / self.total_checkouts if self.total_checkouts else 0.0
+            return {
+                "pool_size": self.size(),
+                "checked_in": self.checkedin(),
+                "checked_out": self.checkedout(),
+                "overflow": self.overflow(),
+                "max_overflow": self._max_overflow,
+                "total_checkouts": self.total_checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "average_wait_seconds": round(average_wait_seconds, 6),
+                "max_wait_seconds": round(self.max_wait_seconds, 6),
+            }
+
+
+# One engine (and with it one connection pool) per process and per database user.
+_engines: Dict[bool, Engine] = {}
+_engines_lock = threading.Lock()
+
+
 def get_engine(as_administrator: bool) -> Engine:
-    db_username = DB_ROOT_USERNAME if as_administrator else DB_APPLICATION_USERNAME
-    db_password = DB_ROOT_PASSWORD if as_administrator else DB_APPLICATION_PASSWORD
-    logger.info(f"Establishing MySQLDB connection to the database: '{DB_NAME}' on host:port '{DB_HOST}:{DB_PORT}' with the user: '{db_username}'...")
-    connection_string = f'mysql://{db_username}:{db_password}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
-    engine = create_engine(connection_string, pool_pre_ping=True)
-    return engine
+    engine = _engines.get(as_administrator)
+    if engine is not None:
+        return engine
+    with _engines_lock:
+        engine = _engines.get(as_administrator)
+        if engine is not None:
+            return engine
+        db_username = DB_ROOT_USERNAME if as_administrator else DB_APPLICATION_USERNAME
+        db_password = DB_ROOT_PASSWORD if as_administrator else DB_APPLICATION_PASSWORD
+        logger.info(f"Creating MySQLDB engine for the database: '{DB_NAME}' on host:port '{DB_HOST}:{DB_PORT}' with the user: '{db_username}'...")
+        connection_string = f'mysql://{db_username}:{db_password}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
+        engine = create_engine(
+            connection_string,
+            poolclass=TimedQueuePool,
+            pool_pre_ping=True,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_recycle=DB_POOL_RECYCLE,
+            pool_timeout=DB_POOL_TIMEOUT
+        )
+        instrument_engine(engine)
+        trace_engine(engine)
+        _engines[as_administrator] = engine
+        return engine
+
+
+def get_pool_statistics() -> Dict[str, Dict[str, Any]]:
+    """
+    Returns the connection pool statistics for every engine created by this process,
+    keyed by which database user the engine connects as.
+    """
+    statistics: Dict[str, Dict[str, Any]] = {}
+    for as_administrator, engine in list(_engines.items()):
+        pool = engine.pool
+        if isinstance(pool, TimedQueuePool):
+            statistics["administrator" if as_administrator else "application"] = pool.statistics()
+    return statistics
+
+
+def dispose_engines() -> None:
+    """Closes every pooled connection, used when the application shuts down."""
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
 
 
 @contextmanager
@@ -36,7 +147,7 @@ def get_mysqldb(as_administrator: bool = False) -> Generator[Session, None, None
     engine = get_engine(as_administrator)
     session = session_local(bind=engine)
     try:
-        logger.info("Creating a new session")
+        logger.debug("Creating a new session")
         yield session
         session.commit()
     except Exception as e:
@@ -45,5 +156,5 @@ def get_mysqldb(as_administrator: bool = False) -> Generator[Session, None, None
         raise
     finally:
         if not as_administrator:
-            logger.info("Closing the session")
-            session.close()
\ No newline at end of file
+            logger.debug("Closing the session")
+            session.close()
@@ -0,0 +1,34 @@
+# External Library imports
+import os
+from typing import Callable, TypeVar
+from anyio import CapacityLimiter, to_thread
+
+# Internal Library imports
+from src.database_management.mysqldb_connection import DB_POOL_SIZE, DB_MAX_OVERFLOW
+
+T = TypeVar("T")
+
+# By default there are never more worker threads than connections the pool can hand out,
+# so requests queue on the event loop instead of blocking threads on the pool timeout.
+try:
+    DB_THREAD_POOL_SIZE = int(os.getenv("DB_THREAD_POOL_SIZE", DB_POOL_SIZE + DB_MAX_OVERFLOW))
+except ValueError:
+    raise ValueError("DB_THREAD_POOL_SIZE must be an integer.")
+
+_limiter: CapacityLimiter = None
+
+
+def _get_limiter() -> CapacityLimiter:
+    # The limiter has to be created lazily, as it belongs to the running event loop.
+    global _limiter
+    if _limiter is None:
+        _limiter = CapacityLimiter(DB_THREAD_POOL_SIZE)
+    return _limiter
+
+
+async def run_in_thread_pool(callback: Callable[[], T]) -> T:
+    """
+    Runs a blocking callback, such as a service function doing MySQL queries,
+    on a bounded pool of worker threads so it does not block the event loop.
+    """
+    return await to_thread.run_sync(callback, limiter=_get_limiter())
@@ -7,4 +7,5 @@ from .customer import CustomerEntity
 from .employee import EmployeeEntity, EmployeeMesssage
 from .insurance import InsuranceEntity, cars_has_insurances
 from .model import ModelEntity
-from .purchase import PurchaseEntity
\ No newline at end of file
+from .purchase import PurchaseEntity
+from .outbox_message import OutboxMessageEntity, utc_now
\ No newline at end of file
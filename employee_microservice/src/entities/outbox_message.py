@@ -0,0 +1,36 @@
+# External Library imports
+from typing import Dict, Optional
+from datetime import datetime, timezone
+from sqlalchemy.orm import Mapped
+from sqlalchemy import Column, BigInteger, String, LargeBinary, DateTime
+
+# Internal library imports
+from src.entities.base_entity import BaseEntity
+
+
+def utc_now() -> datetime:
+    """The current UTC time without a timezone, as stored in the DATETIME(6) columns of the outbox."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class OutboxMessageEntity(BaseEntity):
+    """
+    A message to publish to RabbitMQ, written in the same transaction as the change it describes
+    and published afterwards by the outbox relay. The W3C trace context of the request that wrote it
+    is kept with it, so its publish and consumption belong to the trace of that request.
+    """
+    __tablename__ = 'outbox_messages'
+    id: Mapped[int] = Column(BigInteger, primary_key=True, autoincrement=True)
+    exchange_name: Mapped[str] = Column(String(100), nullable=False)
+    exchange_type: Mapped[str] = Column(String(10), nullable=False)
+    routing_key: Mapped[str] = Column(String(100), nullable=False)
+    body: Mapped[bytes] = Column(LargeBinary, nullable=False)
+    traceparent: Mapped[Optional[str]] = Column(String(55), nullable=True)
+    tracestate: Mapped[Optional[str]] = Column(String(512), nullable=True)
+    created_at: Mapped[datetime] = Column(DateTime, default=utc_now, index=True, nullable=False)
+    published_at: Mapped[Optional[datetime]] = Column(DateTime, nullable=True)
+
+    def get_trace_headers(self) -> Dict[str, str]:
+        """The W3C trace context the message was written in, empty if it was written outside of a trace."""
+        trace_headers = {"traceparent": self.traceparent, "tracestate": self.tracestate}
+        return {key: value for key, value in trace_headers.items() if value}
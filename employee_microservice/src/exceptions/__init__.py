@@ -11,7 +11,9 @@ from .database_errors import (
     UnableToFindEntityError,
     FileCannotBeEmptyError,
     UnableToFindIdError,
-    FileTooLargeError
+    FileTooLargeError,
+    InvalidPageCursorError,
+    InvalidTimeRangeError
 )
 
 from .invalid_credentials_errors import (
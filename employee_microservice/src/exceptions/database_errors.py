@@ -1,6 +1,6 @@
 from typing import Union
 from uuid import UUID
-from datetime import date
+from datetime import date, datetime
 
 from src.entities import ModelEntity, ColorEntity, CarEntity
 
@@ -108,4 +108,21 @@ class UnableToFindEntityError(DatabaseError):
         super().__init__(self.message)  # Call the base class constructor
 
     def __str__(self):
-        return f"{self.message}"
\ No newline at end of file
+        return f"{self.message}"
+
+class InvalidPageCursorError(DatabaseError):
+    def __init__(self, cursor: str):
+        self.message = f'The page cursor: {cursor} is not a valid cursor returned by a previous page.'
+        super().__init__(self.message)  # Call the base class constructor
+
+    def __str__(self):
+        return f"{self.message}"
+
+
+class InvalidTimeRangeError(DatabaseError):
+    def __init__(self, start: datetime, end: datetime):
+        self.message = f'The start of the time range: {start.isoformat()} must be before its end: {end.isoformat()}.'
+        super().__init__(self.message)  # Call the base class constructor
+
+    def __str__(self):
+        return f"{self.message}"
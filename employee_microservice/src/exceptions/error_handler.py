@@ -6,6 +6,7 @@ from fastapi import HTTPException, status
 
 # Internal library imports
 from src.logger_tool import logger
+from src.database_management import run_in_thread_pool
 from src.exceptions.invalid_credentials_errors import (
     IncorrectCredentialError,
     IncorrectRoleError,
@@ -23,6 +24,8 @@ from src.exceptions.database_errors import (
     PurchaseDeadlineHasPastError,
     TheColorIsNotAvailableInModelToGiveToCarError,
     UnableToDeleteCarWithoutDeletingPurchaseTooError,
+    InvalidPageCursorError,
+    InvalidTimeRangeError,
 )
 
 
@@ -33,7 +36,9 @@ async def handle_http_exception(
 ) -> Any:
     
     try:
-        result = callback()
+        # Service functions are blocking, so they are run on the thread pool. Coroutine
+        # functions only create their coroutine there, which is then awaited on the event loop.
+        result = await run_in_thread_pool(callback)
         if asyncio.iscoroutine(result):
             return await result
         return result
@@ -129,6 +134,20 @@ async def handle_http_exception(
             detail=str(f"{error_message}: {e}")
         )
         
+    except InvalidPageCursorError as e:
+        log_error(error_message, e)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(f"{error_message}: {e}")
+        )
+        
+    except InvalidTimeRangeError as e:
+        log_error(error_message, e)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(f"{error_message}: {e}")
+        )
+        
     except IncorrectCredentialError as e:
         log_error(error_message, e)
         raise HTTPException(
@@ -1 +1 @@
-from .logger import logger
\ No newline at end of file
+from .logger import logger, payload_for_log
@@ -1,7 +1,209 @@
+import os
+import sys
+import copy
+import json
+import queue
+import atexit
+import random
 import logging
+import logging.handlers
+from functools import lru_cache
+from dotenv import load_dotenv
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Union
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
-logger = logging.getLogger(__name__)
\ No newline at end of file
+
+load_dotenv()
+
+SERVICE_NAME = "employee_microservice"
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# "json" for one JSON object per line, which Loki can parse without a regex, or "text" for the plain format.
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+# Comma separated levels of modules or libraries, such as "src.message_broker_management=WARNING,aio_pika=ERROR".
+LOG_MODULE_LEVELS = os.getenv("LOG_MODULE_LEVELS", "")
+try:
+    LOG_PAYLOAD_MAX_LENGTH = int(os.getenv("LOG_PAYLOAD_MAX_LENGTH", 256))
+    LOG_PAYLOAD_SAMPLE_RATE = float(os.getenv("LOG_PAYLOAD_SAMPLE_RATE", 1.0))
+except ValueError:
+    raise ValueError("LOG_PAYLOAD_MAX_LENGTH must be an integer and LOG_PAYLOAD_SAMPLE_RATE must be a number.")
+
+TEXT_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+PAYLOAD_NOT_SAMPLED = "<payload not sampled>"
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+# The attributes every LogRecord has, anything else on a record was given with `extra` and is added to the JSON.
+_RECORD_ATTRIBUTES = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+
+def _get_level(level_name: str, variable_name: str) -> int:
+    level = logging.getLevelName(level_name.strip().upper())
+    if not isinstance(level, int):
+        raise ValueError(f"{variable_name} must be a logging level such as DEBUG, INFO or WARNING, not: {level_name}")
+    return level
+
+
+def _parse_module_levels(module_levels: str) -> Dict[str, int]:
+    levels: Dict[str, int] = {}
+    for module_level in filter(None, (part.strip() for part in module_levels.split(","))):
+        module, _, level_name = module_level.partition("=")
+        if not module.strip():
+            raise ValueError(f"LOG_MODULE_LEVELS must be comma separated module=LEVEL pairs, not: {module_level}")
+        levels[module.strip()] = _get_level(level_name, "LOG_MODULE_LEVELS")
+    return levels
+
+
+DEFAULT_LEVEL = _get_level(LOG_LEVEL, "LOG_LEVEL")
+MODULE_LEVELS = _parse_module_levels(LOG_MODULE_LEVELS)
+
+
+@lru_cache(maxsize=1024)
+def get_module_name(pathname: str) -> str:
+    """The dotted name of the module of the service a record was logged from, such as 'src.services.models_service'."""
+    normalized_path = pathname.replace("\\", "/")
+    source_index = normalized_path.rfind("/src/")
+    if source_index == -1:
+        return os.path.splitext(os.path.basename(normalized_path))[0]
+    return os.path.splitext(normalized_path[source_index + 1:])[0].replace("/", ".")
+
+
+class ModuleLevelFilter(logging.Filter):
+    """
+    Applies the levels of LOG_MODULE_LEVELS to the modules of the service.
+
+    The whole service logs through the one `logger` of this module, so its records are
+    told apart by the file they were logged from, and the longest matching module prefix wins.
+    """
+
+    def __init__(self, default_level: int, module_levels: Dict[str, int]):
+        super().__init__()
+        self.default_level = default_level
+        # The longest, most specific module first.
+        self.module_levels = sorted(module_levels.items(), key=lambda module_level: len(module_level[0]), reverse=True)
+        self._levels: Dict[str, int] = {}
+
+    def get_level(self, module_name: str) -> int:
+        level = self._levels.get(module_name)
+        if level is None:
+            level = next(
+                (level for module, level in self.module_levels
+                 if module_name == module or module_name.startswith(f"{module}.")),
+                self.default_level
+            )
+            self._levels[module_name] = level
+        return level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= self.get_level(get_module_name(record.pathname))
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record as one JSON object per line, with the fields given with `extra` as fields of their own."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_entry: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "service": SERVICE_NAME,
+            "logger": record.name,
+            "module": get_module_name(record.pathname),
+            "line": record.lineno,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and key not in log_entry:
+                log_entry[key] = value
+        if record.exc_text:
+            log_entry["exception"] = record.exc_text
+        if record.stack_info:
+            log_entry["stack"] = record.stack_info
+        return json.dumps(log_entry, default=str, ensure_ascii=False)
+
+
+class LogQueueHandler(logging.handlers.QueueHandler):
+    """
+    Hands records to the listener thread, which formats and writes them, so logging never blocks on I/O.
+
+    Only the message and the traceback are rendered on the logging thread, as the arguments
+    of a record may be changed once the call returns.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class LoggedPayload():
+    """A message body or entity in a log message, which is only converted and truncated if the record is written."""
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: Any):
+        self.payload = payload
+
+    def __str__(self) -> str:
+        if isinstance(self.payload, (bytes, bytearray)):
+            text = bytes(self.payload[:LOG_PAYLOAD_MAX_LENGTH * 4]).decode("utf-8", errors="replace")
+            length = len(self.payload)
+        else:
+            text = str(self.payload)
+            length = len(text)
+        if length > LOG_PAYLOAD_MAX_LENGTH:
+            return f"{text[:LOG_PAYLOAD_MAX_LENGTH]}... ({length} characters)"
+        return text
+
+
+def payload_for_log(payload: Any) -> Union[LoggedPayload, str]:
+    """
+    Wraps a message body or entity to be given as an argument of a log call, such as
+    `logger.info("Received message: %s", payload_for_log(body))`.
+
+    Only a LOG_PAYLOAD_SAMPLE_RATE share of the payloads is logged, cut to LOG_PAYLOAD_MAX_LENGTH characters.
+    """
+    if LOG_PAYLOAD_SAMPLE_RATE < 1 and random.random() >= LOG_PAYLOAD_SAMPLE_RATE:
+        return PAYLOAD_NOT_SAMPLED
+    return LoggedPayload(payload)
+
+
+def _get_output_handlers() -> List[logging.Handler]:
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(JsonFormatter() if LOG_FORMAT == "json" else logging.Formatter(TEXT_FORMAT))
+    return [stream_handler]
+
+
+def _configure_logging() -> None:
+    root_logger = logging.getLogger()
+    if any(isinstance(handler, LogQueueHandler) for handler in root_logger.handlers):
+        return
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *_get_output_handlers(), respect_handler_level=True)
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(LogQueueHandler(log_queue))
+    root_logger.setLevel(DEFAULT_LEVEL)
+
+    # Libraries log through loggers of their own name, the modules of the service through `logger`.
+    for module, level in MODULE_LEVELS.items():
+        if not module.startswith("src"):
+            logging.getLogger(module).setLevel(level)
+
+    listener.start()
+    # Write the records still in the queue when the process exits.
+    atexit.register(listener.stop)
+
+
+_configure_logging()
+
+logger = logging.getLogger(__name__)
+_service_module_levels = {module: level for module, level in MODULE_LEVELS.items() if module.startswith("src")}
+if _service_module_levels:
+    # The logger lets the lowest level of any module through, the filter then applies the level of every module.
+    logger.setLevel(min(DEFAULT_LEVEL, *_service_module_levels.values()))
+    logger.addFilter(ModuleLevelFilter(DEFAULT_LEVEL, _service_module_levels))
@@ -8,6 +8,8 @@ from .publishers import (
     publish_insurance_updated_message,
     publish_model_created_message
 )
+from .async_publisher import AsyncPublisher, async_publisher
+from .outbox_relay import OutboxRelay, outbox_relay
 
 
 
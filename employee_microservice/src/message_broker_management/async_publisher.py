@@ -0,0 +1,166 @@
+# External Library imports
+import os
+import time
+import asyncio
+from dotenv import load_dotenv
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
+from aio_pika import DeliveryMode, ExchangeType, Message, connect_robust
+from aio_pika.abc import AbstractRobustConnection, AbstractRobustChannel, AbstractRobustExchange
+
+# Internal library imports
+from src.logger_tool import logger
+from src.metrics_management import record_published_message
+
+
+load_dotenv()
+
+HOST: str = os.getenv('RABBITMQ_HOST', 'rabbitmq')
+USERNAME: str = os.getenv('RABBITMQ_USERNAME', 'guest')
+PASSWORD: str = os.getenv('RABBITMQ_PASSWORD', 'guest')
+try:
+    PORT: int = int(os.getenv('RABBITMQ_PORT', 5672))
+    HEARTBEAT: int = int(os.getenv('RABBITMQ_HEARTBEAT', 60))
+except ValueError:
+    raise ValueError('RABBITMQ_PORT and RABBITMQ_HEARTBEAT must be integers')
+try:
+    PUBLISHER_MAX_IN_FLIGHT: int = int(os.getenv('RABBITMQ_PUBLISHER_MAX_IN_FLIGHT', 256))
+    PUBLISH_CONFIRM_TIMEOUT: float = float(os.getenv('RABBITMQ_PUBLISH_CONFIRM_TIMEOUT', 10))
+except ValueError:
+    raise ValueError('RABBITMQ_PUBLISHER_MAX_IN_FLIGHT must be an integer and RABBITMQ_PUBLISH_CONFIRM_TIMEOUT must be a number')
+
+
+class AsyncPublisher():
+    """
+    A process-wide aio-pika publisher with publisher confirms, running on the event loop of the application.
+
+    Messages are published persistent on a robust connection, which reconnects and redeclares
+    its exchanges by itself, and every publish waits for the broker to confirm it. At most
+    `max_in_flight` messages are unconfirmed at a time: when the broker blocks the connection
+    through flow control, confirms stop arriving and further publishes wait instead of piling
+    up in memory.
+
+    The outbox relay claims its batches on worker threads, so it publishes with `publish_batch_from_thread`,
+    which hands the batch to the event loop and waits for its confirms on the worker thread.
+    The event loop only spends the time needed to encode the frames.
+    """
+
+    def __init__(self, max_in_flight: int, confirm_timeout: float) -> None:
+        self.max_in_flight = max_in_flight
+        self.confirm_timeout = confirm_timeout
+        self.connection: Optional[AbstractRobustConnection] = None
+        self.channel: Optional[AbstractRobustChannel] = None
+        self._exchanges: Dict[str, AbstractRobustExchange] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+        self._declare_lock: Optional[asyncio.Lock] = None
+
+    async def connect(self) -> None:
+        """Connect to RabbitMQ and open the confirming channel. Must be awaited on the event loop of the application."""
+        self._loop = asyncio.get_running_loop()
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        self._declare_lock = asyncio.Lock()
+        self.connection = await connect_robust(
+            host=HOST,
+            port=PORT,
+            login=USERNAME,
+            password=PASSWORD,
+            heartbeat=HEARTBEAT,
+        )
+        self.channel = await self.connection.channel(publisher_confirms=True)
+        logger.info(f"Async publisher connected to RabbitMQ at {HOST}:{PORT} with publisher confirms.")
+
+    async def close(self) -> None:
+        connection, self.connection = self.connection, None
+        self.channel = None
+        self._exchanges.clear()
+        if connection is not None:
+            await connection.close()
+            logger.info("Async publisher connection to RabbitMQ closed.")
+
+    async def publish_batch(self,
+                            exchange_name: str,
+                            exchange_type: Literal['direct', 'fanout', 'topic', 'headers'],
+                            messages: Iterable[Tuple[str, bytes, Optional[Dict[str, Any]]]]
+                            ) -> None:
+        """
+        Publish several messages and wait until the broker has confirmed all of them.
+
+        The messages are sent back to back and their confirms are awaited together,
+        so a batch costs about one round trip instead of one per message.
+
+        :param str exchange_name: The name of the exchange, declared durable on first use.
+        :param str exchange_type: The type of the exchange.
+        :param messages: The routing key, body and headers of every message, published in order.
+        :raises aio_pika.exceptions.DeliveryError: If the broker rejected any of the messages.
+        """
+        exchange = await self._get_exchange(exchange_name, exchange_type)
+
+        async def publish_confirmed(routing_key: str, body: bytes, headers: Optional[Dict[str, Any]]) -> None:
+            async with self._in_flight:
+                await self._publish_confirmed(exchange, routing_key, body, headers)
+
+        # Tasks start in creation order, so the messages are written to the channel in order.
+        await asyncio.gather(*(publish_confirmed(routing_key, body, headers) for routing_key, body, headers in messages))
+
+    def publish_batch_from_thread(self,
+                                  exchange_name: str,
+                                  exchange_type: Literal['direct', 'fanout', 'topic', 'headers'],
+                                  messages: List[Tuple[str, bytes, Optional[Dict[str, Any]]]]
+                                  ) -> None:
+        """Publish several messages from a worker thread and block that thread until all of them are confirmed."""
+        self._run_from_thread(self.publish_batch(exchange_name, exchange_type, messages))
+
+    def _run_from_thread(self, coroutine) -> None:
+        if self._loop is None or self.channel is None:
+            coroutine.close()
+            raise ConnectionError("The async publisher is not connected to RabbitMQ.")
+        try:
+            running_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            coroutine.close()
+            raise RuntimeError("publish_batch_from_thread must not be called on the event loop, await publish_batch instead.")
+        asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    async def _get_exchange(self,
+                            exchange_name: str,
+                            exchange_type: Literal['direct', 'fanout', 'topic', 'headers']
+                            ) -> AbstractRobustExchange:
+        exchange = self._exchanges.get(exchange_name)
+        if exchange is not None:
+            return exchange
+        if self.channel is None:
+            raise ConnectionError("The async publisher is not connected to RabbitMQ.")
+        async with self._declare_lock:
+            exchange = self._exchanges.get(exchange_name)
+            if exchange is None:
+                exchange = await self.channel.declare_exchange(exchange_name, ExchangeType(exchange_type), durable=True)
+                self._exchanges[exchange_name] = exchange
+                logger.info(f"Async publisher declared exchange: {exchange_name} of type: {exchange_type}.")
+        return exchange
+
+    async def _publish_confirmed(self,
+                                 exchange: AbstractRobustExchange,
+                                 routing_key: str,
+                                 body: bytes,
+                                 headers: Optional[Dict[str, Any]]
+                                 ) -> None:
+        started_at = time.perf_counter()
+        succeeded = False
+        try:
+            await exchange.publish(
+                self._build_message(body, headers),
+                routing_key=routing_key,
+                timeout=self.confirm_timeout
+            )
+            succeeded = True
+        finally:
+            record_published_message(exchange.name, time.perf_counter() - started_at, succeeded)
+
+    @staticmethod
+    def _build_message(body: bytes, headers: Optional[Dict[str, Any]]) -> Message:
+        return Message(body, headers=headers, content_type="application/json", delivery_mode=DeliveryMode.PERSISTENT)
+
+
+async_publisher = AsyncPublisher(PUBLISHER_MAX_IN_FLIGHT, PUBLISH_CONFIRM_TIMEOUT)
@@ -1,7 +1,8 @@
 # External Library imports
 import os
 import asyncio
-from typing import Optional
+from typing import Iterator, Optional, Set
+from contextlib import contextmanager
 from dotenv import load_dotenv
 from abc import ABC, abstractmethod
 from aio_pika import ExchangeType, connect_robust
@@ -17,6 +18,7 @@ from aio_pika.abc import (
 # Internal Library imports
 from src.logger_tool import logger
 from src.database_management import get_mysqldb, Session
+from src.message_broker_management.retry_topology import RetryTopology, RETRY_POLICY
 
 
 load_dotenv()
@@ -25,6 +27,14 @@ RABBITMQ_HOST = os.getenv("RABBITMQ_HOST", "rabbitmq")
 RABBITMQ_PORT = int(os.getenv("RABBITMQ_PORT", 5672))
 RABBITMQ_USERNAME = os.getenv("RABBITMQ_USERNAME", "guest")
 RABBITMQ_PASSWORD = os.getenv("RABBITMQ_PASSWORD", "guest")
+try:
+    RABBITMQ_PREFETCH_COUNT = int(os.getenv("RABBITMQ_PREFETCH_COUNT", 32))
+except ValueError:
+    raise ValueError("RABBITMQ_PREFETCH_COUNT must be an integer.")
+try:
+    RABBITMQ_CONSUMER_SHUTDOWN_TIMEOUT = float(os.getenv("RABBITMQ_CONSUMER_SHUTDOWN_TIMEOUT", 30))
+except ValueError:
+    raise ValueError("RABBITMQ_CONSUMER_SHUTDOWN_TIMEOUT must be a number.")
 
 
 class BaseConsumer(ABC):
@@ -37,8 +47,13 @@ class BaseConsumer(ABC):
         self.exchange: Optional[AbstractRobustExchange] = None
         self.queue_name = queue_name
         self.queue: Optional[AbstractRobustQueue] = None
+        self.prefetch_count = RABBITMQ_PREFETCH_COUNT
+        self.retry_topology = RetryTopology(queue_name, RETRY_POLICY)
         self.connection: Optional[AbstractRobustConnection] = None
         self.channel: Optional[AbstractRobustChannel] = None
+        self.consumer_tag: Optional[str] = None
+        # The tasks of the messages that are being handled, which are waited for before the channel is closed.
+        self._in_flight: Set[asyncio.Task] = set()
         with get_mysqldb(as_administrator=True) as session:
             if not isinstance(session, Session):
                 raise TypeError(f"Session connection is not of type Session, but the type: {type(session).__name__}.")
@@ -67,12 +82,16 @@ class BaseConsumer(ABC):
         else:
             raise ConnectionError(f"Failed to connect to RabbitMQ after {retries} attempts (total time: {total_time} seconds).")
 
+        # Bound the unacknowledged messages delivered to this consumer, which are processed concurrently.
+        await self.channel.set_qos(prefetch_count=self.prefetch_count)
         # Declare exchange and queue
         self.exchange = await self.channel.declare_exchange(self.exchange_name, ExchangeType.FANOUT, durable=True)
         self.queue = await self.channel.declare_queue(self.queue_name, durable=True)
         await self.queue.bind(self.exchange_name)
+        # Declare the delay queues failed messages are retried through, and the dead-letter queue
+        await self.retry_topology.declare(self.channel)
         logger.info(
-            f"Connected to RabbitMQ. Declared exchange: {self.exchange_name}, queue: {self.queue_name}"
+            f"Connected to RabbitMQ. Declared exchange: {self.exchange_name}, queue: {self.queue_name}, prefetch count: {self.prefetch_count}"
         )
         
     def is_session_connected(self) -> bool:
@@ -104,6 +123,25 @@ class BaseConsumer(ABC):
             raise ConnectionError("Session connection is not established.")
         return self.session
 
+    @contextmanager
+    def open_session(self) -> Iterator[Session]:
+        """Open a session of its own for one message, as a session must not be shared between worker threads."""
+        session: Optional[Session] = None
+        try:
+            with get_mysqldb(as_administrator=True) as session:
+                yield session
+        finally:
+            if session is not None:
+                session.close()
+
+    def get_routing_key(self, message: AbstractIncomingMessage) -> str:
+        """Get the routing key the message was published with, also when it is a retry."""
+        return self.retry_topology.get_routing_key(message)
+
+    async def retry_or_dead_letter(self, message: AbstractIncomingMessage, error: BaseException) -> bool:
+        """Retry the failed message after its backoff, or dead-letter it once it has used up its attempts, and return whether it was dead-lettered."""
+        return await self.retry_topology.retry_or_dead_letter(message, error)
+
     @abstractmethod
     async def on_message(self, message: AbstractIncomingMessage):
         """Handle incoming messages."""
@@ -143,7 +181,7 @@ class BaseConsumer(ABC):
         """Start consuming messages."""
         if not self.is_rabbitmq_connected():
             logger.warning("RabbitMQ connection is not established. Attempting to reconnect...")
-            await self.stop()
+            await self.close_connection()
             logger.info("Reconnecting to RabbitMQ...")
             await self.connect()
             
@@ -151,19 +189,47 @@ class BaseConsumer(ABC):
             self.create_session_connection()
         
         logger.info(f"Starting consumer on queue: {self.queue_name}...")
-        await self.queue.consume(self.on_message)
+        self.consumer_tag = await self.queue.consume(self._on_delivery)
         
         
-    async def stop(self):
-        """Close the connection."""
-        logger.info(f"Stopping consumer on queue: {self.queue_name}...")
-        if self.connection is not None and isinstance(self.connection, AbstractRobustConnection):
-            await self.connection.close()
-            self.connection = None
-        
+    async def _on_delivery(self, message: AbstractIncomingMessage):
+        # Every delivery is handled in a task of its own, which is tracked until the message is handled.
+        task = asyncio.current_task()
+        self._in_flight.add(task)
+        try:
+            await self.on_message(message)
+        finally:
+            self._in_flight.discard(task)
+
+    async def cancel_consuming(self):
+        """Stop the deliveries of the broker and wait for the messages that are being handled, while they can still be settled."""
+        if self.queue is not None and self.consumer_tag is not None:
+            try:
+                await self.queue.cancel(self.consumer_tag)
+            except Exception as e:
+                logger.warning(f"Failed to cancel the consumer on queue: {self.queue_name}: {e}")
+            self.consumer_tag = None
+        if self._in_flight:
+            logger.info(f"Waiting for {len(self._in_flight)} messages being handled on queue: {self.queue_name}...")
+            _, pending = await asyncio.wait(set(self._in_flight), timeout=RABBITMQ_CONSUMER_SHUTDOWN_TIMEOUT)
+            if pending:
+                logger.warning(f"{len(pending)} messages were not handled within {RABBITMQ_CONSUMER_SHUTDOWN_TIMEOUT} seconds, "
+                               f"the broker redelivers them.")
+
+    async def close_connection(self):
+        """Close the channel and then the connection."""
         if self.channel is not None and isinstance(self.channel, AbstractRobustChannel):
             await self.channel.close()
             self.channel = None
+        if self.connection is not None and isinstance(self.connection, AbstractRobustConnection):
+            await self.connection.close()
+            self.connection = None
+
+    async def stop(self):
+        """Stop consuming, wait for the messages being handled to be settled, and only then close the connection."""
+        logger.info(f"Stopping consumer on queue: {self.queue_name}...")
+        await self.cancel_consuming()
+        await self.close_connection()
         if self.is_session_connected():
             self.close_session_connection()
         
@@ -1,53 +1,55 @@
 # External Library imports
 import json
 from pydantic import BaseModel
-from typing import Union, Optional
+from typing import Union, Optional, Literal
 
 # Internal library imports
 from src.logger_tool import logger
 from src.entities import BaseEntity
-from src.message_broker_management.rabbitmq_management import RabbitMQManagement
+from src.database_management import Session
+from src.repositories import OutboxRepository
+from src.message_broker_management.outbox_relay import outbox_relay
+from src.tracing_management import inject_trace_headers
 
 class BasePublisher():
     def __init__(self,
                  exchange_name: str = "employee_exchange",
-                 exchange_type: str = "topic",
+                 exchange_type: Literal['direct', 'fanout', 'topic', 'headers'] = "topic",
                  routing_key: Optional[str] = None
                  ):
-        self.rabbitmq_management = RabbitMQManagement()
-        self.rabbitmq_management.declare_exchange(exchange_name, exchange_type, durable=True)
+        self.exchange_name = exchange_name
+        self.exchange_type = exchange_type
+        self.routing_key = ''
         if routing_key is not None and isinstance(routing_key, str):
-            self.rabbitmq_management.routing_key = routing_key
+            self.routing_key = routing_key
         
     def get_exchange_name(self) -> str:
-        exchange_name = self.rabbitmq_management.exchange_name
-        if exchange_name is None:
-            logger.error("Exchange name is not set.")
-            raise ValueError("The exchange has not been declared yet.")
-        return exchange_name
+        return self.exchange_name
     
     def get_routing_key(self) -> str:
-        return self.rabbitmq_management.routing_key
+        return self.routing_key
     
-    def publish(self, message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
+    def add_to_outbox(self, session: Session, message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
+        """
+        Writes the message to the outbox in the transaction of the session instead of publishing it.
+        The outbox relay publishes it once the transaction has been committed, as part of the trace of the request.
+        """
+        message = self.to_bytes(message)
+        OutboxRepository(session).add(self.exchange_name, self.exchange_type, self.routing_key, message, inject_trace_headers())
+        outbox_relay.notify_after_commit(session)
+        logger.info(f"Message added to the outbox for exchange: {self.get_exchange_name()} with routing key: {self.get_routing_key()}.")
+    
+    @staticmethod
+    def to_bytes(message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> bytes:
         if isinstance(message, str):
-            message = message.encode()
+            return message.encode()
         elif isinstance(message, (dict, list)):
-            message = json.dumps(message).encode()
+            return json.dumps(message).encode()
         elif isinstance(message, BaseModel):
-            message = message.model_dump_json().encode()
+            return message.model_dump_json().encode()
         elif isinstance(message, BaseEntity):
-            message = message.to_bytes()
+            return message.to_bytes()
         elif not isinstance(message, bytes):
             logger.error(f"Invalid message type: {type(message).__name__}. Expected str, bytes, dict, list, Pydantic BaseModel, or a MySQLAlchemy BaseEntity.")
             raise TypeError("Message must be a string, bytes, a JSON-serializable object, a Pydantic BaseModel instance or a MySQLAlchemy BaseEntity instance.")
-        
-        logger.info(f"Publishing message: {message}...")
-        self.rabbitmq_management.publish_message(message)
-        logger.info(f"Message successfully published to exchange: {self.get_exchange_name()} with routing key: {self.get_routing_key()}.")
-    
-    
-    def close_connection(self) -> None:
-        logger.info(f"Closing connection to the exchange: {self.get_exchange_name()}")
-        self.rabbitmq_management.connection.close()
-        logger.info("Connection closed successfully.")
+        return message
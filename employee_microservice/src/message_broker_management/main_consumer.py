@@ -1,10 +1,34 @@
 # External Library imports
+import os
 import json
+import time
+import asyncio
+from typing import Optional
+from dotenv import load_dotenv
 
 # Internal Library imports
-from src.logger_tool import logger
+from src.logger_tool import logger, payload_for_log
 from src.message_broker_management.base_consumer import BaseConsumer, AbstractIncomingMessage
+from src.message_broker_management.keyed_worker_pool import KeyedWorkerPool
 from src.util import handle_messages
+from src.tracing_management import consume_span, set_consume_outcome
+from src.metrics_management import (
+    record_consumed_message,
+    record_settled_message,
+    ACKED,
+    RETRIED,
+    DEAD_LETTERED,
+    REQUEUED
+)
+
+
+load_dotenv()
+
+try:
+    RABBITMQ_CONSUMER_WORKER_THREADS = int(os.getenv("RABBITMQ_CONSUMER_WORKER_THREADS", 4))
+except ValueError:
+    raise ValueError("RABBITMQ_CONSUMER_WORKER_THREADS must be an integer.")
+
 
 class MainConsumer(BaseConsumer):
     def __init__(self):
@@ -12,25 +36,65 @@ class MainConsumer(BaseConsumer):
             exchange_name="admin_exchange",
             queue_name="employee_microservice_queue",
         )
+        # The messages are handled on worker threads of their own, so a burst of admin changes
+        # neither blocks the event loop nor takes the worker threads of the API.
+        self.worker_pool = KeyedWorkerPool(RABBITMQ_CONSUMER_WORKER_THREADS)
+
+    @staticmethod
+    def get_ordering_key(message_data: dict) -> str:
+        """
+        Messages about the same employee, such as 'employee.created' and 'employee.updated' of one employee,
+        must be handled in the order they were published, messages about different employees need not be.
+        """
+        employee_id = message_data.get("id") if isinstance(message_data, dict) else None
+        return f"employee:{employee_id}"
 
     async def on_message(self, message: AbstractIncomingMessage):
-        """Handle incoming messages."""
-        async with message.process(requeue=True, reject_on_redelivered=True):
+        """Handle incoming messages, in the trace of the request that published them."""
+        started_at = time.perf_counter()
+        routing_key = self.get_routing_key(message)
+        record_consumed_message(self.queue_name, routing_key)
+        outcome = REQUEUED
+        error: Optional[Exception] = None
+        with consume_span(message.headers, self.exchange_name, self.queue_name, routing_key) as span:
             try:
-                logger.info(f"Received message with routing key: {message.routing_key}")
-                # Decode the message and log it
-                message_body: str = message.body.decode("utf-8")
-                logger.info(f"Received message to process: {message_body}")
-                # Parse the message body as JSON
-                message_data = json.loads(message_body)
-                # Handle the message based on the routing key
-                handle_messages.handle_message(self.get_session_connection(), message_data, message.routing_key)
-                logger.info(f"Message processed successfully: {message_data}")
-            except Exception as e:
-                # Log the error
-                logger.error(f"Error processing message: {e}")
-                logger.warning(f"Will requeue the message: {message.body}")
-                raise
+                # A failed message is acknowledged once it has been retried, it is only requeued if retrying it failed.
+                async with message.process(requeue=True, ignore_processed=True):
+                    try:
+                        logger.info("Received message with routing key: %s", routing_key)
+                        # Decode the message and log it
+                        message_body: str = message.body.decode("utf-8")
+                        logger.info("Received message to process: %s", payload_for_log(message_body))
+                        # Parse the message body as JSON
+                        message_data = json.loads(message_body)
+                        # Handle the message based on the routing key on a worker thread. The message is queued
+                        # behind the earlier messages of its employee before anything is awaited, which keeps their order.
+                        await self.worker_pool.run(
+                            self.get_ordering_key(message_data),
+                            lambda: self.handle_message(message_data, routing_key)
+                        )
+                        logger.info("Message processed successfully: %s", payload_for_log(message_data))
+                        outcome = ACKED
+                    except Exception as e:
+                        error = e
+                        # Log the error
+                        logger.error(f"Error processing message: {e}")
+                        outcome = DEAD_LETTERED if await self.retry_or_dead_letter(message, e) else RETRIED
+            finally:
+                set_consume_outcome(span, outcome, error)
+                record_settled_message(self.queue_name, routing_key, outcome, time.perf_counter() - started_at)
+
+    def handle_message(self, message_data: dict, routing_key: str) -> None:
+        """Handle the message on a worker thread, in a session of its own."""
+        with self.open_session() as session:
+            handle_messages.handle_message(session, message_data, routing_key)
+
+    async def stop(self):
+        # The deliveries are cancelled and the messages being handled are settled while the channel is still open,
+        # only then are the worker threads stopped and the connection closed.
+        await self.cancel_consuming()
+        await asyncio.to_thread(self.worker_pool.shutdown)
+        await super().stop()
 
 
 
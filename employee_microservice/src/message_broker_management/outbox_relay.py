@@ -0,0 +1,193 @@
+# External Library imports
+import os
+import time
+import asyncio
+from itertools import groupby
+from contextlib import ExitStack
+from datetime import timedelta
+from dotenv import load_dotenv
+from sqlalchemy import event
+from typing import Any, Dict, Optional
+
+# Internal library imports
+from src.logger_tool import logger
+from src.entities import utc_now
+from src.repositories import OutboxRepository
+from src.database_management import Session, get_mysqldb, run_in_thread_pool
+from src.message_broker_management.async_publisher import async_publisher
+from src.tracing_management import publish_span
+
+
+load_dotenv()
+
+try:
+    OUTBOX_RELAY_BATCH_SIZE: int = int(os.getenv('OUTBOX_RELAY_BATCH_SIZE', 100))
+    OUTBOX_RELAY_POLL_SECONDS: float = float(os.getenv('OUTBOX_RELAY_POLL_SECONDS', 5))
+    OUTBOX_RELAY_RETRY_SECONDS: float = float(os.getenv('OUTBOX_RELAY_RETRY_SECONDS', 5))
+    OUTBOX_RETENTION_HOURS: float = float(os.getenv('OUTBOX_RETENTION_HOURS', 168))
+except ValueError:
+    raise ValueError('OUTBOX_RELAY_BATCH_SIZE must be an integer and OUTBOX_RELAY_POLL_SECONDS, '
+                     'OUTBOX_RELAY_RETRY_SECONDS and OUTBOX_RETENTION_HOURS must be numbers')
+
+# How often published messages older than the retention are deleted.
+OUTBOX_CLEANUP_INTERVAL_SECONDS = 3600
+
+
+class OutboxRelay():
+    """
+    Publishes the messages of the outbox table to RabbitMQ in a background task of the event loop.
+
+    The services write their messages to the outbox in the same transaction as their changes,
+    so a message is published if and only if its changes were committed, and a request no longer
+    waits for the broker. After every commit that wrote to the outbox the relay is woken up and
+    drains it in batches; it also polls, so messages written by another instance of the service
+    or left behind by a failed publish are published too.
+
+    A batch is claimed with SELECT ... FOR UPDATE SKIP LOCKED, published with publisher confirms
+    and only then marked as published in the same transaction. If the process dies between the
+    confirm and the commit the batch is published again, so delivery is at least once and the
+    consumers must be idempotent.
+    """
+
+    def __init__(self, batch_size: int, poll_seconds: float, retry_seconds: float, retention_hours: float) -> None:
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.retry_seconds = retry_seconds
+        self.retention = timedelta(hours=retention_hours)
+        self.published: int = 0
+        self.batches: int = 0
+        self.failures: int = 0
+        self.last_batch_size: int = 0
+        # The relay lag is the time between writing a message to the outbox and the broker confirming it.
+        self.last_relay_lag_seconds: float = 0.0
+        self.max_relay_lag_seconds: float = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._last_cleanup: float = 0.0
+
+    def start(self) -> None:
+        """Start draining the outbox in a background task. Must be called on the event loop of the application."""
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name="outbox-relay")
+            logger.info("Outbox relay started.")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        self._loop = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            logger.info("Outbox relay stopped.")
+
+    def notify(self) -> None:
+        """Wake the relay up to publish new messages, can be called from any thread."""
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._wake.set)
+
+    def notify_after_commit(self, session: Session) -> None:
+        """Wake the relay up once the transaction of the session has been committed."""
+        event.listen(session, "after_commit", lambda _: self.notify(), once=True)
+
+    def statistics(self) -> Dict[str, Any]:
+        # Queries the backlog, so it is read when Prometheus scrapes the service, on a thread of the metrics endpoint.
+        # Without the database the backlog is left out, the counters of the relay are still reported.
+        unpublished, oldest_unpublished_age_seconds = None, None
+        try:
+            unpublished, oldest_unpublished_created_at = self._get_backlog()
+            oldest_unpublished_age_seconds = 0.0
+            if oldest_unpublished_created_at is not None:
+                oldest_unpublished_age_seconds = round(max((utc_now() - oldest_unpublished_created_at).total_seconds(), 0.0), 3)
+        except Exception as e:
+            logger.warning(f"Failed to read the backlog of the outbox: {e}")
+        return {
+            "is_running": self._task is not None,
+            "unpublished": unpublished,
+            "oldest_unpublished_age_seconds": oldest_unpublished_age_seconds,
+            "published": self.published,
+            "batches": self.batches,
+            "failures": self.failures,
+            "last_batch_size": self.last_batch_size,
+            "last_relay_lag_seconds": round(self.last_relay_lag_seconds, 6),
+            "max_relay_lag_seconds": round(self.max_relay_lag_seconds, 6),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            self._wake.clear()
+            try:
+                # Keep publishing full batches until the outbox is drained.
+                while await run_in_thread_pool(self._relay_batch) >= self.batch_size:
+                    pass
+                if time.monotonic() - self._last_cleanup >= OUTBOX_CLEANUP_INTERVAL_SECONDS:
+                    await run_in_thread_pool(self._delete_expired)
+                    self._last_cleanup = time.monotonic()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                logger.error(f"Failed to relay the outbox, retrying in {self.retry_seconds} seconds: {e}")
+                await asyncio.sleep(self.retry_seconds)
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def _relay_batch(self) -> int:
+        # Runs on a worker thread, which waits for the confirms while the event loop does the I/O.
+        with get_mysqldb() as session:
+            repository = OutboxRepository(session)
+            outbox_messages = repository.claim_unpublished(self.batch_size)
+            if not outbox_messages:
+                return 0
+            # Consecutive messages to the same exchange are published as one batch, keeping their order.
+            for (exchange_name, exchange_type), group in groupby(
+                    outbox_messages, key=lambda message: (message.exchange_name, message.exchange_type)):
+                # Every message is published as part of the trace of the request that wrote it.
+                with ExitStack() as publish_spans:
+                    batch = [
+                        (
+                            message.routing_key,
+                            message.body,
+                            publish_spans.enter_context(publish_span(exchange_name, message.routing_key, message.get_trace_headers()))
+                        )
+                        for message in group
+                    ]
+                    async_publisher.publish_batch_from_thread(exchange_name, exchange_type, batch)
+            published_at = utc_now()
+            repository.mark_published(outbox_messages, published_at)
+            relay_lag_seconds = (published_at - min(message.created_at for message in outbox_messages)).total_seconds()
+
+        self.published += len(outbox_messages)
+        self.batches += 1
+        self.last_batch_size = len(outbox_messages)
+        self.last_relay_lag_seconds = relay_lag_seconds
+        self.max_relay_lag_seconds = max(self.max_relay_lag_seconds, relay_lag_seconds)
+        logger.info(f"Outbox relay published {len(outbox_messages)} messages with a relay lag of {relay_lag_seconds:.3f} seconds.")
+        return len(outbox_messages)
+
+    def _delete_expired(self) -> None:
+        with get_mysqldb() as session:
+            deleted = OutboxRepository(session).delete_published_before(utc_now() - self.retention)
+        if deleted:
+            logger.info(f"Outbox relay deleted {deleted} published messages older than {self.retention}.")
+
+    def _get_backlog(self):
+        with get_mysqldb() as session:
+            repository = OutboxRepository(session)
+            return repository.count_unpublished(), repository.get_oldest_unpublished_created_at()
+
+
+outbox_relay = OutboxRelay(
+    OUTBOX_RELAY_BATCH_SIZE,
+    OUTBOX_RELAY_POLL_SECONDS,
+    OUTBOX_RELAY_RETRY_SECONDS,
+    OUTBOX_RETENTION_HOURS
+)
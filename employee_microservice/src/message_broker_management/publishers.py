@@ -1,7 +1,6 @@
 # Internal library imports
 from src.message_broker_management.base_publisher import BasePublisher
-from typing import Optional
-from .base_publisher import BaseModel, Union, BaseEntity
+from .base_publisher import BaseModel, Union, BaseEntity, Session
 
 
 
@@ -14,36 +13,25 @@ class InsuranceUpdatedPublisher(BasePublisher):
     def __init__(self):
         super().__init__(routing_key="insurance.updated")
 
-def publish_insurance_created_message(message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
-    insurance_created_publisher: Optional[InsuranceCreatedPublisher] = None
-    try:
-        insurance_created_publisher = InsuranceCreatedPublisher()
-        insurance_created_publisher.publish(message)
-    finally:
-        if insurance_created_publisher:
-            insurance_created_publisher.close_connection()
-
-def publish_insurance_updated_message(message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
-    insurance_updated_publisher: Optional[InsuranceUpdatedPublisher] = None
-    try:
-        insurance_updated_publisher = InsuranceUpdatedPublisher()
-        insurance_updated_publisher.publish(message)
-    finally:
-        if insurance_updated_publisher:
-            insurance_updated_publisher.close_connection()
+
+# The publishers hold no connection of their own, their messages are written to the outbox
+# in the transaction of the session and published by the outbox relay after the commit.
+insurance_created_publisher = InsuranceCreatedPublisher()
+insurance_updated_publisher = InsuranceUpdatedPublisher()
+
+def publish_insurance_created_message(session: Session, message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
+    insurance_created_publisher.add_to_outbox(session, message)
+
+def publish_insurance_updated_message(session: Session, message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
+    insurance_updated_publisher.add_to_outbox(session, message)
             
 
 class ModelCreatedPublisher(BasePublisher):
     def __init__(self):
         super().__init__(routing_key="model.created")
-        
 
-def publish_model_created_message(message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
-    model_created_publisher: Optional[ModelCreatedPublisher] = None
-    try:
-        model_created_publisher = ModelCreatedPublisher()
-        model_created_publisher.publish(message)
-    finally:
-        if model_created_publisher:
-            model_created_publisher.close_connection()
 
+model_created_publisher = ModelCreatedPublisher()
+
+def publish_model_created_message(session: Session, message: Union[str, bytes, dict, list, BaseModel, BaseEntity]) -> None:
+    model_created_publisher.add_to_outbox(session, message)
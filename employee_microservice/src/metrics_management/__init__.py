@@ -0,0 +1,12 @@
+from .statistics_collector import StatisticsCollector, register_statistics
+from .http_metrics import HttpMetricsMiddleware, get_metrics_response
+from .database_metrics import instrument_engine
+from .broker_metrics import (
+    record_consumed_message,
+    record_settled_message,
+    record_published_message,
+    ACKED,
+    RETRIED,
+    DEAD_LETTERED,
+    REQUEUED
+)
@@ -0,0 +1,59 @@
+# External Library imports
+import time
+from typing import Any
+from sqlalchemy import Engine, event
+from prometheus_client import Counter, Histogram
+
+
+DATABASE_DURATION_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+MYSQL_QUERY_DURATION = Histogram(
+    "mysql_query_duration_seconds",
+    "The round trip time of the MySQL statements, by their operation such as SELECT, INSERT or UPDATE.",
+    ["operation"],
+    buckets=DATABASE_DURATION_BUCKETS
+)
+MYSQL_QUERY_FAILURES = Counter(
+    "mysql_query_failures",
+    "The MySQL statements that failed.",
+    ["operation"]
+)
+
+# The start times of the statements that are running on a connection, kept in the info of the connection.
+_STARTED_AT_KEY = "metrics_statements_started_at"
+OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE"})
+
+
+def get_operation(statement: str) -> str:
+    """The operation of a SQL statement, any other than SELECT, INSERT, UPDATE or DELETE counts as 'OTHER'."""
+    operation = statement.lstrip()[:6].upper()
+    return operation if operation in OPERATIONS else "OTHER"
+
+
+def _before_cursor_execute(connection: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    connection.info.setdefault(_STARTED_AT_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(connection: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    started_at = connection.info[_STARTED_AT_KEY].pop()
+    MYSQL_QUERY_DURATION.labels(get_operation(statement)).observe(time.perf_counter() - started_at)
+
+
+def _handle_error(exception_context: Any) -> None:
+    started_at_stack = exception_context.connection.info.get(_STARTED_AT_KEY) if exception_context.connection is not None else None
+    if not started_at_stack:
+        return
+    operation = get_operation(exception_context.statement or "")
+    MYSQL_QUERY_DURATION.labels(operation).observe(time.perf_counter() - started_at_stack.pop())
+    MYSQL_QUERY_FAILURES.labels(operation).inc()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Observes the duration of every statement the engine executes, an `executemany` counting as one statement.
+
+    :param Engine engine: The engine to instrument.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -7,3 +7,4 @@ from .employee_repository import EmployeeRepository
 from .insurance_repository import InsuranceRepository
 from .model_repository import ModelRepository
 from .purchase_repository import PurchaseRepository
+from .outbox_repository import OutboxRepository
@@ -1,5 +1,5 @@
 # External Library imports
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 
 # Internal library imports
 from src.entities import AccessoryEntity
@@ -36,3 +36,18 @@ class AccessoryRepository(BaseRepository):
         return self.session.get(AccessoryEntity, accessory_id)
 
 
+    def get_by_ids(self, accessory_ids: Iterable[str]) -> Dict[str, AccessoryEntity]:
+        """
+        Retrieves the accessories with the given IDs from the Employee MySQL database in one query.
+        
+        :param accessory_ids: The IDs of the accessories to retrieve.
+        :type accessory_ids: Iterable[str]
+        :return: The accessories that were found by their ID, IDs that do not exist are left out.
+        :rtype: dict[str, AccessoryEntity]
+        """
+        accessory_ids = set(accessory_ids)
+        if not accessory_ids:
+            return {}
+        accessories_query = self.session.query(AccessoryEntity).filter(AccessoryEntity.id.in_(accessory_ids))
+        return {accessory.id: accessory for accessory in accessories_query.all()}
+
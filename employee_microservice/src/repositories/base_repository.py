@@ -1,8 +1,12 @@
 # External Library imports
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Tuple, Type
+from sqlalchemy import and_, or_, text
+from sqlalchemy.orm import Query
 
-# Internal library imports
+# Internal Library imports
 from src.database_management import Session
+from src.entities.base_entity import BaseEntity
 
 
 class BaseRepository:
@@ -23,3 +27,54 @@ class BaseRepository:
         :rtype: bool
         """
         return limit is not None and isinstance(limit, int) and limit > 0
+
+
+    def apply_keyset_pagination(
+            self,
+            query: Query,
+            entity: Type[BaseEntity],
+            after: Optional[Tuple[datetime, str]] = None
+    ) -> Query:
+        """
+        Orders a query by the (created_at, id) index of the entity and, if a cursor is given,
+        only keeps the rows after it, so a page never has to skip over the rows before it.
+
+        :param query: The query to paginate.
+        :type query: Query
+        :param entity: The entity of the table being paginated.
+        :type entity: Type[BaseEntity]
+        :param after: The (created_at, id) of the last row of the previous page (optional).
+        :type after: Tuple[datetime, str] | None
+        :return: The ordered and filtered query.
+        :rtype: Query
+        """
+        if after is not None:
+            after_created_at, after_id = after
+            query = query.filter(
+                or_(
+                    entity.created_at > after_created_at,
+                    and_(entity.created_at == after_created_at, entity.id > after_id)
+                )
+            )
+        return query.order_by(entity.created_at, entity.id)
+
+
+    def get_approximate_count(self, entity: Type[BaseEntity]) -> Optional[int]:
+        """
+        Retrieves the approximate amount of rows in the table of the entity from the table statistics,
+        which is much cheaper than counting the rows.
+
+        :param entity: The entity of the table to count.
+        :type entity: Type[BaseEntity]
+        :return: The approximate amount of rows, None if the statistics are not available.
+        :rtype: int | None
+        """
+        if self.session.get_bind().dialect.name != "mysql":
+            return None
+        return self.session.execute(
+            text(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name"
+            ),
+            {"table_name": entity.__tablename__}
+        ).scalar()
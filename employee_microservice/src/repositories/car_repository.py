@@ -1,7 +1,8 @@
 # External Library imports
-from datetime import date
-from typing import Optional, List
+from datetime import date, datetime
+from typing import Optional, List, Tuple
 from sqlalchemy import exists
+from sqlalchemy.orm.attributes import set_committed_value
 
 
 # Internal library imports
@@ -50,10 +51,15 @@ class CarRepository(BaseRepository):
             employee: Optional[EmployeeEntity] = None,
             is_purchased: Optional[bool] = None,
             is_past_purchase_deadline: Optional[bool] = None,
-            limit: Optional[int] = None
-    ) -> List[CarEntity]:
+            limit: Optional[int] = None,
+            after: Optional[Tuple[datetime, str]] = None
+    ) -> List[Tuple[CarEntity, bool]]:
         """
-        Retrieves a list of cars from the Employee MySQL database based on various filters.
+        Retrieves a list of cars from the Employee MySQL database based on various filters,
+        together with whether each car has been purchased.
+        
+        The purchase status is selected as a correlated EXISTS column in the same statement,
+        so listing cars does not need an extra query per car.
         
         :param customer: Filter for cars by customer (optional).
         :type customer: CustomerEntity | None
@@ -65,10 +71,13 @@ class CarRepository(BaseRepository):
         :type is_past_purchase_deadline: bool | None
         :param limit: The maximum number of cars to retrieve (optional).
         :type limit: int | None
-        :return: A list of cars.
-        :rtype: List[CarEntity]
+        :param after: The (created_at, id) of the last car of the previous page (optional).
+        :type after: Tuple[datetime, str] | None
+        :return: A list of cars ordered by creation time paired with whether they are purchased.
+        :rtype: List[Tuple[CarEntity, bool]]
         """
-        cars_query = self.session.query(CarEntity)
+        is_purchased_column = exists().where(PurchaseEntity.cars_id == CarEntity.id).label("is_purchased")
+        cars_query = self.session.query(CarEntity, is_purchased_column)
         if customer is not None and isinstance(customer, CustomerEntity):
             cars_query = cars_query.filter_by(customers_id=customer.id)
         if employee is not None and isinstance(employee, EmployeeEntity):
@@ -89,10 +98,11 @@ class CarRepository(BaseRepository):
             else:
                 cars_query = cars_query.filter(CarEntity.purchase_deadline >= current_date)
 
+        cars_query = self.apply_keyset_pagination(cars_query, CarEntity, after)
         if self.limit_is_valid(limit):
             cars_query = cars_query.limit(limit)
 
-        return cars_query.all()
+        return [(car, bool(is_car_purchased)) for car, is_car_purchased in cars_query.all()]
 
 
     def get_by_id(self, car_id: str) -> Optional[CarEntity]:
@@ -120,6 +130,9 @@ class CarRepository(BaseRepository):
         """
         Creates a new car in the Employee MySQL database.
         
+        The car is inserted with one statement, and each of its association tables with
+        one executemany. The returned car is not reloaded, its relationships are the given entities.
+        
         :param car_create_data: The data for the car to create.
         :type car_create_data: CarCreateResource
         :param customer: The customer associated with the car.
@@ -158,18 +171,27 @@ class CarRepository(BaseRepository):
             self.session.add(new_car)
             self.session.flush()
 
-            for accessory in accessories:
-                insert = cars_has_accessories.insert(
-                ).values(cars_id=car_id, accessories_id=accessory.id)
-                self.session.execute(insert)
-
-            for insurance in insurances:
-                insert = cars_has_insurances.insert(
-                ).values(cars_id=car_id, insurances_id=insurance.id)
-                self.session.execute(insert)
+            # The associations are inserted with one executemany per table.
+            if accessories:
+                self.session.execute(
+                    cars_has_accessories.insert(),
+                    [{"cars_id": car_id, "accessories_id": accessory.id} for accessory in accessories]
+                )
+            if insurances:
+                self.session.execute(
+                    cars_has_insurances.insert(),
+                    [{"cars_id": car_id, "insurances_id": insurance.id} for insurance in insurances]
+                )
 
-            self.session.flush()
-            self.session.refresh(new_car)
+            # The related entities are already loaded, so they are set as the loaded state of the car
+            # instead of reloading the car and all of its eager relationships. Setting them as committed
+            # values keeps the unit of work from inserting the associations a second time.
+            set_committed_value(new_car, "model", model)
+            set_committed_value(new_car, "color", color)
+            set_committed_value(new_car, "customer", customer)
+            set_committed_value(new_car, "employee", employee)
+            set_committed_value(new_car, "accessories", list(accessories))
+            set_committed_value(new_car, "insurances", list(insurances))
             return new_car
         except Exception as e:
             logger.error(f"There was an error while creating a car, so will be doing a rollback: {e}")
@@ -1,5 +1,6 @@
 # External Library imports
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple
 
 
 # Internal library imports
@@ -17,7 +18,8 @@ class CustomerRepository(BaseRepository):
     def get_all(
             self,
             email_filter: Optional[str] = None,
-            limit: Optional[int] = None
+            limit: Optional[int] = None,
+            after: Optional[Tuple[datetime, str]] = None
     ) -> List[CustomerEntity]:
         """
         Retrieves a list of customers from the Employee MySQL database.
@@ -26,12 +28,15 @@ class CustomerRepository(BaseRepository):
         :type email_filter: str | None
         :param limit: The maximum number of customers to retrieve (optional).
         :type limit: int | None
-        :return: A list of customers.
+        :param after: The (created_at, id) of the last customer of the previous page (optional).
+        :type after: Tuple[datetime, str] | None
+        :return: A list of customers ordered by creation time.
         :rtype: List[CustomerEntity]
         """
         customers_query = self.session.query(CustomerEntity)
         if email_filter is not None and isinstance(email_filter, str):
             customers_query = customers_query.filter(CustomerEntity.email.contains(email_filter))
+        customers_query = self.apply_keyset_pagination(customers_query, CustomerEntity, after)
         if self.limit_is_valid(limit):
             customers_query = customers_query.limit(limit)
         return customers_query.all()
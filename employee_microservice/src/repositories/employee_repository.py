@@ -1,5 +1,6 @@
 # External Library imports
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple
 
 # Internal library imports
 from src.entities import EmployeeEntity, EmployeeMesssage
@@ -10,7 +11,8 @@ class EmployeeRepository(BaseRepository):
     def get_all(
         self, 
         limit: Optional[int] = None, 
-        deletion_filter: Optional[bool] = None
+        deletion_filter: Optional[bool] = None,
+        after: Optional[Tuple[datetime, str]] = None
     ) -> List[EmployeeEntity]:
         """
         Retrieves a list of employees from the Employee MySQL database.
@@ -23,7 +25,9 @@ class EmployeeRepository(BaseRepository):
                                 - `True`: Only deleted employees.
                                 - `False`: Both active and deleted employees.
         :type deletion_filter: bool | None
-        :return: A list of employees.
+        :param after: The (created_at, id) of the last employee of the previous page (optional).
+        :type after: Tuple[datetime, str] | None
+        :return: A list of employees ordered by creation time.
         :rtype: List[EmployeeEntity]
         """
         employee_query = self.session.query(EmployeeEntity)
@@ -36,6 +40,8 @@ class EmployeeRepository(BaseRepository):
             # Return only deleted employees
             employee_query = employee_query.filter(EmployeeEntity.is_deleted == True)
 
+        employee_query = self.apply_keyset_pagination(employee_query, EmployeeEntity, after)
+
         # Apply the limit if provided
         if self.limit_is_valid(limit):
             employee_query = employee_query.limit(limit)
@@ -1,5 +1,5 @@
 # External Library imports
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 
 # Internal library imports
 from src.entities import InsuranceEntity
@@ -35,6 +35,21 @@ class InsuranceRepository(BaseRepository):
         """
         return self.session.get(InsuranceEntity, insurance_id)
     
+    def get_by_ids(self, insurance_ids: Iterable[str]) -> Dict[str, InsuranceEntity]:
+        """
+        Retrieves the insurances with the given IDs from the Employee MySQL database in one query.
+        
+        :param insurance_ids: The IDs of the insurances to retrieve.
+        :type insurance_ids: Iterable[str]
+        :return: The insurances that were found by their ID, IDs that do not exist are left out.
+        :rtype: dict[str, InsuranceEntity]
+        """
+        insurance_ids = set(insurance_ids)
+        if not insurance_ids:
+            return {}
+        insurances_query = self.session.query(InsuranceEntity).filter(InsuranceEntity.id.in_(insurance_ids))
+        return {insurance.id: insurance for insurance in insurances_query.all()}
+    
     def create(self, insurance_create_data: InsuranceCreateResource) -> InsuranceEntity:
         """
         Creates a new insurance in the Employee MySQL database.
@@ -73,7 +88,7 @@ class InsuranceRepository(BaseRepository):
         for key, value in insurance_update_data.get_updated_fields().items():
             setattr(insurance, key, value)
         
-        self.session.commit()
+        self.session.flush()
         self.session.refresh(insurance)
         
         return insurance
@@ -0,0 +1,144 @@
+# External Library imports
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional
+
+# Internal library imports
+from src.entities import OutboxMessageEntity
+from src.repositories.base_repository import BaseRepository
+
+
+class OutboxRepository(BaseRepository):
+    def add(self,
+            exchange_name: str,
+            exchange_type: Literal['direct', 'fanout', 'topic', 'headers'],
+            routing_key: str,
+            body: bytes,
+            trace_headers: Optional[Dict[str, Any]] = None
+            ) -> OutboxMessageEntity:
+        """
+        Adds a message to the outbox in the transaction of the session, so it is only
+        published if the changes it describes are committed.
+        
+        :param exchange_name: The name of the exchange to publish the message to.
+        :type exchange_name: str
+        :param exchange_type: The type of the exchange.
+        :type exchange_type: str
+        :param routing_key: The routing key of the message.
+        :type routing_key: str
+        :param body: The message body.
+        :type body: bytes
+        :param trace_headers: The W3C trace context of the change, the `traceparent` and `tracestate` headers.
+        :type trace_headers: dict | None
+        :return: The added outbox message.
+        :rtype: OutboxMessageEntity
+        """
+        outbox_message = OutboxMessageEntity(
+            exchange_name=exchange_name,
+            exchange_type=exchange_type,
+            routing_key=routing_key,
+            body=body,
+            traceparent=(trace_headers or {}).get("traceparent"),
+            tracestate=(trace_headers or {}).get("tracestate")
+        )
+        self.session.add(outbox_message)
+        self.session.flush()
+        return outbox_message
+    
+    def claim_unpublished(self, limit: int) -> List[OutboxMessageEntity]:
+        """
+        Retrieves and locks the oldest unpublished messages, in the order they were written.
+        
+        Rows locked by another relay are skipped, so several instances of the service
+        can drain the outbox without publishing the same message twice.
+        
+        :param limit: The maximum number of messages to claim.
+        :type limit: int
+        :return: A list of OutboxMessageEntity objects, locked until the transaction ends.
+        :rtype: list[OutboxMessageEntity]
+        """
+        return (
+            self.session.query(OutboxMessageEntity)
+            .filter(OutboxMessageEntity.published_at.is_(None))
+            .order_by(OutboxMessageEntity.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+    
+    def mark_published(self, outbox_messages: List[OutboxMessageEntity], published_at: datetime) -> None:
+        """
+        Marks the claimed messages as published.
+        
+        :param outbox_messages: The published messages.
+        :type outbox_messages: list[OutboxMessageEntity]
+        :param published_at: The UTC time the messages were confirmed by the broker.
+        :type published_at: datetime
+        """
+        for outbox_message in outbox_messages:
+            outbox_message.published_at = published_at
+        self.session.flush()
+    
+    def requeue_range(self, created_from: datetime, created_to: datetime) -> int:
+        """
+        Marks every published message written within the time range as unpublished again,
+        so the relay publishes it once more.
+        
+        :param created_from: The inclusive UTC start of the range.
+        :type created_from: datetime
+        :param created_to: The exclusive UTC end of the range.
+        :type created_to: datetime
+        :return: The number of requeued messages.
+        :rtype: int
+        """
+        return (
+            self.session.query(OutboxMessageEntity)
+            .filter(
+                OutboxMessageEntity.created_at >= created_from,
+                OutboxMessageEntity.created_at < created_to,
+                OutboxMessageEntity.published_at.is_not(None)
+            )
+            .update({OutboxMessageEntity.published_at: None}, synchronize_session=False)
+        )
+    
+    def delete_published_before(self, published_before: datetime) -> int:
+        """
+        Deletes the messages that were published before the given time.
+        
+        :param published_before: The UTC time before which published messages are deleted.
+        :type published_before: datetime
+        :return: The number of deleted messages.
+        :rtype: int
+        """
+        return (
+            self.session.query(OutboxMessageEntity)
+            .filter(OutboxMessageEntity.published_at < published_before)
+            .delete(synchronize_session=False)
+        )
+    
+    def get_oldest_unpublished_created_at(self) -> Optional[datetime]:
+        """
+        Retrieves when the oldest unpublished message was written.
+        
+        :return: The UTC creation time of the oldest unpublished message, None if every message is published.
+        :rtype: datetime | None
+        """
+        return (
+            self.session.query(OutboxMessageEntity.created_at)
+            .filter(OutboxMessageEntity.published_at.is_(None))
+            .order_by(OutboxMessageEntity.id)
+            .limit(1)
+            .scalar()
+        )
+    
+    def count_unpublished(self) -> int:
+        """
+        Counts the messages that are waiting to be published.
+        
+        :return: The number of unpublished messages.
+        :rtype: int
+        """
+        return (
+            self.session.query(OutboxMessageEntity)
+            .filter(OutboxMessageEntity.published_at.is_(None))
+            .count()
+        )
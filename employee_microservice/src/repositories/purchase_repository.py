@@ -1,5 +1,6 @@
 # External Library imports
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple
 
 # Internal library imports
 from src.resources import PurchaseCreateResource
@@ -14,7 +15,12 @@ from src.entities import (
 
 class PurchaseRepository(BaseRepository):
 
-    def get_all(self, employee: Optional[EmployeeEntity], limit: Optional[int] = None) -> List[PurchaseEntity]:
+    def get_all(
+            self,
+            employee: Optional[EmployeeEntity],
+            limit: Optional[int] = None,
+            after: Optional[Tuple[datetime, str]] = None
+    ) -> List[PurchaseEntity]:
         """
         Retrieves a list of purchases from the Employee MySQL database.
         
@@ -22,14 +28,20 @@ class PurchaseRepository(BaseRepository):
         :type employee: EmployeeEntity | None
         :param limit: The maximum number of purchases to retrieve (optional).
         :type limit: int | None
-        :return: A list of purchases.
+        :param after: The (created_at, id) of the last purchase of the previous page (optional).
+        :type after: Tuple[datetime, str] | None
+        :return: A list of purchases ordered by creation time.
         :rtype: List[PurchaseEntity]
         """
         purchases_query = self.session.query(PurchaseEntity)
+        if employee is not None and isinstance(employee, EmployeeEntity):
+            # Filter on the employee of the purchased car in the database, before the limit is applied.
+            purchases_query = purchases_query.join(
+                CarEntity, PurchaseEntity.cars_id == CarEntity.id
+            ).filter(CarEntity.employees_id == employee.id)
+        purchases_query = self.apply_keyset_pagination(purchases_query, PurchaseEntity, after)
         if self.limit_is_valid(limit):
             purchases_query = purchases_query.limit(limit)
-        if employee is not None and isinstance(employee, EmployeeEntity):
-            return [purchase for purchase in purchases_query.all() if purchase.cars_id == employee.id]
         return purchases_query.all()
 
 
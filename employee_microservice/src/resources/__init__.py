@@ -40,3 +40,9 @@ from .purchase_resource import (
     PurchaseReturnResource,
     PurchaseCreateResource
 )
+from .page_resource import (
+    PageResource
+)
+from .outbox_resource import (
+    OutboxReplayResource
+)
@@ -0,0 +1,19 @@
+# External Library imports
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+
+class OutboxReplayResource(BaseModel):
+    created_from: datetime = Field(
+        default=...,
+        description="The inclusive UTC start of the replayed time range."
+    )
+    created_to: datetime = Field(
+        default=...,
+        description="The exclusive UTC end of the replayed time range."
+    )
+    requeued_messages: int = Field(
+        default=...,
+        description="The number of published messages that will be published again.",
+        examples=[42]
+    )
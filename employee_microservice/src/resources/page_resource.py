@@ -0,0 +1,20 @@
+# External Library imports
+from typing import Generic, List, Optional, TypeVar
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+class PageResource(BaseModel, Generic[T]):
+    items: List[T] = Field(
+        default=...,
+        description="The items of the page."
+    )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="The cursor to give as 'after' to retrieve the next page, None if this is the last page."
+    )
+    approximate_total: Optional[int] = Field(
+        default=None,
+        description="An approximate count of all rows in the table, only given for the first unfiltered page."
+    )
@@ -7,4 +7,5 @@ from .employees_controller import router as employees_router
 from .insurances_controller import router as insurances_router
 from .models_controller import router as models_router
 from .purchases_controller import router as purchases_router
-from .login_controller import router as login_router
\ No newline at end of file
+from .login_controller import router as login_router
+from .outbox_controller import router as outbox_router
\ No newline at end of file
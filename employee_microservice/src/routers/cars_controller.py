@@ -1,10 +1,10 @@
 # External Library imports
 from uuid import UUID
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi import APIRouter, Depends, Path, Query, status, Response
 
 # Internal library imports
-from src.core import get_current_employee_token, TokenPayload
+from src.core import get_current_employee_token, TokenPayload, MAX_PAGE_SIZE, set_pagination_headers
 from src.database_management import Session, get_mysqldb
 from src.services import cars_service as service
 from src.exceptions import handle_http_exception
@@ -36,12 +36,16 @@ def get_db():
     if the cars are purchased and/or is past their purchase deadline,
     and returns a list of 'CarReturnResource'.
     
+    Results are returned in pages ordered by creation time. When there are more results,
+    the response has an 'X-Next-Cursor' header to give as 'after' to retrieve the next page.
+    
     The endpoint requires an authorization token in the header and is accessible by all roles.
     But if the token is from an employee with the role: 'SALES_PERSON' then only cars from that employee will be returned.
     """,
     dependencies=[Depends(get_current_employee_token)]
 )
 async def get_cars(
+        response: Response,
         customer_id: Optional[UUID] = Query(
             default=None,
             description=
@@ -80,12 +84,21 @@ async def get_cars(
         ),
         limit: Optional[int] = Query(
             default=None, ge=1,
-            description="""Set a limit for the amount of cars that is returned."""
+            description="""Deprecated, use 'page_size' instead. Set a limit for the amount of cars that is returned.""",
+            deprecated=True
+        ),
+        after: Optional[str] = Query(
+            default=None,
+            description="""The cursor from the 'X-Next-Cursor' header of the previous page, to retrieve the page after it."""
+        ),
+        page_size: Optional[int] = Query(
+            default=None, ge=1, le=MAX_PAGE_SIZE,
+            description=f"""The amount of cars on each page, at most {MAX_PAGE_SIZE} which is also the default."""
         ),
         session: Session = Depends(get_db),
         token_payload: TokenPayload = Depends(get_current_employee_token)
 ):
-    return await handle_http_exception(
+    page = await handle_http_exception(
         error_message="Failed to get cars from the MySQL Employee database",
         callback=lambda: service.get_all(
             session,
@@ -94,9 +107,12 @@ async def get_cars(
             employee_id=None if not employee_id else str(employee_id),
             is_purchased=is_purchased,
             is_past_purchase_deadline=is_past_purchase_deadline,
-            car_limit=limit
+            car_limit=limit,
+            after=after,
+            page_size=page_size
         )
     )
+    return set_pagination_headers(response, page)
 
 
 @router.get(
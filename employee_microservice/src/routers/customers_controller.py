@@ -1,10 +1,10 @@
 # External Library imports
 from uuid import UUID
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Path, Query, Body, status
+from fastapi import APIRouter, Depends, Path, Query, Body, status, Response
 
 # Internal library imports
-from src.core import get_current_employee_token, TokenPayload
+from src.core import get_current_employee_token, TokenPayload, MAX_PAGE_SIZE, set_pagination_headers
 from src.database_management import Session, get_mysqldb
 from src.services import customers_service as service
 from src.exceptions import handle_http_exception
@@ -37,31 +37,47 @@ def get_db():
     the MySQL Employee database potentially filtered by email 
     and returns a list of 'CustomerReturnResource'.
     
+    Results are returned in pages ordered by creation time. When there are more results,
+    the response has an 'X-Next-Cursor' header to give as 'after' to retrieve the next page.
+    
     The endpoint requires an authorization token in the header and is accessible by all roles.
     """,
     dependencies=[Depends(get_current_employee_token)]
 )
 async def get_customers(
+        response: Response,
         email_filter: Optional[str] = Query(
             default=None, min_length=1,
             description="""Filter customers by their email."""
         ),
         limit: Optional[int] = Query(
             default=None, ge=1,
-            description="""Set a limit for the amount of customers that is returned."""
+            description="""Deprecated, use 'page_size' instead. Set a limit for the amount of customers that is returned.""",
+            deprecated=True
+        ),
+        after: Optional[str] = Query(
+            default=None,
+            description="""The cursor from the 'X-Next-Cursor' header of the previous page, to retrieve the page after it."""
+        ),
+        page_size: Optional[int] = Query(
+            default=None, ge=1, le=MAX_PAGE_SIZE,
+            description=f"""The amount of customers on each page, at most {MAX_PAGE_SIZE} which is also the default."""
         ),
         session: Session = Depends(get_db),
         token_payload: TokenPayload = Depends(get_current_employee_token)
 ):
-    return await handle_http_exception(
+    page = await handle_http_exception(
         error_message="Failed to get customers from the MySQL Employee database",
         callback=lambda: service.get_all(
             session,
             token_payload,
             filter_customer_by_email=email_filter,
-            customer_limit=limit
+            customer_limit=limit,
+            after=after,
+            page_size=page_size
         )
     )
+    return set_pagination_headers(response, page)
 
 
 @router.get(
@@ -1,12 +1,12 @@
 # External Library imports
 from uuid import UUID
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Response
 
 # Internal library imports
 from src.exceptions import handle_http_exception
 from src.logger_tool import logger
-from src.core import get_current_employee_token, TokenPayload
+from src.core import get_current_employee_token, TokenPayload, MAX_PAGE_SIZE, set_pagination_headers
 from src.services import employees_service as service
 from src.database_management import Session, get_mysqldb
 from src.resources import (
@@ -42,15 +42,28 @@ def get_db():
             - `False`: Returns both active and deleted employees.
 
         The response is a list of employees represented as 'EmployeeReturnResource' objects.
-        The endpoint requires an authorization token in the header and is accessible by all roles.
+        Results are returned in pages ordered by creation time. When there are more results,
+    the response has an 'X-Next-Cursor' header to give as 'after' to retrieve the next page.
+    
+    The endpoint requires an authorization token in the header and is accessible by all roles.
         But if the token is from an employee with the role: 'SALES_PERSON' then a list with only that employee will be returned.
     """,
     dependencies=[Depends(get_current_employee_token)]
 )
 async def get_employees(
+        response: Response,
         limit: Optional[int] = Query(
             default=None, ge=1,
-            description="""Set a limit for the amount of employees that is returned."""
+            description="""Deprecated, use 'page_size' instead. Set a limit for the amount of employees that is returned.""",
+            deprecated=True
+        ),
+        after: Optional[str] = Query(
+            default=None,
+            description="""The cursor from the 'X-Next-Cursor' header of the previous page, to retrieve the page after it."""
+        ),
+        page_size: Optional[int] = Query(
+            default=None, ge=1, le=MAX_PAGE_SIZE,
+            description=f"""The amount of employees on each page, at most {MAX_PAGE_SIZE} which is also the default."""
         ),
         deleted: Optional[bool] = Query(
             default=None,
@@ -62,15 +75,18 @@ async def get_employees(
         session: Session = Depends(get_db),
         token_payload: TokenPayload = Depends(get_current_employee_token)
 ):
-    return await handle_http_exception(
+    page = await handle_http_exception(
         error_message="Failed to get employees from the MySQL Employee database",
         callback=lambda: service.get_all(
             session,
             token_payload,
             employee_limit=limit,
+            after=after,
+            page_size=page_size,
             is_deleted_filter=deleted
         )
     )
+    return set_pagination_headers(response, page)
 
 
 @router.get(
@@ -101,7 +117,7 @@ async def get_employee(
         session: Session = Depends(get_db),
         token_payload: TokenPayload = Depends(get_current_employee_token)
 ):
-    logger.info(f"Token Id: {token_payload.employee_id}")
+    logger.debug("Token Id: %s", token_payload.employee_id)
     return await handle_http_exception(
         error_message="Failed to get employee from the MySQL Employee database",
         callback=lambda: service.get_by_id(
@@ -1,5 +1,6 @@
 # External Library imports
 from fastapi import APIRouter, Form, HTTPException
+from fastapi.concurrency import run_in_threadpool
 import requests
 from dotenv import load_dotenv
 import os
@@ -53,7 +54,9 @@ async def login_for_access_token(
     )
     auth_microservice_url = "http://auth_microservice:8001/login" if KUBERNETES_AUTH_MICROSERVICE is None else KUBERNETES_AUTH_MICROSERVICE
     # Send a POST request to the Auth Microservice
-    response = requests.post(
+    # requests is blocking, so the call is made from a worker thread to keep the event loop free.
+    response = await run_in_threadpool(
+        requests.post,
         auth_microservice_url,
         json=employee_login_data.model_dump(),
         headers={"Content-Type": "application/json"}
@@ -0,0 +1,63 @@
+# External Library imports
+from datetime import datetime
+from fastapi import APIRouter, Depends, Query
+
+# Internal library imports
+from src.core import get_current_employee_token, TokenPayload
+from src.database_management import Session, get_mysqldb
+from src.services import outbox_service as service
+from src.exceptions import handle_http_exception
+from src.resources import OutboxReplayResource
+
+
+router: APIRouter = APIRouter()
+
+def get_db():
+    with get_mysqldb() as session:
+        yield session
+
+
+@router.post(
+    path="/outbox/replay",
+    response_model=OutboxReplayResource,
+    response_description=
+    """
+    Successfully requeued the outbox messages of the time range.
+    Returns: OutboxReplayResource.
+    """,
+    summary="Replay Outbox Messages - Requires authorization token in header.",
+    description=
+    """
+    Marks every already published message in the outbox of the MySQL Employee database,
+    that was written within the given time range, as unpublished again 
+    and returns the number of requeued messages as an 'OutboxReplayResource'.
+    
+    The outbox relay then publishes those messages to the 'synch_microservice' again, 
+    e.g. to rebuild the Customer database after it was restored from a backup.
+    Times without a timezone are taken to be UTC.
+    
+    The endpoint requires an authorization token in the header and is only accessible by employees with the role: 'ADMIN'.
+    """,
+    dependencies=[Depends(get_current_employee_token)]
+)
+async def replay_outbox_messages(
+        created_from: datetime = Query(
+            default=...,
+            description="""The inclusive start of the time range the messages were written in."""
+        ),
+        created_to: datetime = Query(
+            default=...,
+            description="""The exclusive end of the time range the messages were written in."""
+        ),
+        session: Session = Depends(get_db),
+        token_payload: TokenPayload = Depends(get_current_employee_token)
+):
+    return await handle_http_exception(
+        error_message="Failed to replay outbox messages in the MySQL Employee database",
+        callback=lambda: service.replay(
+            session,
+            token_payload,
+            created_from,
+            created_to
+        )
+    )
@@ -1,10 +1,10 @@
 # External Library imports
 from uuid import UUID
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Response
 
 # Internal library imports
-from src.core import get_current_employee_token, TokenPayload
+from src.core import get_current_employee_token, TokenPayload, MAX_PAGE_SIZE, set_pagination_headers
 from src.database_management import Session, get_mysqldb
 from src.services import purchases_service as service
 from src.exceptions import handle_http_exception
@@ -34,12 +34,16 @@ def get_db():
     Retrieves all or a limited amount of Purchases and/or purchases belonging to a specifik employee 
     from the MySQL Employee database and returns a list of 'PurchaseReturnResource'.
     
+    Results are returned in pages ordered by creation time. When there are more results,
+    the response has an 'X-Next-Cursor' header to give as 'after' to retrieve the next page.
+    
     The endpoint requires an authorization token in the header and is accessible by all roles.
     But if the token is from an employee with the role: 'SALES_PERSON' then only purchases from that employee will be returned.
     """,
     dependencies=[Depends(get_current_employee_token)]
 )
 async def get_purchases(
+        response: Response,
         employee_id: Optional[UUID] = Query(
             default=None,
             description=
@@ -50,20 +54,32 @@ async def get_purchases(
         ),
         limit: Optional[int] = Query(
             default=None, ge=1,
-            description="""Set a limit for the amount of purchases that is returned."""
+            description="""Deprecated, use 'page_size' instead. Set a limit for the amount of purchases that is returned.""",
+            deprecated=True
+        ),
+        after: Optional[str] = Query(
+            default=None,
+            description="""The cursor from the 'X-Next-Cursor' header of the previous page, to retrieve the page after it."""
+        ),
+        page_size: Optional[int] = Query(
+            default=None, ge=1, le=MAX_PAGE_SIZE,
+            description=f"""The amount of purchases on each page, at most {MAX_PAGE_SIZE} which is also the default."""
         ),
         session: Session = Depends(get_db),
         token: TokenPayload = Depends(get_current_employee_token)
 ):
-    return await handle_http_exception(
+    page = await handle_http_exception(
         error_message="Failed to get purchases from the MySQL Employee database",
         callback=lambda: service.get_all(
             session,
             token,
             employee_id=None if not employee_id else str(employee_id),
-            purchase_limit=limit
+            purchase_limit=limit,
+            after=after,
+            page_size=page_size
         )
     )
+    return set_pagination_headers(response, page)
 
 
 @router.get(
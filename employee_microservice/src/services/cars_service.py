@@ -14,6 +14,7 @@ from src.repositories import (
     ModelRepository
 )
 from src.resources import (
+    PageResource,
     CarReturnResource,
     CarCreateResource,
     RoleEnum
@@ -26,6 +27,7 @@ from src.exceptions import (
     EmployeeIsNotAllowedToRetrieveOrMakeCarPurchasesBasedOnOtherEmployeeError
 )
 from src.entities import (
+    CarEntity,
     CustomerEntity,
     EmployeeEntity,
     AccessoryEntity,
@@ -33,7 +35,10 @@ from src.entities import (
 )
 from src.core import (
     TokenPayload, 
-    get_current_employee
+    get_current_employee,
+    decode_page_cursor,
+    get_page_size,
+    build_page
 )
 
 
@@ -44,13 +49,14 @@ def get_all(
         employee_id: Optional[str] = None,
         is_purchased: Optional[bool] = None,
         is_past_purchase_deadline: Optional[bool] = None,
-        car_limit: Optional[int] = None
-) -> List[CarReturnResource]:
+        car_limit: Optional[int] = None,
+        after: Optional[str] = None,
+        page_size: Optional[int] = None
+) -> PageResource[CarReturnResource]:
 
     car_repository = CarRepository(session)
     customer_repository = CustomerRepository(session)
     employee_repository = EmployeeRepository(session)
-    purchase_repository = PurchaseRepository(session)
 
     if not (isinstance(customer_id, str) or customer_id is None):
         raise TypeError(f"customer_id must be of type str or None, "
@@ -68,6 +74,12 @@ def get_all(
     if isinstance(car_limit, bool) or not (isinstance(car_limit, int) or car_limit is None):
         raise TypeError(f"car_limit must be of type int or None, "
                         f"not {type(car_limit).__name__}.")
+    if not (isinstance(after, str) or after is None):
+        raise TypeError(f"after must be of type str or None, "
+                        f"not {type(after).__name__}.")
+    if isinstance(page_size, bool) or not (isinstance(page_size, int) or page_size is None):
+        raise TypeError(f"page_size must be of type int or None, "
+                        f"not {type(page_size).__name__}.")
         
     current_employee = get_current_employee(
         token,
@@ -96,20 +108,27 @@ def get_all(
                 entity_id=employee_id
             )
 
-    cars = car_repository.get_all(
+    after_cursor = decode_page_cursor(after)
+    cars_page_size = get_page_size(page_size, car_limit)
+    cars_with_purchase_status = car_repository.get_all(
         customer=filtered_customer,
         employee=filtered_employee,
         is_purchased=is_purchased,
         is_past_purchase_deadline=is_past_purchase_deadline,
-        limit=car_limit
+        limit=cars_page_size + 1,
+        after=after_cursor
     )
     
-    car_resources: List[CarReturnResource] = []
-    for car in cars:
-        is_car_purchased: bool = purchase_repository.is_car_taken(car)
-        car_resources.append(car.as_resource(is_car_purchased))
-    
-    return car_resources
+    is_unfiltered_first_page = after_cursor is None and all(
+        car_filter is None for car_filter in (filtered_customer, filtered_employee, is_purchased, is_past_purchase_deadline)
+    )
+    return build_page(
+        cars_with_purchase_status,
+        cars_page_size,
+        as_resource=lambda car_with_purchase_status: car_with_purchase_status[0].as_resource(car_with_purchase_status[1]),
+        sort_key=lambda car_with_purchase_status: (car_with_purchase_status[0].created_at, car_with_purchase_status[0].id),
+        approximate_total=car_repository.get_approximate_count(CarEntity) if is_unfiltered_first_page else None
+    )
 
 
 def get_by_id(
@@ -219,9 +238,11 @@ def create(
     if car_color_id not in [color.id for color in model_for_the_car.colors]:
         raise TheColorIsNotAvailableInModelToGiveToCarError(model_for_the_car, color_for_the_car)
 
+    # The accessories and insurances are each loaded with one IN query, whatever their number.
+    accessories_by_id = accessory_repository.get_by_ids(car_accessory_ids)
     accessories_for_the_car: List[AccessoryEntity] = []
     for accessory_id in car_accessory_ids:
-        accessory_for_the_car = accessory_repository.get_by_id(accessory_id)
+        accessory_for_the_car = accessories_by_id.get(accessory_id)
         if accessory_for_the_car is None:
             raise UnableToFindIdError(
                 entity_name="Accessory",
@@ -229,9 +250,10 @@ def create(
             )
         accessories_for_the_car.append(accessory_for_the_car)
 
+    insurances_by_id = insurance_repository.get_by_ids(car_insurance_ids)
     insurances_for_the_car: List[InsuranceEntity] = []
     for insurance_id in car_insurance_ids:
-        insurance_for_the_car = insurance_repository.get_by_id(insurance_id)
+        insurance_for_the_car = insurances_by_id.get(insurance_id)
         if insurance_for_the_car is None:
             raise UnableToFindIdError(
                 entity_name="Insurance",
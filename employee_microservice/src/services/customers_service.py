@@ -1,16 +1,21 @@
 # External Library imports
 from pydantic import EmailStr
-from typing import List, Optional
+from typing import Optional
 
 # Internal library imports
 from src.database_management import Session
+from src.entities import CustomerEntity
 from src.repositories import CustomerRepository
 from src.exceptions import UnableToFindIdError, AlreadyTakenFieldValueError
 from src.core import (
     TokenPayload, 
-    get_current_employee
+    get_current_employee,
+    decode_page_cursor,
+    get_page_size,
+    build_page
 )
 from src.resources import (
+    PageResource,
     CustomerReturnResource, 
     CustomerCreateResource, 
     CustomerUpdateResource,
@@ -23,8 +28,10 @@ def get_all(
         session: Session,
         token: TokenPayload,
         filter_customer_by_email: Optional[str] = None,
-        customer_limit: Optional[int] = None
-) -> List[CustomerReturnResource]:
+        customer_limit: Optional[int] = None,
+        after: Optional[str] = None,
+        page_size: Optional[int] = None
+) -> PageResource[CustomerReturnResource]:
 
     repository = CustomerRepository(session)
     
@@ -34,6 +41,12 @@ def get_all(
     if isinstance(customer_limit, bool) or not (isinstance(customer_limit, int) or customer_limit is None):
         raise TypeError(f"customer_limit must be of type int or None, "
                         f"not {type(customer_limit).__name__}.")
+    if not (isinstance(after, str) or after is None):
+        raise TypeError(f"after must be of type str or None, "
+                        f"not {type(after).__name__}.")
+    if isinstance(page_size, bool) or not (isinstance(page_size, int) or page_size is None):
+        raise TypeError(f"page_size must be of type int or None, "
+                        f"not {type(page_size).__name__}.")
         
     get_current_employee(
         token,
@@ -41,9 +54,18 @@ def get_all(
         current_user_action="get_all customers"
     )
     
-    customers = repository.get_all(filter_customer_by_email, customer_limit)
+    after_cursor = decode_page_cursor(after)
+    customers_page_size = get_page_size(page_size, customer_limit)
+    customers = repository.get_all(filter_customer_by_email, limit=customers_page_size + 1, after=after_cursor)
     
-    return [customer.as_resource() for customer in customers]
+    is_unfiltered_first_page = after_cursor is None and filter_customer_by_email is None
+    return build_page(
+        customers,
+        customers_page_size,
+        as_resource=lambda customer: customer.as_resource(),
+        sort_key=lambda customer: (customer.created_at, customer.id),
+        approximate_total=repository.get_approximate_count(CustomerEntity) if is_unfiltered_first_page else None
+    )
 
 
 def get_by_id(
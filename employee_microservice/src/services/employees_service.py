@@ -1,16 +1,20 @@
 # External Library imports
-from typing import List, Optional
+from typing import Optional
 
 # Internal library imports
 from src.logger_tool import logger
-from src.entities import EmployeeMesssage
+from src.entities import EmployeeEntity, EmployeeMesssage
 from src.database_management import Session
 from src.repositories import EmployeeRepository
 from src.core import (
     TokenPayload,
-    get_current_employee
+    get_current_employee,
+    decode_page_cursor,
+    get_page_size,
+    build_page
 )
 from src.resources import (
+    PageResource,
     EmployeeReturnResource,
     RoleEnum
 )
@@ -27,8 +31,10 @@ def get_all(
     session: Session,
     token: TokenPayload,
     employee_limit: Optional[int] = None,
-    is_deleted_filter: Optional[bool] = None
-) -> List[EmployeeReturnResource]:
+    is_deleted_filter: Optional[bool] = None,
+    after: Optional[str] = None,
+    page_size: Optional[int] = None
+) -> PageResource[EmployeeReturnResource]:
     
     repository = EmployeeRepository(session)
     
@@ -39,17 +45,36 @@ def get_all(
     if not isinstance(is_deleted_filter, bool) and is_deleted_filter is not None:
         raise TypeError(f"is_deleted_filter must be of type bool or None, "
                         f"not {type(is_deleted_filter).__name__}.")
+    if not (isinstance(after, str) or after is None):
+        raise TypeError(f"after must be of type str or None, "
+                        f"not {type(after).__name__}.")
+    if isinstance(page_size, bool) or not (isinstance(page_size, int) or page_size is None):
+        raise TypeError(f"page_size must be of type int or None, "
+                        f"not {type(page_size).__name__}.")
         
     current_employee = get_current_employee(token, session, current_user_action="get_all employees")
     
     if current_employee.role == RoleEnum.sales_person:
         logger.warning(f"Sales person with ID: '{current_employee.id}' tried to get all employees.")
         logger.info("Will instead return only the current employee in a list.")
-        return [current_employee.as_resource()]
+        return PageResource(items=[current_employee.as_resource()])
     
-    employees = repository.get_all(limit=employee_limit, deletion_filter=is_deleted_filter)
+    after_cursor = decode_page_cursor(after)
+    employees_page_size = get_page_size(page_size, employee_limit)
+    employees = repository.get_all(
+        limit=employees_page_size + 1,
+        deletion_filter=is_deleted_filter,
+        after=after_cursor
+    )
     
-    return [employee.as_resource() for employee in employees]
+    is_unfiltered_first_page = after_cursor is None and is_deleted_filter is False
+    return build_page(
+        employees,
+        employees_page_size,
+        as_resource=lambda employee: employee.as_resource(),
+        sort_key=lambda employee: (employee.created_at, employee.id),
+        approximate_total=repository.get_approximate_count(EmployeeEntity) if is_unfiltered_first_page else None
+    )
 
 
 def get_by_id(
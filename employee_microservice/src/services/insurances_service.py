@@ -107,7 +107,7 @@ def create(
     insurance = repository.create(insurance_create_data)
     insurance_as_resource = insurance.as_resource()
     
-    publish_insurance_created_message(insurance)
+    publish_insurance_created_message(session, insurance)
     
     return insurance_as_resource
 
@@ -153,6 +153,6 @@ def update(
     
     insurance_as_resource = updated_insurance.as_resource()
         
-    publish_insurance_updated_message(updated_insurance)
+    publish_insurance_updated_message(session, updated_insurance)
     
     return insurance_as_resource
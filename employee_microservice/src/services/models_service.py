@@ -5,12 +5,12 @@ from datetime import datetime
 from botocore.client import Config, BaseClient
 from dotenv import load_dotenv
 from fastapi import UploadFile
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 # Internal library imports
 from src.logger_tool import logger
-from src.entities import BrandEntity
-from src.database_management import Session
+from src.entities import BrandEntity, ColorEntity
+from src.database_management import Session, run_in_thread_pool
 from src.message_broker_management import publish_model_created_message
 from src.resources import ModelReturnResource, ModelCreateResource, RoleEnum
 from src.repositories import ModelRepository, BrandRepository, ColorRepository
@@ -97,14 +97,61 @@ async def create(
         model_image: UploadFile
 ) -> ModelReturnResource:
     
-    model_repository = ModelRepository(session)
-    brand_repository = BrandRepository(session)
-    color_repository = ColorRepository(session)
-    
     if not isinstance(model_create_data, ModelCreateResource):
         raise TypeError(f"model_create_data must be of type ModelCreateResource, "
                         f"not {type(model_create_data).__name__}.")
     
+    # The MySQL queries and the upload are blocking, so they are run on the thread pool
+    # while only reading the uploaded file happens on the event loop.
+    already_created_model, brand_entity, color_entities = await run_in_thread_pool(
+        lambda: _get_model_dependencies(session, token, model_create_data)
+    )
+    if already_created_model is not None:
+        return already_created_model
+    
+    unique_filename = _get_unique_filename(model_image)
+    
+    if is_invalid_mime_type(model_image, VALID_MODEL_FILE_TYPES):
+        raise FileIsNotCorrectFileTypeError(
+            file_name=model_image.filename,
+            file_type=model_image.content_type,
+            allowed_file_types=VALID_MODEL_FILE_TYPES
+        )
+        
+        
+    is_file_too_large = await read_file_if_within_size_limit(model_image, MAX_MODEL_IMAGE_SIZE)
+        
+    if is_file_too_large is None:
+        raise FileTooLargeError(
+            file_name=model_image.filename,
+            max_mega_bytes_size=MAX_MODEL_IMAGE_SIZE
+        )
+    
+    file_content = is_file_too_large
+    
+    return await run_in_thread_pool(
+        lambda: _upload_image_and_create_model(
+            session,
+            model_create_data,
+            model_image,
+            file_content,
+            unique_filename,
+            brand_entity,
+            color_entities
+        )
+    )
+
+
+def _get_model_dependencies(
+        session: Session,
+        token: TokenPayload,
+        model_create_data: ModelCreateResource
+) -> Tuple[Optional[ModelReturnResource], Optional[BrandEntity], List[ColorEntity]]:
+    
+    model_repository = ModelRepository(session)
+    brand_repository = BrandRepository(session)
+    color_repository = ColorRepository(session)
+    
     get_current_employee(
         token,
         session,
@@ -114,7 +161,7 @@ async def create(
 
     already_created_model = model_repository.get_by_id(model_create_data.id)
     if already_created_model is not None:
-        return already_created_model.as_resource()
+        return already_created_model.as_resource(), None, []
     
     brand_entity = brand_repository.get_by_id(model_create_data.brands_id)
     if brand_entity is None:
@@ -123,7 +170,7 @@ async def create(
             entity_id=model_create_data.brands_id
         )
         
-    color_entities: List[BrandEntity] = []
+    color_entities: List[ColorEntity] = []
     for color_id in model_create_data.color_ids:
         color_entity = color_repository.get_by_id(color_id)
         if color_entity is None:
@@ -133,25 +180,20 @@ async def create(
             )
         color_entities.append(color_entity)
     
-    unique_filename = _get_unique_filename(model_image)
-    
-    if is_invalid_mime_type(model_image, VALID_MODEL_FILE_TYPES):
-        raise FileIsNotCorrectFileTypeError(
-            file_name=model_image.filename,
-            file_type=model_image.content_type,
-            allowed_file_types=VALID_MODEL_FILE_TYPES
-        )
-        
-        
-    is_file_too_large = await read_file_if_within_size_limit(model_image, MAX_MODEL_IMAGE_SIZE)
-        
-    if is_file_too_large is None:
-        raise FileTooLargeError(
-            file_name=model_image.filename,
-            max_mega_bytes_size=MAX_MODEL_IMAGE_SIZE
-        )
+    return None, brand_entity, color_entities
+
+
+def _upload_image_and_create_model(
+        session: Session,
+        model_create_data: ModelCreateResource,
+        model_image: UploadFile,
+        file_content: bytes,
+        unique_filename: str,
+        brand_entity: BrandEntity,
+        color_entities: List[ColorEntity]
+) -> ModelReturnResource:
     
-    file_content = is_file_too_large
+    model_repository = ModelRepository(session)
     
     model_image_url = _upload_file_to_digital_ocean_spaces(
         model_image,
@@ -167,7 +209,7 @@ async def create(
     
     model_as_resource = model.as_resource()
     
-    publish_model_created_message(message=model)
+    publish_model_created_message(session, message=model)
     
     return model_as_resource
 
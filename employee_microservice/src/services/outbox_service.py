@@ -0,0 +1,56 @@
+# External Library imports
+from datetime import datetime, timezone
+
+# Internal library imports
+from src.database_management import Session
+from src.repositories import OutboxRepository
+from src.resources import OutboxReplayResource, RoleEnum
+from src.core import TokenPayload, get_current_employee
+from src.exceptions import InvalidTimeRangeError
+from src.message_broker_management import outbox_relay
+
+
+def replay(
+        session: Session,
+        token: TokenPayload,
+        created_from: datetime,
+        created_to: datetime
+) -> OutboxReplayResource:
+    
+    repository = OutboxRepository(session)
+    
+    if not isinstance(created_from, datetime):
+        raise TypeError(f"created_from must be of type datetime, "
+                        f"not {type(created_from).__name__}.")
+    if not isinstance(created_to, datetime):
+        raise TypeError(f"created_to must be of type datetime, "
+                        f"not {type(created_to).__name__}.")
+    
+    get_current_employee(
+        token,
+        session,
+        current_user_action="replay outbox messages",
+        valid_roles=[RoleEnum.admin]
+    )
+    
+    created_from = _as_naive_utc(created_from)
+    created_to = _as_naive_utc(created_to)
+    if created_from >= created_to:
+        raise InvalidTimeRangeError(start=created_from, end=created_to)
+    
+    requeued_messages = repository.requeue_range(created_from, created_to)
+    if requeued_messages:
+        outbox_relay.notify_after_commit(session)
+    
+    return OutboxReplayResource(
+        created_from=created_from,
+        created_to=created_to,
+        requeued_messages=requeued_messages
+    )
+
+
+def _as_naive_utc(value: datetime) -> datetime:
+    # The outbox stores UTC times without a timezone, naive datetimes are taken to be UTC already.
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
@@ -1,16 +1,17 @@
 # External Library imports
-from typing import List, Optional
+from typing import Optional
 
 
 # Internal library imports
 from src.database_management import Session
-from src.entities import EmployeeEntity
+from src.entities import EmployeeEntity, PurchaseEntity
 from src.repositories import (
     CarRepository,
     PurchaseRepository,
     EmployeeRepository
 )
 from src.resources import (
+    PageResource,
     PurchaseReturnResource,
     PurchaseCreateResource,
     RoleEnum
@@ -24,15 +25,20 @@ from src.exceptions import (
 )
 from src.core import (
     TokenPayload, 
-    get_current_employee
+    get_current_employee,
+    decode_page_cursor,
+    get_page_size,
+    build_page
 )
 
 def get_all(
         session: Session,
         token: TokenPayload,
         employee_id: Optional[str] = None,
-        purchase_limit: Optional[int] = None
-)  -> List[PurchaseReturnResource]:
+        purchase_limit: Optional[int] = None,
+        after: Optional[str] = None,
+        page_size: Optional[int] = None
+)  -> PageResource[PurchaseReturnResource]:
 
     purchase_repository = PurchaseRepository(session)
     employee_repository = EmployeeRepository(session)
@@ -43,6 +49,12 @@ def get_all(
     if not (isinstance(employee_id, str) or employee_id is None):
         raise TypeError(f"employee_id must be of type str or None, "
                         f"not {type(employee_id).__name__}.")
+    if not (isinstance(after, str) or after is None):
+        raise TypeError(f"after must be of type str or None, "
+                        f"not {type(after).__name__}.")
+    if isinstance(page_size, bool) or not (isinstance(page_size, int) or page_size is None):
+        raise TypeError(f"page_size must be of type int or None, "
+                        f"not {type(page_size).__name__}.")
         
     current_employee = get_current_employee(token, session, current_user_action="get_all purchases")
     
@@ -58,9 +70,22 @@ def get_all(
                 entity_id=employee_id
             )
     
-    purchases = purchase_repository.get_all(employee=filtered_employee, limit=purchase_limit)
+    after_cursor = decode_page_cursor(after)
+    purchases_page_size = get_page_size(page_size, purchase_limit)
+    purchases = purchase_repository.get_all(
+        employee=filtered_employee,
+        limit=purchases_page_size + 1,
+        after=after_cursor
+    )
     
-    return [purchase.as_resource() for purchase in purchases]
+    is_unfiltered_first_page = after_cursor is None and filtered_employee is None
+    return build_page(
+        purchases,
+        purchases_page_size,
+        as_resource=lambda purchase: purchase.as_resource(),
+        sort_key=lambda purchase: (purchase.created_at, purchase.id),
+        approximate_total=purchase_repository.get_approximate_count(PurchaseEntity) if is_unfiltered_first_page else None
+    )
 
 def get_by_id(
         session: Session,
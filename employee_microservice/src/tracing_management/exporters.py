@@ -0,0 +1,151 @@
+# External Library imports
+import os
+import json
+import threading
+import urllib.request
+from itertools import groupby
+from typing import Any, Dict, List, Sequence
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+# Internal library imports
+from src.logger_tool import logger
+
+
+def _encode_value(value: Any) -> Dict[str, Any]:
+    # OTLP JSON encodes 64 bit integers as strings.
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_encode_value(item) for item in value]}}
+    return {"stringValue": str(value)}
+
+
+def _encode_attributes(attributes: Any) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _encode_value(value)} for key, value in (attributes or {}).items()]
+
+
+def _encode_span(span: ReadableSpan) -> Dict[str, Any]:
+    span_context = span.get_span_context()
+    encoded_span: Dict[str, Any] = {
+        "traceId": f"{span_context.trace_id:032x}",
+        "spanId": f"{span_context.span_id:016x}",
+        "name": span.name,
+        # The span kinds of OTLP start at 1, as 0 means unspecified.
+        "kind": span.kind.value + 1,
+        "startTimeUnixNano": str(span.start_time),
+        "endTimeUnixNano": str(span.end_time),
+        "attributes": _encode_attributes(span.attributes),
+        "events": [
+            {"name": event.name, "timeUnixNano": str(event.timestamp), "attributes": _encode_attributes(event.attributes)}
+            for event in span.events
+        ],
+        "links": [
+            {
+                "traceId": f"{link.context.trace_id:032x}",
+                "spanId": f"{link.context.span_id:016x}",
+                "attributes": _encode_attributes(link.attributes)
+            }
+            for link in span.links
+        ],
+        "status": {"code": span.status.status_code.value, "message": span.status.description or ""},
+    }
+    if span.parent is not None:
+        encoded_span["parentSpanId"] = f"{span.parent.span_id:016x}"
+    if span_context.trace_state:
+        encoded_span["traceState"] = span_context.trace_state.to_header()
+    return encoded_span
+
+
+def encode_spans(spans: Sequence[ReadableSpan]) -> Dict[str, Any]:
+    """
+    Encodes the spans as an OTLP `ExportTraceServiceRequest` in its JSON representation,
+    which OpenTelemetry collectors accept on `/v1/traces` and read from files.
+    """
+    def resource_key(span: ReadableSpan) -> int:
+        return id(span.resource)
+
+    def scope_key(span: ReadableSpan) -> str:
+        return span.instrumentation_scope.name if span.instrumentation_scope else ""
+
+    resource_spans = []
+    for _, spans_of_resource in groupby(sorted(spans, key=resource_key), key=resource_key):
+        spans_of_resource = list(spans_of_resource)
+        scope_spans = []
+        for _, spans_of_scope in groupby(sorted(spans_of_resource, key=scope_key), key=scope_key):
+            spans_of_scope = list(spans_of_scope)
+            scope = spans_of_scope[0].instrumentation_scope
+            scope_spans.append({
+                "scope": {"name": scope.name, "version": scope.version or ""} if scope else {},
+                "spans": [_encode_span(span) for span in spans_of_scope],
+            })
+        resource_spans.append({
+            "resource": {"attributes": _encode_attributes(spans_of_resource[0].resource.attributes)},
+            "scopeSpans": scope_spans,
+        })
+    return {"resourceSpans": resource_spans}
+
+
+class OtlpJsonFileSpanExporter(SpanExporter):
+    """
+    Appends every exported batch of spans to a file as one line of OTLP JSON.
+
+    The file can be read by the `otlpjsonfile` receiver of an OpenTelemetry collector,
+    or by a script, so spans can be inspected without running a collector.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        line = json.dumps(encode_spans(spans), separators=(",", ":"))
+        try:
+            with self._lock:
+                self._file.write(line + "\n")
+                self._file.flush()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to write {len(spans)} spans to {self.path}: {e}")
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class OtlpJsonHttpSpanExporter(SpanExporter):
+    """
+    Posts every exported batch of spans as OTLP JSON to the traces endpoint of a collector,
+    such as `http://localhost:4318/v1/traces` of an OpenTelemetry collector or Jaeger.
+    """
+
+    def __init__(self, endpoint: str, timeout: float) -> None:
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(encode_spans(spans), separators=(",", ":")).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                response.read()
+        except OSError as e:
+            logger.warning(f"Failed to export {len(spans)} spans to {self.endpoint}: {e}")
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        pass
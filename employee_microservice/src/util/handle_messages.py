@@ -5,6 +5,7 @@
 from src.util.handle_employee_message import handle_employee_message
 from src.database_management import Session
 from src.entities.employee import EmployeeMesssage
+from src.core import current_employee_cache
 from src.logger_tool import logger
 
 
@@ -26,5 +27,7 @@ def handle_message(session: Session, message: dict, routing_key: str) -> None:
         employee_message = EmployeeMesssage(**message)
         handle_employee_message(session, employee_message, routing_key)
         session.commit()
+        # Only drop the cached employee once the change is committed, so it is not reloaded as it was.
+        current_employee_cache.invalidate(employee_message.id)
     else:
         raise ValueError(f"Invalid routing key: {routing_key}, expected 'employee' in routing key.")
\ No newline at end of file
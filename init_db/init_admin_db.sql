@@ -36,7 +36,8 @@ CREATE TABLE `employees` (
   `updated_at` DATETIME DEFAULT CURRENT_TIMESTAMP() ON UPDATE CURRENT_TIMESTAMP() NOT NULL,
   PRIMARY KEY (`id`),
   UNIQUE KEY `employee_email_UNIQUE` (`email`),
-  KEY `idx_is_deleted` (`is_deleted`),
+  KEY `idx_is_deleted_created_at_id` (`is_deleted`,`created_at`,`id`),
+  KEY `idx_employees_created_at_id` (`created_at`,`id`),
   CONSTRAINT `check_role` CHECK (`role` IN ('admin', 'manager', 'sales_person'))
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -95,6 +95,7 @@ CREATE TABLE `cars` (
   KEY `fk_cars_colors1_idx` (`colors_id`),
   KEY `fk_cars_customers1_idx` (`customers_id`),
   KEY `fk_cars_employees1_idx` (`employees_id`),
+  KEY `idx_cars_created_at_id` (`created_at`,`id`),
   CONSTRAINT `fk_cars_colors1` FOREIGN KEY (`colors_id`) REFERENCES `colors` (`id`),
   CONSTRAINT `fk_cars_customers1` FOREIGN KEY (`customers_id`) REFERENCES `customers` (`id`) ON DELETE CASCADE,
   CONSTRAINT `fk_cars_models1` FOREIGN KEY (`models_id`) REFERENCES `models` (`id`),
@@ -220,7 +221,8 @@ CREATE TABLE `customers` (
   `created_at` DATETIME DEFAULT CURRENT_TIMESTAMP() NOT NULL,
   `updated_at` DATETIME DEFAULT CURRENT_TIMESTAMP() ON UPDATE CURRENT_TIMESTAMP() NOT NULL,
   PRIMARY KEY (`id`),
-  UNIQUE KEY `customer_email_UNIQUE` (`email`)
+  UNIQUE KEY `customer_email_UNIQUE` (`email`),
+  KEY `idx_customers_created_at_id` (`created_at`,`id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
@@ -364,6 +366,7 @@ CREATE TABLE `purchases` (
   PRIMARY KEY (`id`),
   UNIQUE KEY `cars_id_UNIQUE` (`cars_id`),
   KEY `fk_purchases_cars1_idx` (`cars_id`),
+  KEY `idx_purchases_created_at_id` (`created_at`,`id`),
   CONSTRAINT `fk_purchases_cars1` FOREIGN KEY (`cars_id`) REFERENCES `cars` (`id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -378,6 +381,29 @@ INSERT INTO `purchases` VALUES ('bdfca7c4-e0ad-4618-8766-9bb355371c81','d4c7f1f8
 /*!40000 ALTER TABLE `purchases` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `outbox_messages`
+--
+
+DROP TABLE IF EXISTS `outbox_messages`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `outbox_messages` (
+  `id` bigint unsigned NOT NULL AUTO_INCREMENT,
+  `exchange_name` varchar(100) NOT NULL,
+  `exchange_type` varchar(10) NOT NULL,
+  `routing_key` varchar(100) NOT NULL,
+  `body` mediumblob NOT NULL,
+  `traceparent` varchar(55) DEFAULT NULL,
+  `tracestate` varchar(512) DEFAULT NULL,
+  `created_at` DATETIME(6) NOT NULL,
+  `published_at` DATETIME(6) DEFAULT NULL,
+  PRIMARY KEY (`id`),
+  KEY `idx_outbox_messages_published_at_id` (`published_at`,`id`),
+  KEY `idx_outbox_messages_created_at` (`created_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
 --
 -- Table structure for table `employees`
 --
@@ -397,7 +423,8 @@ CREATE TABLE `employees` (
   `updated_at` DATETIME DEFAULT CURRENT_TIMESTAMP() ON UPDATE CURRENT_TIMESTAMP() NOT NULL,
   PRIMARY KEY (`id`),
   UNIQUE KEY `employee_email_UNIQUE` (`email`),
-  KEY `idx_is_deleted` (`is_deleted`),
+  KEY `idx_is_deleted_created_at_id` (`is_deleted`,`created_at`,`id`),
+  KEY `idx_employees_created_at_id` (`created_at`,`id`),
   CONSTRAINT `check_role` CHECK (`role` IN ('admin', 'manager', 'sales_person'))
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -434,6 +461,7 @@ GRANT SELECT, INSERT, UPDATE, DELETE ON `kea_cars_employee_dev`.`insurances` TO
 GRANT SELECT, INSERT, UPDATE, DELETE ON `kea_cars_employee_dev`.`models` TO 'application_user'@'%';
 GRANT SELECT, INSERT, UPDATE, DELETE ON `kea_cars_employee_dev`.`models_has_colors` TO 'application_user'@'%';
 GRANT SELECT, INSERT, UPDATE, DELETE ON `kea_cars_employee_dev`.`purchases` TO 'application_user'@'%';
+GRANT SELECT, INSERT, UPDATE, DELETE ON `kea_cars_employee_dev`.`outbox_messages` TO 'application_user'@'%';
 
 -- Grant only SELECT on the `employees` table
 GRANT SELECT ON `kea_cars_employee_dev`.`employees` TO 'application_user'@'%';
@@ -0,0 +1,82 @@
+"""
+Measures how long the messages between the microservices take per hop, from the spans the services
+export with TRACING_EXPORTER=file.
+
+Every consumed message has a `process <queue>` span whose parent is the `publish <exchange>` span
+of the service that published it. The hop latency is the time from the start of the publish until
+the consumer started processing the message, so it includes the time the message waited in the
+broker. The end-to-end latency is the time from the start of the trace, such as the HTTP request
+that created an employee, until the consumer finished processing the message.
+
+Usage:
+    python scripts/trace_latency.py var/trace/*.jsonl
+"""
+# External Library imports
+import sys
+import json
+from collections import defaultdict
+from statistics import quantiles
+from typing import Any, Dict, List, Tuple
+
+# The span kinds of OTLP.
+PRODUCER = 4
+CONSUMER = 5
+
+
+def read_spans(paths: List[str]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Reads the spans of OTLP JSON lines files, by their trace ID and span ID."""
+    traces: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            for line in filter(None, map(str.strip, file)):
+                for resource_spans in json.loads(line)["resourceSpans"]:
+                    service_name = next(
+                        (attribute["value"].get("stringValue") for attribute in resource_spans["resource"]["attributes"]
+                         if attribute["key"] == "service.name"),
+                        "unknown"
+                    )
+                    for scope_spans in resource_spans["scopeSpans"]:
+                        for span in scope_spans["spans"]:
+                            span["serviceName"] = service_name
+                            traces[span["traceId"]][span["spanId"]] = span
+    return traces
+
+
+def measure_hops(traces: Dict[str, Dict[str, Dict[str, Any]]]) -> Dict[Tuple[str, str], Dict[str, List[float]]]:
+    """The hop and end-to-end latencies in milliseconds of every consumed message, by its publishing and consuming span."""
+    latencies: Dict[Tuple[str, str], Dict[str, List[float]]] = defaultdict(lambda: {"hop": [], "end_to_end": []})
+    for spans in traces.values():
+        trace_start = min(int(span["startTimeUnixNano"]) for span in spans.values())
+        for span in spans.values():
+            publish = spans.get(span.get("parentSpanId", ""))
+            if span["kind"] != CONSUMER or publish is None or publish["kind"] != PRODUCER:
+                continue
+            hop = (f"{publish['serviceName']}: {publish['name']}", f"{span['serviceName']}: {span['name']}")
+            latencies[hop]["hop"].append((int(span["startTimeUnixNano"]) - int(publish["startTimeUnixNano"])) / 1e6)
+            latencies[hop]["end_to_end"].append((int(span["endTimeUnixNano"]) - trace_start) / 1e6)
+    return latencies
+
+
+def summarize(values: List[float]) -> str:
+    if len(values) < 2:
+        return f"p50 {values[0]:9.2f} ms"
+    percentiles = quantiles(values, n=100, method="inclusive")
+    return f"p50 {percentiles[49]:9.2f} ms  p95 {percentiles[94]:9.2f} ms  p99 {percentiles[98]:9.2f} ms  max {max(values):9.2f} ms"
+
+
+def main(paths: List[str]) -> None:
+    latencies = measure_hops(read_spans(paths))
+    if not latencies:
+        print("No consumed messages with the span of their publish were found.")
+        return
+    for (publisher, consumer), hop_latencies in sorted(latencies.items()):
+        print(f"{publisher} -> {consumer} ({len(hop_latencies['hop'])} messages)")
+        print(f"  hop         {summarize(hop_latencies['hop'])}")
+        print(f"  end to end  {summarize(hop_latencies['end_to_end'])}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    main(sys.argv[1:])
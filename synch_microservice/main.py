@@ -4,6 +4,10 @@ import signal
 
 # Internal Library imports
 from src.message_broker_management import get_employee_exchange_consumer, start_consumer, stop_consumer
+from src.database_management import open_mongodb_client, close_mongodb_client, get_pool_statistics
+from src.metrics_management import register_statistics, start_metrics_server, stop_metrics_server
+from src.services.entity_cache import brand_cache, color_cache
+from src.tracing_management import shutdown_tracing
 from src.logger_tool import logger
 
 shutdown_event = asyncio.Event()
@@ -12,7 +16,15 @@ def _signal_handler():
     logger.info("Received shutdown signal.")
     shutdown_event.set()
 
+def register_metrics():
+    register_statistics("mongodb_pool", get_pool_statistics, counters=("total_checkouts", "failed_checkouts"))
+    register_statistics("brand_cache", brand_cache.statistics, counters=("hits", "misses"))
+    register_statistics("color_cache", color_cache.statistics, counters=("hits", "misses"))
+
 async def main():
+    open_mongodb_client()
+    register_metrics()
+    start_metrics_server()
     consumer = get_employee_exchange_consumer()
     loop = asyncio.get_running_loop()
     for sig in (signal.SIGINT, signal.SIGTERM):
@@ -26,6 +38,10 @@ async def main():
     finally:
         logger.info("Stopping RabbitMQ consumer...")
         await stop_consumer(consumer)
+        logger.info(f"MongoDB connection pool statistics: {get_pool_statistics()}")
+        close_mongodb_client()
+        stop_metrics_server()
+        shutdown_tracing()
         logger.info("Consumer stopped. Exiting.")
 
 if __name__ == "__main__":
@@ -0,0 +1,56 @@
+# External Library imports
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class KeyedWorkerPool():
+    """
+    Runs blocking callbacks on a bounded pool of worker threads, so they do not block the event loop,
+    while callbacks with the same key run one after the other in the order they were submitted.
+
+    Every key keeps the completion future of its last submitted callback, and a new callback of that
+    key waits for it before it is handed to a thread. Callbacks of different keys run concurrently.
+    """
+
+    def __init__(self, max_workers: int):
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("The number of workers must be a positive integer.")
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="synch-worker")
+        self._tails: Dict[str, asyncio.Future] = {}
+
+    async def run(self, key: str, callback: Callable[[], T]) -> T:
+        """
+        Run the callback on a worker thread once every earlier callback with the same key has finished.
+
+        The callback is queued for its key before the first await, so callbacks keep the order
+        in which `run` was called. It runs in a copy of the context of the caller, such as its current span.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        previous = self._tails.get(key)
+        done = loop.create_future()
+        self._tails[key] = done
+        try:
+            if previous is not None and not previous.done():
+                await asyncio.shield(previous)
+            return await loop.run_in_executor(self._executor, context.run, callback)
+        finally:
+            if previous is not None and not previous.done():
+                # Cancelled while waiting, so the next callback of the key must still wait for the previous one.
+                previous.add_done_callback(lambda _: done.done() or done.set_result(None))
+            else:
+                done.set_result(None)
+                if self._tails.get(key) is done:
+                    del self._tails[key]
+
+    def pending_keys(self) -> int:
+        return len(self._tails)
+
+    def shutdown(self) -> None:
+        """Wait for the running callbacks to finish and stop the worker threads."""
+        self._executor.shutdown(wait=True)
@@ -1,10 +1,45 @@
 # External Library imports
+import os
 import json
+import time
+import asyncio
+from typing import List, Optional, Tuple
+from dotenv import load_dotenv
+from opentelemetry.trace import Span
 
 # Internal Library imports
-from src.logger_tool import logger
+from src.logger_tool import logger, payload_for_log
 from src.message_broker_management.base_consumer import BaseConsumer, AbstractIncomingMessage
-from src.util import handle_message
+from src.message_broker_management.keyed_worker_pool import KeyedWorkerPool
+from src.message_broker_management.throughput_meter import ThroughputMeter
+from src.message_broker_management.message_batcher import MessageBatcher
+from src.util import handle_message, handle_message_batch
+from src.services.entity_cache import brand_cache, color_cache
+from src.tracing_management import start_consume_span, consume_span, set_consume_outcome, batch_span
+from src.metrics_management import (
+    record_consumed_message,
+    record_settled_message,
+    ACKED,
+    RETRIED,
+    DEAD_LETTERED,
+    REQUEUED
+)
+
+
+load_dotenv()
+
+try:
+    SYNCH_WORKER_THREADS = int(os.getenv("SYNCH_WORKER_THREADS", 8))
+    SYNCH_THROUGHPUT_LOG_SECONDS = float(os.getenv("SYNCH_THROUGHPUT_LOG_SECONDS", 60))
+    SYNCH_BATCH_MAX_SIZE = int(os.getenv("SYNCH_BATCH_MAX_SIZE", 100))
+    SYNCH_BATCH_MAX_WAIT_MS = float(os.getenv("SYNCH_BATCH_MAX_WAIT_MS", 20))
+except ValueError:
+    raise ValueError("SYNCH_WORKER_THREADS and SYNCH_BATCH_MAX_SIZE must be integers and "
+                     "SYNCH_THROUGHPUT_LOG_SECONDS and SYNCH_BATCH_MAX_WAIT_MS must be numbers.")
+
+# Batches are applied one after the other, so the messages of an entity are never applied by two batches at once.
+BATCH_ORDERING_KEY = "batch"
+
 
 class MainConsumer(BaseConsumer):
     def __init__(self):
@@ -12,25 +47,150 @@ class MainConsumer(BaseConsumer):
             exchange_name="employee_exchange",
             queue_name="synch_microservice_queue"
         )
+        self.worker_pool = KeyedWorkerPool(SYNCH_WORKER_THREADS)
+        self.throughput = ThroughputMeter()
+        self._throughput_task: Optional[asyncio.Task] = None
+        # A batch size of 1 handles every message on its own.
+        self.batcher: Optional[MessageBatcher[Tuple[AbstractIncomingMessage, dict, float, Span]]] = None
+        if SYNCH_BATCH_MAX_SIZE > 1:
+            self.batcher = MessageBatcher(SYNCH_BATCH_MAX_SIZE, SYNCH_BATCH_MAX_WAIT_MS / 1000, self._apply_batch)
+
+    @staticmethod
+    def get_ordering_key(routing_key: str, message_data: dict) -> str:
+        """
+        Messages about the same entity, such as 'insurance.created' and 'insurance.updated' of one insurance,
+        must be processed in the order they were published, messages about different entities need not be.
+        """
+        entity_id = message_data.get("id") if isinstance(message_data, dict) else None
+        return f"{routing_key.split('.')[0]}:{entity_id}"
 
     async def on_message(self, message: AbstractIncomingMessage):
-        """Handle incoming messages."""
-        async with message.process(requeue=True, reject_on_redelivered=True):
+        """Handle incoming messages, in the trace of the request that published them."""
+        if self.batcher is None:
+            await self._process_message(message)
+            return
+        received_at = time.perf_counter()
+        routing_key = self.get_routing_key(message)
+        record_consumed_message(self.queue_name, routing_key)
+        # The span of the message lasts until it is settled, after its batch has been applied.
+        span = start_consume_span(message.headers, self.exchange_name, self.queue_name, routing_key)
+        try:
+            logger.info("Received message with routing key: %s", routing_key)
+            message_data = json.loads(message.body.decode("utf-8"))
+        except Exception as e:
+            await self._settle(message, received_at, span, e)
+            return
+        self.batcher.add((message, message_data, received_at, span))
+
+    async def _apply_batch(self, batch: List[Tuple[AbstractIncomingMessage, dict, float, Span]]) -> None:
+        """Apply the batch with one bulk write per collection, and only then settle its messages."""
+        try:
+            with batch_span(self.queue_name, [span for _, _, _, span in batch]):
+                errors = await self.worker_pool.run(
+                    BATCH_ORDERING_KEY,
+                    lambda: handle_message_batch(
+                        self.get_database_connection(),
+                        [(self.get_routing_key(message), message_data) for message, message_data, _, _ in batch]
+                    )
+                )
+        except Exception as e:
+            logger.error(f"Error applying a batch of {len(batch)} messages: {e}")
+            errors = [e] * len(batch)
+        for (message, _, received_at, span), error in zip(batch, errors):
+            await self._settle(message, received_at, span, error)
+        logger.info(f"Batch of {len(batch)} messages processed, {sum(error is not None for error in errors)} failed.")
+
+    async def _settle(self, message: AbstractIncomingMessage, received_at: float, span: Span, error: Optional[Exception]) -> None:
+        """Acknowledge a handled message, or retry a failed one after its backoff and dead-letter it when it has no attempts left."""
+        # A message that could not be settled is redelivered by the broker.
+        outcome = REQUEUED
+        try:
+            if error is None:
+                await message.ack()
+                outcome = ACKED
+            else:
+                logger.error(f"Error processing message: {error}")
+                try:
+                    outcome = DEAD_LETTERED if await self.retry_or_dead_letter(message, error) else RETRIED
+                except Exception as e:
+                    logger.error(f"Failed to retry the message, will requeue it: {e}")
+                    await message.nack(requeue=True)
+        except Exception as e:
+            logger.error(f"Failed to settle message with routing key: {message.routing_key}: {e}")
+        processing_seconds = time.perf_counter() - received_at
+        self.throughput.record(processing_seconds, error is None)
+        record_settled_message(self.queue_name, self.get_routing_key(message), outcome, processing_seconds)
+        set_consume_outcome(span, outcome, error)
+        span.end()
+
+    async def _process_message(self, message: AbstractIncomingMessage):
+        started_at = time.perf_counter()
+        routing_key = self.get_routing_key(message)
+        record_consumed_message(self.queue_name, routing_key)
+        outcome = REQUEUED
+        error: Optional[Exception] = None
+        with consume_span(message.headers, self.exchange_name, self.queue_name, routing_key) as span:
+            try:
+                # A failed message is acknowledged once it has been retried, it is only requeued if retrying it failed.
+                async with message.process(requeue=True, ignore_processed=True):
+                    try:
+                        logger.info("Received message with routing key: %s", routing_key)
+                        # Decode the message and log it
+                        message_body: str = message.body.decode("utf-8")
+                        logger.info("Received message to process: %s", payload_for_log(message_body))
+                        # Parse the message body as JSON
+                        message_data = json.loads(message_body)
+                        # Handle the message based on the routing key on a worker thread, so the blocking MongoDB
+                        # calls do not stall heartbeats and other deliveries. The message is queued behind the
+                        # earlier messages of its entity before anything is awaited, which keeps their order.
+                        ordering_key = self.get_ordering_key(routing_key, message_data)
+                        await self.worker_pool.run(
+                            ordering_key,
+                            lambda: handle_message(self.get_database_connection(), message_data, routing_key)
+                        )
+                        logger.info("Message processed successfully: %s", payload_for_log(message_data))
+                        outcome = ACKED
+                    except Exception as e:
+                        error = e
+                        # Log the error
+                        logger.error(f"Error processing message: {e}")
+                        outcome = DEAD_LETTERED if await self.retry_or_dead_letter(message, e) else RETRIED
+            finally:
+                set_consume_outcome(span, outcome, error)
+                processing_seconds = time.perf_counter() - started_at
+                self.throughput.record(processing_seconds, outcome == ACKED)
+                record_settled_message(self.queue_name, routing_key, outcome, processing_seconds)
+
+    async def start(self):
+        await super().start()
+        if self._throughput_task is None and SYNCH_THROUGHPUT_LOG_SECONDS > 0:
+            self._throughput_task = asyncio.create_task(self._log_throughput(), name="synch-throughput-log")
+
+    async def stop(self):
+        task, self._throughput_task = self._throughput_task, None
+        if task is not None:
+            task.cancel()
             try:
-                logger.info(f"Received message with routing key: {message.routing_key}")
-                # Decode the message and log it
-                message_body: str = message.body.decode("utf-8")
-                logger.info(f"Received message to process: {message_body}")
-                # Parse the message body as JSON
-                message_data = json.loads(message_body)
-                # Handle the message based on the routing key
-                handle_message(self.get_database_connection(), message_data, message.routing_key)
-                logger.info(f"Message processed successfully: {message_data}")
-            except Exception as e:
-                # Log the error
-                logger.error(f"Error processing message: {e}")
-                logger.warning(f"Will requeue the message: {message.body}")
-                raise
+                await task
+            except asyncio.CancelledError:
+                pass
+        # The deliveries are cancelled and the messages being handled are settled while the channel is still open,
+        # only then are the worker threads stopped and the connection closed.
+        await self.cancel_consuming()
+        if self.batcher is not None:
+            # Apply and settle the accumulated messages, no more are added once the deliveries are cancelled.
+            await self.batcher.close()
+        await asyncio.to_thread(self.worker_pool.shutdown)
+        await super().stop()
+        logger.info(f"Consumer throughput: {self.throughput.statistics()}")
+
+    async def _log_throughput(self) -> None:
+        while True:
+            await asyncio.sleep(SYNCH_THROUGHPUT_LOG_SECONDS)
+            logger.info(f"Consumer throughput: {self.throughput.statistics()}, "
+                        f"entities in progress: {self.worker_pool.pending_keys()}, "
+                        f"brand cache hits/misses: {brand_cache.hits}/{brand_cache.misses}, "
+                        f"color cache hits/misses: {color_cache.hits}/{color_cache.misses}")
 
 
 
@@ -46,4 +206,4 @@ async def start_consumer(consumer: MainConsumer) -> None:
 async def stop_consumer(consumer: MainConsumer) -> None:
     """Stop the consumer."""
     if isinstance(consumer, MainConsumer):
-        await consumer.stop()
\ No newline at end of file
+        await consumer.stop()
@@ -0,0 +1,50 @@
+# External Library imports
+import asyncio
+from typing import Awaitable, Callable, Generic, List, Optional, Set, TypeVar
+
+T = TypeVar("T")
+
+
+class MessageBatcher(Generic[T]):
+    """
+    Accumulates items on the event loop and hands them to the flush callback in batches.
+
+    A batch is flushed as soon as it holds `max_size` items, or `max_wait_seconds` after its first item
+    arrived, whichever comes first, so a single message is never delayed by more than the wait.
+    Batches are flushed in the order they were started.
+    """
+
+    def __init__(self, max_size: int, max_wait_seconds: float, flush: Callable[[List[T]], Awaitable[None]]):
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError("The maximum batch size must be a positive integer.")
+        self.max_size = max_size
+        self.max_wait_seconds = max_wait_seconds
+        self._flush = flush
+        self._items: List[T] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    def add(self, item: T) -> None:
+        self._items.append(item)
+        if len(self._items) >= self.max_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_wait_seconds, self.flush)
+
+    def flush(self) -> None:
+        """Start flushing the accumulated items, if there are any."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._items:
+            return
+        batch, self._items = self._items, []
+        task = asyncio.get_running_loop().create_task(self._flush(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def close(self) -> None:
+        """Flush the accumulated items and wait for every started flush to finish."""
+        self.flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
@@ -0,0 +1,187 @@
+# External Library imports
+import os
+from datetime import datetime, timezone
+from dotenv import load_dotenv
+from typing import Any, Dict, List, Optional
+from aio_pika import DeliveryMode, ExchangeType, Message
+from aio_pika.abc import AbstractChannel, AbstractExchange, AbstractIncomingMessage
+
+# Internal Library imports
+from src.logger_tool import logger
+
+
+load_dotenv()
+
+try:
+    RABBITMQ_RETRY_MAX_ATTEMPTS = int(os.getenv("RABBITMQ_RETRY_MAX_ATTEMPTS", 5))
+    RABBITMQ_RETRY_BASE_DELAY_MS = int(os.getenv("RABBITMQ_RETRY_BASE_DELAY_MS", 1000))
+    RABBITMQ_RETRY_MAX_DELAY_MS = int(os.getenv("RABBITMQ_RETRY_MAX_DELAY_MS", 60000))
+except ValueError:
+    raise ValueError("RABBITMQ_RETRY_MAX_ATTEMPTS, RABBITMQ_RETRY_BASE_DELAY_MS and "
+                     "RABBITMQ_RETRY_MAX_DELAY_MS must be integers.")
+
+# The number of failed attempts of a message, counting every attempt that was retried or dead-lettered.
+RETRY_COUNT_HEADER = "x-retry-count"
+# The routing key the message was originally published with, as a retried message is
+# dead-lettered back to the queue with the name of the queue as its routing key.
+ORIGINAL_ROUTING_KEY_HEADER = "x-original-routing-key"
+ORIGINAL_EXCHANGE_HEADER = "x-original-exchange"
+LAST_ERROR_HEADER = "x-last-error"
+FAILED_AT_HEADER = "x-failed-at"
+
+DEATH_HEADERS = (
+    "x-death",
+    "x-first-death-exchange",
+    "x-first-death-queue",
+    "x-first-death-reason",
+    "x-last-death-exchange",
+    "x-last-death-queue",
+    "x-last-death-reason",
+)
+
+DEAD_LETTER_ROUTING_KEY = "dead-letter"
+# Long errors are cut, as headers are kept in memory by the broker with every message.
+MAX_ERROR_HEADER_LENGTH = 1000
+
+
+class RetryPolicy():
+    """
+    How often and after how long a failed message is retried.
+
+    The n-th retry of a message is delayed by `base_delay_ms * 2 ** (n - 1)` milliseconds,
+    capped at `max_delay_ms`, and a message that failed `max_attempts` times is dead-lettered.
+    """
+
+    def __init__(self, max_attempts: int, base_delay_ms: int, max_delay_ms: int):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        if base_delay_ms < 1 or max_delay_ms < base_delay_ms:
+            raise ValueError("base_delay_ms must be at least 1 and max_delay_ms must not be less than base_delay_ms.")
+        self.max_attempts = max_attempts
+        self.base_delay_ms = base_delay_ms
+        self.max_delay_ms = max_delay_ms
+
+    def get_delay_ms(self, attempt: int) -> int:
+        """The delay before retrying a message that has failed `attempt` times."""
+        return min(self.base_delay_ms * 2 ** (attempt - 1), self.max_delay_ms)
+
+    def get_delays_ms(self) -> List[int]:
+        """The distinct delays of all the retries, from the shortest to the longest."""
+        return sorted({self.get_delay_ms(attempt) for attempt in range(1, self.max_attempts)})
+
+
+class RetryTopology():
+    """
+    The delay queues and the dead-letter queue of a consumer queue.
+
+    A failed message is not requeued straight away, which would redeliver it immediately in a hot loop,
+    but published to the `<queue>.retry` exchange, which routes it to the delay queue of its backoff.
+    Each delay queue has a fixed message TTL, so no message waits behind a message with a longer delay,
+    and dead-letters expired messages back to the consumer queue through the default exchange.
+    The number of attempts and the original routing key are carried in the headers of the message.
+    A message that has used up its attempts is published to `<queue>.dlq` with the last error,
+    where it stays until it is re-driven or purged with the dead-letter CLI.
+
+    The failed message is only acknowledged once its retry has been confirmed by the broker,
+    so a message is never lost, but may be delivered once more if the consumer dies in between.
+    """
+
+    def __init__(self, queue_name: str, policy: RetryPolicy):
+        self.queue_name = queue_name
+        self.policy = policy
+        self.retry_exchange_name = f"{queue_name}.retry"
+        self.dead_letter_queue_name = f"{queue_name}.dlq"
+        self.retry_exchange: Optional[AbstractExchange] = None
+
+    def get_delay_queue_name(self, delay_ms: int) -> str:
+        return f"{self.queue_name}.retry.{delay_ms}ms"
+
+    async def declare(self, channel: AbstractChannel) -> None:
+        """Declare the retry exchange, the delay queues and the dead-letter queue on the channel."""
+        self.retry_exchange = await channel.declare_exchange(self.retry_exchange_name, ExchangeType.DIRECT, durable=True)
+        for delay_ms in self.policy.get_delays_ms():
+            delay_queue_name = self.get_delay_queue_name(delay_ms)
+            delay_queue = await channel.declare_queue(
+                delay_queue_name,
+                durable=True,
+                arguments={
+                    "x-message-ttl": delay_ms,
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": self.queue_name,
+                }
+            )
+            await delay_queue.bind(self.retry_exchange, delay_queue_name)
+        dead_letter_queue = await channel.declare_queue(self.dead_letter_queue_name, durable=True)
+        await dead_letter_queue.bind(self.retry_exchange, DEAD_LETTER_ROUTING_KEY)
+        logger.info(f"Declared retry topology of queue: {self.queue_name} with delays: {self.policy.get_delays_ms()} ms, "
+                    f"max attempts: {self.policy.max_attempts}, dead-letter queue: {self.dead_letter_queue_name}")
+
+    @staticmethod
+    def get_routing_key(message: AbstractIncomingMessage) -> str:
+        """The routing key the message was originally published with, also after it has been retried."""
+        original_routing_key = (message.headers or {}).get(ORIGINAL_ROUTING_KEY_HEADER)
+        if isinstance(original_routing_key, bytes):
+            original_routing_key = original_routing_key.decode("utf-8")
+        return original_routing_key if isinstance(original_routing_key, str) else message.routing_key
+
+    @staticmethod
+    def get_retry_count(message: AbstractIncomingMessage) -> int:
+        retry_count = (message.headers or {}).get(RETRY_COUNT_HEADER, 0)
+        return retry_count if isinstance(retry_count, int) else 0
+
+    async def retry_or_dead_letter(self, message: AbstractIncomingMessage, error: BaseException) -> bool:
+        """
+        Publish the failed message to the delay queue of its next attempt, or to the dead-letter queue
+        once it has failed `max_attempts` times, and acknowledge it when the broker has confirmed the publish.
+
+        :param AbstractIncomingMessage message: The message that failed.
+        :param BaseException error: The error the message failed with.
+        :return: True if the message was dead-lettered, False if it will be retried.
+        :raises ConnectionError: If the retry topology has not been declared.
+        """
+        if self.retry_exchange is None:
+            raise ConnectionError(f"The retry topology of queue: {self.queue_name} has not been declared.")
+
+        attempt = self.get_retry_count(message) + 1
+        headers = self._build_headers(message, attempt, error)
+        if attempt < self.policy.max_attempts:
+            delay_ms = self.policy.get_delay_ms(attempt)
+            routing_key = self.get_delay_queue_name(delay_ms)
+            logger.warning(f"Message with routing key: {headers[ORIGINAL_ROUTING_KEY_HEADER]} failed attempt "
+                           f"{attempt}/{self.policy.max_attempts}, will retry it in {delay_ms} ms.")
+        else:
+            routing_key = DEAD_LETTER_ROUTING_KEY
+            logger.error(f"Message with routing key: {headers[ORIGINAL_ROUTING_KEY_HEADER]} failed all "
+                         f"{self.policy.max_attempts} attempts, will dead-letter it to: {self.dead_letter_queue_name}")
+
+        await self.retry_exchange.publish(
+            Message(
+                message.body,
+                headers=headers,
+                content_type=message.content_type,
+                content_encoding=message.content_encoding,
+                correlation_id=message.correlation_id,
+                message_id=message.message_id,
+                timestamp=message.timestamp,
+                delivery_mode=DeliveryMode.PERSISTENT
+            ),
+            routing_key=routing_key
+        )
+        await message.ack()
+        return routing_key == DEAD_LETTER_ROUTING_KEY
+
+    def _build_headers(self, message: AbstractIncomingMessage, attempt: int, error: BaseException) -> Dict[str, Any]:
+        headers: Dict[str, Any] = dict(message.headers or {})
+        # The broker adds an x-death entry every time a message expires in a delay queue,
+        # the attempts are counted in the retry count header instead.
+        for death_header in DEATH_HEADERS:
+            headers.pop(death_header, None)
+        headers[RETRY_COUNT_HEADER] = attempt
+        headers[ORIGINAL_ROUTING_KEY_HEADER] = self.get_routing_key(message)
+        headers.setdefault(ORIGINAL_EXCHANGE_HEADER, message.exchange or "")
+        headers[LAST_ERROR_HEADER] = f"{type(error).__name__}: {error}"[:MAX_ERROR_HEADER_LENGTH]
+        headers[FAILED_AT_HEADER] = datetime.now(timezone.utc).isoformat()
+        return headers
+
+
+RETRY_POLICY = RetryPolicy(RABBITMQ_RETRY_MAX_ATTEMPTS, RABBITMQ_RETRY_BASE_DELAY_MS, RABBITMQ_RETRY_MAX_DELAY_MS)
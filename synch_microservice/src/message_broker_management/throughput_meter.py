@@ -0,0 +1,54 @@
+# External Library imports
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Tuple
+
+
+class ThroughputMeter():
+    """
+    Counts the processed messages and their rate over a sliding window of whole seconds.
+
+    Only used from the event loop, so it needs no locking.
+    """
+
+    def __init__(self, window_seconds: int = 60):
+        self.window_seconds = window_seconds
+        self.processed: int = 0
+        self.failed: int = 0
+        self.total_processing_seconds: float = 0.0
+        self._started_at = time.monotonic()
+        # (second, messages processed in that second), oldest first.
+        self._buckets: Deque[Tuple[int, int]] = deque()
+
+    def record(self, processing_seconds: float, succeeded: bool) -> None:
+        now = int(time.monotonic())
+        if self._buckets and self._buckets[-1][0] == now:
+            self._buckets[-1] = (now, self._buckets[-1][1] + 1)
+        else:
+            self._buckets.append((now, 1))
+        self._expire(now)
+        self.total_processing_seconds += processing_seconds
+        if succeeded:
+            self.processed += 1
+        else:
+            self.failed += 1
+
+    def messages_per_second(self) -> float:
+        """The rate of the messages handled within the window, successful or not."""
+        now = time.monotonic()
+        self._expire(int(now))
+        window = min(self.window_seconds, max(now - self._started_at, 1.0))
+        return sum(count for _, count in self._buckets) / window
+
+    def statistics(self) -> Dict[str, Any]:
+        handled = self.processed + self.failed
+        return {
+            "processed": self.processed,
+            "failed": self.failed,
+            "messages_per_second": round(self.messages_per_second(), 3),
+            "average_processing_seconds": round(self.total_processing_seconds / handled, 6) if handled else 0.0,
+        }
+
+    def _expire(self, now: int) -> None:
+        while self._buckets and self._buckets[0][0] <= now - self.window_seconds:
+            self._buckets.popleft()
@@ -0,0 +1,11 @@
+from .statistics_collector import StatisticsCollector, register_statistics
+from .broker_metrics import (
+    record_consumed_message,
+    record_settled_message,
+    ACKED,
+    RETRIED,
+    DEAD_LETTERED,
+    REQUEUED
+)
+from .database_metrics import command_metrics
+from .metrics_server import start_metrics_server, stop_metrics_server
@@ -0,0 +1,46 @@
+# External Library imports
+import os
+import threading
+from dotenv import load_dotenv
+from typing import Optional
+from wsgiref.simple_server import WSGIServer
+from prometheus_client import start_http_server
+
+# Internal Library imports
+from src.logger_tool import logger
+
+
+load_dotenv()
+
+SYNCH_METRICS_HOST = os.getenv("SYNCH_METRICS_HOST", "0.0.0.0")
+try:
+    SYNCH_METRICS_PORT = int(os.getenv("SYNCH_METRICS_PORT", 8004))
+except ValueError:
+    raise ValueError("SYNCH_METRICS_PORT must be an integer.")
+
+_server: Optional[WSGIServer] = None
+_server_thread: Optional[threading.Thread] = None
+
+
+def start_metrics_server() -> None:
+    """
+    Serves the metrics of the consumer at `/metrics` on `SYNCH_METRICS_PORT`, as the service has no HTTP server of its own.
+
+    The listener runs on a daemon thread, so a scrape never waits for the event loop. A port of 0 disables it.
+    """
+    global _server, _server_thread
+    if _server is not None or SYNCH_METRICS_PORT <= 0:
+        return
+    _server, _server_thread = start_http_server(SYNCH_METRICS_PORT, addr=SYNCH_METRICS_HOST)
+    logger.info(f"Serving metrics on {SYNCH_METRICS_HOST}:{SYNCH_METRICS_PORT}/metrics")
+
+
+def stop_metrics_server() -> None:
+    global _server, _server_thread
+    server, _server = _server, None
+    server_thread, _server_thread = _server_thread, None
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+    if server_thread is not None:
+        server_thread.join()
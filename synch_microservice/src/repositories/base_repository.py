@@ -1,10 +1,16 @@
 # External Library imports
+from typing import Any, Dict, Sequence
+from pymongo import UpdateOne
 from pymongo.collection import Collection
+from pymongo.results import BulkWriteResult
 
 # Internal library imports
 from src.database_management import Database
 
 
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+
 class BaseRepository:
     def __init__(self, database: Database):
         if not isinstance(database, Database):
@@ -24,3 +30,44 @@ class BaseRepository:
     
     def get_brands_collection(self) -> Collection:
         return self.database.get_collection("brands")
+    
+    
+    def bulk_write(self, collection: Collection, operations: Sequence[UpdateOne]) -> BulkWriteResult:
+        """
+        Applies the write operations to the collection in one round trip.
+
+        The operations are unordered, so every operation is attempted even if another one fails,
+        and MongoDB may apply them in any order. Only operations that are guarded against
+        being applied out of order, such as the conditional upserts of the repositories, may be given.
+
+        :param collection: The collection to write to.
+        :type collection: Collection
+        :param operations: The write operations to apply.
+        :type operations: Sequence[UpdateOne]
+        :return: The result of the bulk write.
+        :rtype: BulkWriteResult
+        :raises pymongo.errors.BulkWriteError: If any of the operations failed, with the failed operations in its details.
+        """
+        return collection.bulk_write(list(operations), ordered=False)
+    
+    
+    @staticmethod
+    def is_duplicate_key_error(write_error: Dict[str, Any], field: str) -> bool:
+        """
+        Checks whether a write error was raised by the unique index of the given field.
+
+        :param write_error: A write error from the details of a `BulkWriteError` or a `DuplicateKeyError`.
+        :type write_error: Dict[str, Any]
+        :param field: The field of the unique index, such as `_id` or `name`.
+        :type field: str
+        :return: True if the write error is a duplicate key error of the field, False otherwise.
+        :rtype: bool
+        """
+        if write_error.get("code") != DUPLICATE_KEY_ERROR_CODE:
+            return False
+        key_pattern = write_error.get("keyPattern")
+        if key_pattern is not None:
+            return field in key_pattern
+        # Older servers only name the index in the error message.
+        return f"index: {field}_" in str(write_error.get("errmsg", ""))
+
@@ -1,5 +1,5 @@
 # External Library imports
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 # Internal library imports
 from src.entities import BrandEntity
@@ -26,3 +26,26 @@ class BrandRepository(BaseRepository):
         if brand_query is not None:
             return BrandEntity(**brand_query)
         return None
+    
+    def get_by_ids(self, brand_ids: Iterable[str]) -> Dict[str, BrandEntity]:
+        """
+        Retrieves the brands with the given IDs from the Customer Mongo database in one query.
+
+        This method queries the MongoDB collection with a single `$in` filter, so the number
+        of round trips does not grow with the number of IDs. IDs of brands that do not exist
+        are missing from the result.
+
+        :param brand_ids: The IDs of the brands to retrieve.
+        :type brand_ids: Iterable[str]
+        :return: The `BrandEntity` objects that were found, by their ID.
+        :rtype: Dict[str, BrandEntity]
+        """
+        brand_ids = list(set(brand_ids))
+        if not brand_ids:
+            return {}
+        
+        brands_collection = self.get_brands_collection()
+        brands_query = brands_collection.find({"_id": {"$in": brand_ids}})
+        
+        brands = [BrandEntity(**brand) for brand in brands_query]
+        return {brand.id: brand for brand in brands}
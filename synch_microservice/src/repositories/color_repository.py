@@ -1,5 +1,5 @@
 # External Library imports
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 # Internal library imports
 from src.entities import ColorEntity
@@ -26,4 +26,27 @@ class ColorRepository(BaseRepository):
         if color_query is not None:
             return ColorEntity(**color_query)
         return None
-    
\ No newline at end of file
+    
+    
+    def get_by_ids(self, color_ids: Iterable[str]) -> Dict[str, ColorEntity]:
+        """
+        Retrieves the colors with the given IDs from the Customer Mongo database in one query.
+
+        This method queries the MongoDB collection with a single `$in` filter, so the number
+        of round trips does not grow with the number of IDs. IDs of colors that do not exist
+        are missing from the result.
+
+        :param color_ids: The IDs of the colors to retrieve.
+        :type color_ids: Iterable[str]
+        :return: The `ColorEntity` objects that were found, by their ID.
+        :rtype: Dict[str, ColorEntity]
+        """
+        color_ids = list(set(color_ids))
+        if not color_ids:
+            return {}
+        
+        colors_collection = self.get_colors_collection()
+        colors_query = colors_collection.find({"_id": {"$in": color_ids}})
+        
+        colors = [ColorEntity(**color) for color in colors_query]
+        return {color.id: color for color in colors}
@@ -1,5 +1,7 @@
 # External Library imports
-from typing import Optional, List
+from typing import Optional, List, Tuple
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
 
 # Internal library imports
 from src.entities import InsuranceEntity, InsuranceMessage
@@ -71,6 +73,49 @@ class InsuranceRepository(BaseRepository):
         return None
     
     
+    def upsert(self, insurance_data: InsuranceMessage) -> bool:
+        """
+        Creates or overwrites an insurance in one atomic round trip, applying the rule that the last writer wins.
+        
+        :param insurance_data: The data of the created or updated insurance.
+        :type insurance_data: InsuranceMessage
+        :return: True if the insurance was inserted or overwritten, False if a newer insurance is already stored.
+        :rtype: bool
+        :raises pymongo.errors.DuplicateKeyError: If another insurance already has the name of the insurance.
+        """
+        upsert_filter, upsert_update = self._get_upsert_filter_and_update(insurance_data)
+        try:
+            self.get_insurances_collection().update_one(upsert_filter, upsert_update, upsert=True)
+        except DuplicateKeyError as e:
+            if self.is_duplicate_key_error(e.details or {"code": e.code, "errmsg": str(e)}, "_id"):
+                return False
+            raise
+        return True
+    
+    def get_upsert_operation(self, insurance_data: InsuranceMessage) -> UpdateOne:
+        """
+        Builds the conditional upsert of `upsert` as an operation of a bulk write.
+        
+        :param insurance_data: The data of the created or updated insurance.
+        :type insurance_data: InsuranceMessage
+        :return: The upsert operation.
+        :rtype: UpdateOne
+        """
+        upsert_filter, upsert_update = self._get_upsert_filter_and_update(insurance_data)
+        return UpdateOne(upsert_filter, upsert_update, upsert=True)
+    
+    def _get_upsert_filter_and_update(self, insurance_data: InsuranceMessage) -> Tuple[dict, dict]:
+        # The insurance is only overwritten if the stored insurance was updated before the message,
+        # and is inserted if it does not exist yet. If a newer insurance is stored, the filter does not
+        # match and the insert fails with a duplicate key error on `_id`, meaning the message is stale.
+        # The timestamps are stored as ISO 8601 strings of the same format, so they compare in time order.
+        insurance_document = insurance_data.to_mongo_dict(exlude_id=True)
+        return (
+            {"_id": insurance_data.id, "updated_at": {"$lt": insurance_document["updated_at"]}},
+            {"$set": insurance_document}
+        )
+    
+    
     def get_by_name(self, insurance_name: str, insurance_id: Optional[str] = None) -> Optional[InsuranceEntity]:
         """
         Retrieves an insurance by name from the Employee MySQL database.
@@ -1,5 +1,6 @@
 # External Library imports
 from typing import Optional, List
+from pymongo import UpdateOne
 
 # Internal library imports
 from src.repositories.base_repository import BaseRepository
@@ -54,6 +55,40 @@ class ModelRepository(BaseRepository):
         
         models_collection.insert_one(model_entity.to_mongo_dict(exlude_id=False))
         return model_entity
-        
     
-    
\ No newline at end of file
+    def get_create_operation(self, 
+                             model_create_data: ModelMessage, 
+                             brand_entity: BrandEntity, 
+                             color_entities: List[ColorEntity]
+        ) -> UpdateOne:
+        """
+        Builds an upsert that only inserts the model if no model with its ID exists yet,
+        so a duplicate creation message leaves the stored model untouched.
+        
+        :param model_create_data: The data for the model to create.
+        :type model_create_data: ModelMessage
+        :param brand_entity: The brand of the model.
+        :type brand_entity: BrandEntity
+        :param color_entities: The colors of the model.
+        :type color_entities: List[ColorEntity]
+        :return: The insert if missing operation.
+        :rtype: UpdateOne
+        """
+        model_entity = ModelEntity(
+            _id=model_create_data.id,
+            name=model_create_data.name,
+            price=model_create_data.price,
+            image_url=model_create_data.image_url,
+            brand=brand_entity,
+            colors=color_entities,
+            created_at=model_create_data.created_at,
+            updated_at=model_create_data.updated_at
+        )
+        # The embedded brand and colors keep their IDs, only the ID of the model itself comes from the filter.
+        model_document = model_entity.to_mongo_dict(exlude_id=False)
+        model_document.pop("_id")
+        return UpdateOne(
+            {"_id": model_create_data.id},
+            {"$setOnInsert": model_document},
+            upsert=True
+        )
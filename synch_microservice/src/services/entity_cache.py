@@ -0,0 +1,121 @@
+# External Library imports
+import os
+import time
+import threading
+from collections import OrderedDict
+from dotenv import load_dotenv
+from typing import Any, Dict, Generic, Iterable, List, Tuple, TypeVar
+
+# Internal library imports
+from src.entities import BrandEntity, ColorEntity
+
+
+load_dotenv()
+
+try:
+    SYNCH_DEPENDENCY_CACHE_TTL_SECONDS = float(os.getenv("SYNCH_DEPENDENCY_CACHE_TTL_SECONDS", 60))
+    SYNCH_DEPENDENCY_CACHE_MAX_ENTRIES = int(os.getenv("SYNCH_DEPENDENCY_CACHE_MAX_ENTRIES", 1024))
+except ValueError:
+    raise ValueError("SYNCH_DEPENDENCY_CACHE_TTL_SECONDS must be a number and "
+                     "SYNCH_DEPENDENCY_CACHE_MAX_ENTRIES must be an integer.")
+
+
+EntityT = TypeVar("EntityT")
+
+
+class EntityCache(Generic[EntityT]):
+    """
+    A bounded, per-process cache of the entities that synchronised entities depend on, such as
+    the brand and colors of a model.
+
+    Brands and colors are seeded into the Customer Mongo database and are never changed by
+    the messages of this service, so caching them for a short time to live saves their queries
+    for most models. Only found entities are cached, an entity that does not exist yet is looked
+    up again for the next message. A time to live of 0 or less disables the cache.
+
+    The cache is used from the worker threads of the consumer, so every access is guarded by a lock.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: "OrderedDict[str, Tuple[EntityT, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get_many(self, entity_ids: Iterable[str]) -> Tuple[Dict[str, EntityT], List[str]]:
+        """
+        Looks up the entities with the given IDs.
+
+        :param entity_ids: The IDs of the entities.
+        :type entity_ids: Iterable[str]
+        :return: The cached entities by their ID, and the IDs that are not cached.
+        :rtype: Tuple[Dict[str, EntityT], List[str]]
+        """
+        entity_ids = list(dict.fromkeys(entity_ids))
+        if not self.is_enabled:
+            return {}, entity_ids
+
+        now = time.monotonic()
+        cached_entities: Dict[str, EntityT] = {}
+        missing_ids: List[str] = []
+        with self._lock:
+            for entity_id in entity_ids:
+                cached_entry = self._entries.get(entity_id)
+                if cached_entry is not None and now < cached_entry[1]:
+                    self._entries.move_to_end(entity_id)
+                    cached_entities[entity_id] = cached_entry[0]
+                    continue
+                if cached_entry is not None:
+                    del self._entries[entity_id]
+                missing_ids.append(entity_id)
+            self.hits += len(cached_entities)
+            self.misses += len(missing_ids)
+        return cached_entities, missing_ids
+
+    def put_many(self, entities: Dict[str, EntityT]) -> None:
+        """
+        Caches the given entities.
+
+        :param entities: The loaded entities by their ID.
+        :type entities: Dict[str, EntityT]
+        """
+        if not self.is_enabled or not entities:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            for entity_id, entity in entities.items():
+                self._entries[entity_id] = (entity, expires_at)
+                self._entries.move_to_end(entity_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Returns a snapshot of the cache statistics.
+
+        :return: The cache statistics.
+        :rtype: Dict[str, Any]
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+brand_cache: EntityCache[BrandEntity] = EntityCache(SYNCH_DEPENDENCY_CACHE_TTL_SECONDS, SYNCH_DEPENDENCY_CACHE_MAX_ENTRIES)
+color_cache: EntityCache[ColorEntity] = EntityCache(SYNCH_DEPENDENCY_CACHE_TTL_SECONDS, SYNCH_DEPENDENCY_CACHE_MAX_ENTRIES)
@@ -1,5 +1,6 @@
 # External Library imports
-
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
 
 # Internal library imports
 from src.logger_tool import logger
@@ -13,39 +14,14 @@ def create(
         database: Database,
         insurance_create_data: InsuranceMessage
 ) -> None:
-
-    repository = InsuranceRepository(database)
     
     if not isinstance(insurance_create_data, InsuranceMessage):
         raise TypeError(f"insurance_create_data must be of type InsuranceMessage, "
                         f"not {type(insurance_create_data).__name__}.")
     
-    existing_insurance_with_the_same_name = repository.get_by_name(insurance_create_data.name, insurance_create_data.id)
-    if existing_insurance_with_the_same_name is not None:
-        logger.warning(f"Insurance with name {insurance_create_data.name} already exists.")
-        logger.error("Will assume the insurance before has not had its name updated or has not been removed yet, so will have the try again later")
-        raise AlreadyTakenFieldValueError(
-            field_name="name",
-            field_value=insurance_create_data.name,
-            entity_name="Insurance"
-        )
-    
-    already_created_insurance = repository.get_by_id(insurance_create_data.id)
-    if already_created_insurance is not None:
-        logger.warning(f"Insurance with id {insurance_create_data.id} already exists.")
-        if insurance_create_data.created_at > already_created_insurance.updated_at:
-            logger.info(f"Insurance with id {insurance_create_data.id} will be updated.")
-            logger.info(f"As the already existing insurance has not been updated since {already_created_insurance.updated_at.strftime("%d/%m/%Y, %H:%M:%S")}, "
-                        f"the new insurance will be created as it was created in the future {insurance_create_data.created_at.strftime("%d/%m/%Y, %H:%M:%S")}.")
-            repository.update(insurance_create_data)
-            logger.info(f"Insurance with id {insurance_create_data.id} has been created by being updated.")
-            return None
-        else:
-            logger.warning(f"Insurance with id {insurance_create_data.id} has not been updated since {already_created_insurance.updated_at.strftime("%d/%m/%Y, %H:%M:%S")}. "
-                           f"The creation will not be applied as its data is in the past {insurance_create_data.created_at.strftime("%d/%m/%Y, %H:%M:%S")}.")
-            return None
-    
-    repository.create(insurance_create_data)
+    # A creation of an insurance that was already updated is dropped as stale,
+    # the same as an update that is older than the stored insurance.
+    _upsert(database, insurance_create_data)
     return None
 
 
@@ -53,42 +29,57 @@ def update(
         database: Database,
         insurance_update_data: InsuranceMessage
 ) -> None:
-
-    repository = InsuranceRepository(database)
     
     if not isinstance(insurance_update_data, InsuranceMessage):
         raise TypeError(f"insurance_update_data must be of type InsuranceMessage, "
                         f"not {type(insurance_update_data).__name__}.")
     
-    is_name_already_taken = repository.get_by_name(insurance_update_data.name, insurance_update_data.id)
-    if is_name_already_taken is not None:
-        logger.warning(f"Insurance with name {insurance_update_data.name} already exists.")
+    # An update of an insurance that has not been created yet creates it.
+    _upsert(database, insurance_update_data)
+    return None
+
+
+def _upsert(
+        database: Database,
+        insurance_data: InsuranceMessage
+) -> None:
+    
+    repository = InsuranceRepository(database)
+    
+    # The last writer wins rule is applied by the database in one atomic conditional upsert,
+    # so it holds for concurrent messages of the same insurance too.
+    try:
+        is_applied = repository.upsert(insurance_data)
+    except DuplicateKeyError as e:
+        if not repository.is_duplicate_key_error(e.details or {"code": e.code, "errmsg": str(e)}, "name"):
+            raise
+        logger.warning(f"Insurance with name {insurance_data.name} already exists.")
         logger.error("Will assume the insurance before has not had its name updated or has not been removed yet, so will have the try again later")
         raise AlreadyTakenFieldValueError(
-            field_name="name",
-            field_value=insurance_update_data.name,
-            entity_name="Insurance"
+            entity_name="Insurance",
+            field="name",
+            value=insurance_data.name
         )
     
-    already_existing_insurance = repository.get_by_id(insurance_update_data.id)
-    
-    if already_existing_insurance is None:
-        logger.warning(f"Insurance with id {insurance_update_data.id} does not exist.")
-        logger.info("Will assume that the insurance has not been created yet, so will be updating by creating the insurance.")
-        repository.create(insurance_update_data)
-        logger.info(f"Insurance with id {insurance_update_data.id} has been updated by being created.")
-        return None
-    
-    if  insurance_update_data.updated_at > already_existing_insurance.updated_at:
-        logger.info(f"Insurance with id {insurance_update_data.id} exists already to be updated.")
-        logger.info(f"As the already existing insurance has not been updated since {already_existing_insurance.updated_at.strftime("%d/%m/%Y, %H:%M:%S")}, "
-                    f"the new insurance will be updated as its data is in the future {insurance_update_data.updated_at.strftime("%d/%m/%Y, %H:%M:%S")}.")
-        repository.update(insurance_update_data)
-        logger.info(f"Insurance with id {insurance_update_data.id} has been updated.")
+    if is_applied:
+        logger.info(f"Insurance with id {insurance_data.id} has been synchronised.")
     else:
-        logger.warning(f"Insurance with id {insurance_update_data.id} has not been updated since {already_existing_insurance.updated_at.strftime("%d/%m/%Y, %H:%M:%S")}. "
-                       f"The update will not be applied as its data is in the past {insurance_update_data.updated_at.strftime("%d/%m/%Y, %H:%M:%S")}.")
-        return None
+        logger.warning(f"Insurance with id {insurance_data.id} has been updated after {insurance_data.updated_at.strftime("%d/%m/%Y, %H:%M:%S")}. "
+                       f"The message will not be applied as its data is in the past.")
+    return None
+
+
+def get_upsert_operation(
+        database: Database,
+        insurance_data: InsuranceMessage
+) -> UpdateOne:
     
+    repository = InsuranceRepository(database)
     
-    return None
+    if not isinstance(insurance_data, InsuranceMessage):
+        raise TypeError(f"insurance_data must be of type InsuranceMessage, "
+                        f"not {type(insurance_data).__name__}.")
+    
+    # Creations and updates are both applied as the conditional upsert of `_upsert`.
+    return repository.get_upsert_operation(insurance_data)
+
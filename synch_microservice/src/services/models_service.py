@@ -1,12 +1,20 @@
 # External Library imports
-from typing import List
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from pymongo import UpdateOne
 
 # Internal library imports
 from src.logger_tool import logger
-from src.entities import ModelMessage, ColorEntity
+from src.entities import ModelMessage, BrandEntity, ColorEntity
 from src.database_management import Database
 from src.repositories import ModelRepository, ColorRepository, BrandRepository
-from src.exceptions import AlreadyTakenFieldValueError, UnableToFindIdError
+from src.services.entity_cache import brand_cache, color_cache
+from src.exceptions import UnableToFindIdError
+
+
+class ModelDependencies(NamedTuple):
+    """The brands and colors that models refer to, by their ID."""
+    brands: Dict[str, BrandEntity]
+    colors: Dict[str, ColorEntity]
 
 
 def create(
@@ -15,8 +23,6 @@ def create(
 ) -> None:
 
     model_repository = ModelRepository(database)
-    color_repository = ColorRepository(database)
-    brand_repository = BrandRepository(database)
     
     if not isinstance(model_create_data, ModelMessage):
         raise TypeError(f"model_create_data must be of type ModelMessage, "
@@ -28,7 +34,82 @@ def create(
         logger.info("Will assume the model is already created, and this is a duplicate message and will drop it.")
         return None
     
-    brand_entity = brand_repository.get_by_id(model_create_data.brands_id)
+    brand_entity, color_entities = _get_brand_and_colors(
+        model_create_data,
+        get_dependencies(database, [model_create_data])
+    )
+        
+    model_repository.create(
+        model_create_data,
+        brand_entity,
+        color_entities
+    )
+    return None
+
+
+def get_dependencies(
+        database: Database,
+        model_messages: Sequence[ModelMessage]
+) -> ModelDependencies:
+    
+    color_repository = ColorRepository(database)
+    brand_repository = BrandRepository(database)
+    
+    for model_message in model_messages:
+        if not isinstance(model_message, ModelMessage):
+            raise TypeError(f"model_messages must only contain ModelMessage, "
+                            f"not {type(model_message).__name__}.")
+    
+    # The brands and colors of all the models are loaded with one query per collection,
+    # skipping the ones that are cached, so the cost does not grow with the number of colors.
+    brands, missing_brand_ids = brand_cache.get_many(model_message.brands_id for model_message in model_messages)
+    if missing_brand_ids:
+        loaded_brands = brand_repository.get_by_ids(missing_brand_ids)
+        brand_cache.put_many(loaded_brands)
+        brands.update(loaded_brands)
+    
+    colors, missing_color_ids = color_cache.get_many(
+        color_id for model_message in model_messages for color_id in model_message.color_ids
+    )
+    if missing_color_ids:
+        loaded_colors = color_repository.get_by_ids(missing_color_ids)
+        color_cache.put_many(loaded_colors)
+        colors.update(loaded_colors)
+    
+    return ModelDependencies(brands=brands, colors=colors)
+
+
+def get_create_operation(
+        database: Database,
+        model_create_data: ModelMessage,
+        dependencies: Optional[ModelDependencies] = None
+) -> UpdateOne:
+
+    model_repository = ModelRepository(database)
+    
+    if not isinstance(model_create_data, ModelMessage):
+        raise TypeError(f"model_create_data must be of type ModelMessage, "
+                        f"not {type(model_create_data).__name__}.")
+    
+    if dependencies is None:
+        dependencies = get_dependencies(database, [model_create_data])
+    
+    brand_entity, color_entities = _get_brand_and_colors(model_create_data, dependencies)
+    
+    # An already created model is left untouched, as a duplicate message is dropped.
+    return model_repository.get_create_operation(
+        model_create_data,
+        brand_entity,
+        color_entities
+    )
+
+
+def _get_brand_and_colors(
+        model_create_data: ModelMessage,
+        dependencies: ModelDependencies
+) -> Tuple[BrandEntity, List[ColorEntity]]:
+    
+    brand_entity = dependencies.brands.get(model_create_data.brands_id)
     if brand_entity is None:
         logger.warning(f"Brand with id {model_create_data.brands_id} not found.")
         logger.error("Unable to create model due to missing brand, will assume the brand has not been created yet and will therefore reque the model create message.")
@@ -36,18 +117,11 @@ def create(
     
     color_entities: List[ColorEntity] = []
     for color_id in model_create_data.color_ids:
-        color_entity = color_repository.get_by_id(color_id)
+        color_entity = dependencies.colors.get(color_id)
         if color_entity is None:
             logger.warning(f"Color with id {color_id} not found.")
             logger.error("Unable to create model due to missing color, will assume the color has not been created yet and will therefore reque the model create message.")
             raise UnableToFindIdError("Color", color_id)
         color_entities.append(color_entity)
-        
-    model_repository.create(
-        model_create_data,
-        brand_entity,
-        color_entities
-    )
-    return None
-
-
+    
+    return brand_entity, color_entities
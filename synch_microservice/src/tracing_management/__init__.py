@@ -0,0 +1,4 @@
+from .tracer import tracer, shutdown_tracing
+from .propagation import inject_trace_headers, extract_trace_context
+from .broker_tracing import start_consume_span, consume_span, set_consume_outcome, batch_span
+from .database_tracing import command_tracing
@@ -0,0 +1,54 @@
+# External Library imports
+from typing import Any, Dict, Tuple
+from opentelemetry import trace
+from opentelemetry.trace import Span, SpanKind, Status, StatusCode
+from pymongo.monitoring import CommandListener, CommandStartedEvent, CommandSucceededEvent, CommandFailedEvent
+
+# Internal library imports
+from src.tracing_management.tracer import tracer
+
+
+class CommandTracingListener(CommandListener):
+    """
+    Traces every command of the MongoClient it is given to in `event_listeners` as a span of its own,
+    if the command is sent within a traced request or message.
+
+    The driver calls `started` in the context of the caller, so the span is a child of the current span,
+    and ends it when the command has completed.
+    """
+
+    def __init__(self) -> None:
+        self._spans: Dict[Tuple[Any, int], Span] = {}
+
+    def started(self, event: CommandStartedEvent) -> None:
+        # Only commands of a traced request or message get a span, background commands would each start a trace of their own.
+        if not trace.get_current_span().is_recording():
+            return
+        attributes = {
+            "db.system.name": "mongodb",
+            "db.namespace": event.database_name,
+            "db.operation.name": event.command_name,
+        }
+        # The first value of a command such as find or insert is the name of its collection.
+        collection_name = event.command.get(event.command_name)
+        if isinstance(collection_name, str):
+            attributes["db.collection.name"] = collection_name
+        self._spans[(event.connection_id, event.request_id)] = tracer.start_span(
+            f"{event.command_name} {collection_name if isinstance(collection_name, str) else event.database_name}",
+            kind=SpanKind.CLIENT,
+            attributes=attributes
+        )
+
+    def succeeded(self, event: CommandSucceededEvent) -> None:
+        span = self._spans.pop((event.connection_id, event.request_id), None)
+        if span is not None:
+            span.end()
+
+    def failed(self, event: CommandFailedEvent) -> None:
+        span = self._spans.pop((event.connection_id, event.request_id), None)
+        if span is not None:
+            span.set_status(Status(StatusCode.ERROR, str(event.failure.get("codeName") or event.failure.get("errmsg", ""))))
+            span.end()
+
+
+command_tracing = CommandTracingListener()
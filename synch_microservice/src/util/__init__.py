@@ -1 +1,2 @@
-from .handle_messages import handle_message
\ No newline at end of file
+from .handle_messages import handle_message
+from .handle_message_batch import handle_message_batch
\ No newline at end of file
@@ -0,0 +1,110 @@
+# External Library imports
+from typing import List, Optional, Sequence, Tuple, Union
+from pymongo import UpdateOne
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError, PyMongoError, WriteError
+
+# Internal Library import
+import src.services.insurances_service as insurances_service
+import src.services.models_service as models_service
+from src.util.handle_messages import to_entity_message
+from src.repositories import InsuranceRepository, ModelRepository
+from src.repositories.base_repository import BaseRepository
+from src.exceptions import AlreadyTakenFieldValueError
+from src.entities import InsuranceMessage, ModelMessage
+from src.database_management import Database
+from src.logger_tool import logger
+
+
+def handle_message_batch(database: Database, messages: Sequence[Tuple[str, dict]]) -> List[Optional[Exception]]:
+    """
+    Applies a batch of messages with one unordered bulk write per collection.
+
+    Every message is turned into a conditional upsert, which is guarded against being applied
+    out of order, so the messages of a batch may be applied in any order. A message whose upsert
+    is rejected as stale by the duplicate key error on `_id` has nothing left to apply and counts as handled.
+
+    Returns the error of every message that could not be applied, in the order of the messages,
+    and None for every message that was handled.
+    """
+    if not isinstance(database, Database):
+        logger.error(f"Invalid database type: {type(database).__name__}. Expected Database.")
+        raise TypeError(f"database must be of type Database, not {type(database).__name__}.")
+
+    errors: List[Optional[Exception]] = [None] * len(messages)
+    insurance_operations: List[Tuple[int, UpdateOne, InsuranceMessage]] = []
+    model_operations: List[Tuple[int, UpdateOne, ModelMessage]] = []
+    model_messages: List[Tuple[int, ModelMessage]] = []
+
+    for index, (routing_key, message) in enumerate(messages):
+        try:
+            entity_message = to_entity_message(message, routing_key)
+            if isinstance(entity_message, InsuranceMessage):
+                if "create" not in routing_key and "update" not in routing_key:
+                    raise ValueError(f"Invalid routing key: {routing_key}, expected one of either ['create', 'update'] in routing key.")
+                insurance_operations.append((index, insurances_service.get_upsert_operation(database, entity_message), entity_message))
+            else:
+                if "create" not in routing_key:
+                    raise ValueError(f"Invalid routing key: {routing_key}, expected one of either ['create', 'update'] in routing key.")
+                model_messages.append((index, entity_message))
+        except Exception as e:
+            errors[index] = e
+
+    if model_messages:
+        # The brands and colors of every model of the batch are resolved together.
+        try:
+            dependencies = models_service.get_dependencies(database, [model_message for _, model_message in model_messages])
+        except PyMongoError as e:
+            logger.error(f"Failed to load the brands and colors of {len(model_messages)} models: {e}")
+            for index, _ in model_messages:
+                errors[index] = e
+            model_messages = []
+        for index, model_message in model_messages:
+            try:
+                model_operations.append((index, models_service.get_create_operation(database, model_message, dependencies), model_message))
+            except Exception as e:
+                errors[index] = e
+
+    if insurance_operations:
+        insurance_repository = InsuranceRepository(database)
+        _bulk_write(insurance_repository, insurance_repository.get_insurances_collection(), insurance_operations, errors)
+    if model_operations:
+        model_repository = ModelRepository(database)
+        _bulk_write(model_repository, model_repository.get_models_collection(), model_operations, errors)
+
+    return errors
+
+
+def _bulk_write(
+        repository: BaseRepository,
+        collection: Collection,
+        operations: List[Tuple[int, UpdateOne, Union[InsuranceMessage, ModelMessage]]],
+        errors: List[Optional[Exception]]
+) -> None:
+    collection_name = collection.name
+    try:
+        result = repository.bulk_write(collection, [operation for _, operation, _ in operations])
+        logger.info(f"Applied {len(operations)} messages to the {collection_name} collection: "
+                    f"{result.upserted_count} inserted, {result.modified_count} updated.")
+    except BulkWriteError as e:
+        stale_messages = 0
+        for write_error in e.details.get("writeErrors", []):
+            index, _, entity_message = operations[write_error["index"]]
+            if repository.is_duplicate_key_error(write_error, "_id"):
+                # A newer version is already stored, or the entity was already created.
+                stale_messages += 1
+            elif isinstance(entity_message, InsuranceMessage) and repository.is_duplicate_key_error(write_error, "name"):
+                logger.error("Will assume the insurance before has not had its name updated or has not been removed yet, so will have the try again later")
+                errors[index] = AlreadyTakenFieldValueError(
+                    entity_name="Insurance",
+                    field="name",
+                    value=entity_message.name
+                )
+            else:
+                errors[index] = WriteError(write_error.get("errmsg"), write_error.get("code"), write_error)
+        logger.info(f"Applied {len(operations)} messages to the {collection_name} collection, "
+                    f"{stale_messages} of them were stale and dropped.")
+    except PyMongoError as e:
+        logger.error(f"Failed to apply {len(operations)} messages to the {collection_name} collection: {e}")
+        for index, _, _ in operations:
+            errors[index] = e
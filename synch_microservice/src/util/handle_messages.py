@@ -1,4 +1,5 @@
 # External Library imports
+from typing import Union
 
 # Internal Library import
 from src.util.handle_insurance_message import handle_insurance_message
@@ -21,6 +22,19 @@ def handle_message(database: Database, message: dict, routing_key: str) -> None:
         logger.error(f"Invalid routing key type: {type(routing_key).__name__}. Expected str.")
         raise TypeError(f"routing_key must be of type str, not {type(routing_key).__name__}.")
     
+    entity_message = to_entity_message(message, routing_key)
+    
+    if isinstance(entity_message, InsuranceMessage):
+        logger.info(f"Handling insurance message with routing key: {routing_key}")
+        handle_insurance_message(database, entity_message, routing_key)
+    else:
+        logger.info(f"Handling model message with routing key: {routing_key}")
+        handle_model_message(database, entity_message, routing_key)
+
+
+def to_entity_message(message: dict, routing_key: str) -> Union[InsuranceMessage, ModelMessage]:
+    """Validates the body of a message as the entity message its routing key names."""
+    message = dict(message)
     _id = message.pop("id", None)
     
     if not isinstance(_id, str):
@@ -28,12 +42,8 @@ def handle_message(database: Database, message: dict, routing_key: str) -> None:
         raise TypeError(f"id must be of type str, not {type(_id).__name__}.")
     
     if "insurance" in routing_key:
-        logger.info(f"Handling insurance message with routing key: {routing_key}")
-        insurance_message = InsuranceMessage(_id=_id, **message)
-        handle_insurance_message(database, insurance_message, routing_key)
+        return InsuranceMessage(_id=_id, **message)
     elif "model" in routing_key:
-        logger.info(f"Handling model message with routing key: {routing_key}")
-        model_message = ModelMessage(_id=_id, **message)
-        handle_model_message(database, model_message, routing_key)
+        return ModelMessage(_id=_id, **message)
     else:
         raise ValueError(f"Invalid routing key: {routing_key}, expected 'insurance' in routing key.")
\ No newline at end of file